@@ -77,6 +77,7 @@ from . import hash
 from . import hypothesis
 from . import nrpy
 from . import objectdistance
+from . import resampling
 
 # Type-casting functions
 from .typecast import tc_Dataframe_Series
@@ -3,10 +3,62 @@ A generic series and data frame to hold data and analysis
 Date created: 24th September 2012
 Licence: Python Software Foundation License version 2
 '''
+import bisect
+import csv
+import json
+import mmap
+import multiprocessing
+import os
+import pickle
 import string
 import random
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import MutableMapping, Sequence
+from itertools import compress, islice, repeat
+from operator import and_, or_, eq, ne, gt, lt, ge, le
 
 from .copadsexceptions import FunctionParameterValueError
+from .samplestatistics import QuantileSketch
+from .samplestatistics import StreamingSummary
+from .samplestatistics import select
+
+BINARY_MAGIC = b'COPADSDF'
+
+_INT_MIN = -(2 ** 63)
+_INT_MAX = (2 ** 63) - 1
+
+_casters = {'int': int, 'integer': int,
+            'float': float, 'real': float,
+            'str': str, 'string': str}
+
+_json_types = (str, int, float, bool, type(None))
+
+_comparators = {'=': eq, '!=': ne, '>': gt, '<': lt, '>=': ge, '<=': le}
+
+def _addPosition(index, key, position):
+    '''
+    Private function to add a position into a {<key>: [<positions>]}
+    index, keeping the positions of each key in ascending order.
+    '''
+    positions = index.setdefault(key, [])
+    if len(positions) == 0 or positions[-1] < position:
+        positions.append(position)
+    else:
+        bisect.insort(positions, position)
+
+def _removePosition(index, key, position):
+    '''
+    Private function to remove a position from a {<key>: [<positions>]}
+    index.
+    '''
+    positions = index[key]
+    positions.remove(position)
+    if len(positions) == 0:
+        del index[key]
+
 
 class Series(object):
     '''
@@ -21,6 +73,18 @@ class Series(object):
 
                     Tom     Ellis   Richard     Melvin
         Height      165     191     172         175
+
+    Labels are indexed by a dictionary of {<label>: [<positions>]}, which
+    is maintained as data is added or changed. An inverted index of
+    {<data value>: [<positions>]} is built when data labels are first
+    looked up by data value (see Series.getLabels), and maintained after
+    that. Series.indexValues has to be called after changing the values of
+    Series.data directly.
+
+    The list of data values may be shared with another object (such as a
+    column of a data frame, see Dataframe.toSeries), in which case
+    Series.shared is True and the list is copied before its first change
+    by the data series.
     '''
     def __init__(self, name=''):
         '''
@@ -32,8 +96,59 @@ class Series(object):
         self.name = str(name)
         self.data = []
         self.label = []
+        self.label_index = {}
+        self.indexed = 0
+        self.value_index = None
+        self.shared = False
         self.analyses = {}
 
+    def _own(self):
+        '''
+        Private method to copy the list of data values if it is shared,
+        before changing it.
+        '''
+        if self.shared:
+            self.data = list(self.data)
+            self.shared = False
+
+    def _position(self, label):
+        '''
+        Private method to get the position of the (first) occurrence of a
+        label. The label index will be rebuilt if labels had been added or
+        removed without using the methods of data series.
+
+        @param label: the label name to find.
+        @return: position of the label.
+        @raise KeyError: if the label is not found.
+        '''
+        if self.indexed != len(self.label):
+            self.indexLabels()
+        return self.label_index[label][0]
+
+    def indexLabels(self):
+        '''
+        Method to (re)build the index of label positions.
+        '''
+        self.label_index = {}
+        for position in range(len(self.label)):
+            _addPosition(self.label_index, self.label[position], position)
+        self.indexed = len(self.label)
+
+    def indexValues(self):
+        '''
+        Method to (re)build the inverted index of data values, which maps
+        each data value to the positions where it is found. The inverted
+        index cannot be built if any data value is not hashable (such as a
+        list), and will be set to None.
+        '''
+        self.value_index = {}
+        try:
+            for position in range(len(self.data)):
+                _addPosition(self.value_index, self.data[position],
+                             position)
+        except TypeError:
+            self.value_index = None
+
     def cast(self, type, error_replace):
         '''
         Method to cast data in the series into a specific data type.
@@ -49,20 +164,14 @@ class Series(object):
         the data element (such as attempt to cast a character into an
         integer, which will result ina ValueError), the data element will
         be replace with error_replace
+        @return: list of labels where the data element failed to be casted
+        @raise FunctionParameterValueError: if the data type is not allowed
         '''
-        data = [0] * len(self.data)
-        type = str(type)
-        for i in range(len(self.data)):
-            try:
-                if type == 'int' or type == 'integer':
-                    data[i] = int(self.data[i])
-                if type == 'real' or type == 'float':
-                    data[i] = float(self.data[i])
-                if type == 'str' or type == 'string':
-                    data[i] = str(self.data[i])
-            except:
-                data[i] = error_replace
-        self.data = data
+        function = _caster(type)
+        (self.data, failed) = _castValues(self.data, function, error_replace)
+        self.shared = False
+        self.value_index = None
+        return [self.label[position] for position in failed]
 
     def toDataframe(self):
         '''
@@ -101,9 +210,16 @@ class Series(object):
             label = range(len(data))
         if len(data) != len(label):
             raise FunctionParameterValueError()
+        self._own()
         for i in range(len(data)):
+            position = len(self.data)
             self.data.append(data[i])
             self.label.append(label[i])
+            _addPosition(self.label_index, label[i], position)
+            self.indexed = self.indexed + 1
+            if self.value_index is not None:
+                try: _addPosition(self.value_index, data[i], position)
+                except TypeError: self.value_index = None
 
     def changeDatum(self, new_value, label):
         '''
@@ -114,9 +230,15 @@ class Series(object):
         @param label: the label name for the data value to be changed.
         '''
         try:
-            index = self.label.index(label)
-            self.data[index] = new_value
-        except ValueError: pass
+            index = self._position(label)
+        except KeyError: return None
+        if self.value_index is not None:
+            try:
+                _removePosition(self.value_index, self.data[index], index)
+                _addPosition(self.value_index, new_value, index)
+            except TypeError: self.value_index = None
+        self._own()
+        self.data[index] = new_value
 
     def changeLabel(self, new_label, original_label):
         '''
@@ -129,9 +251,11 @@ class Series(object):
         changed.
         '''
         try:
-            index = self.label.index(original_label)
-            self.label[index] = new_label
-        except ValueError: pass
+            index = self._position(original_label)
+        except KeyError: return None
+        _removePosition(self.label_index, original_label, index)
+        _addPosition(self.label_index, new_label, index)
+        self.label[index] = new_label
 
     def getDatum(self, label):
         '''
@@ -143,9 +267,8 @@ class Series(object):
         label is not found).
         '''
         try:
-            index = self.label.index(label)
-            return self.data[index]
-        except ValueError: return None
+            return self.data[self._position(label)]
+        except KeyError: return None
 
     def getLabels(self, datum):
         '''
@@ -156,13 +279,679 @@ class Series(object):
         label names if the data value is found.
         @rtype: list
         '''
-        labels = [self.label[index]
-                  for index in range(len(self.data))
-                     if self.data[index] == datum]
+        if self.value_index is None:
+            self.indexValues()
+        try:
+            labels = [self.label[index]
+                      for index in self.value_index.get(datum, [])]
+        except (AttributeError, TypeError):
+            labels = [self.label[index]
+                      for index in range(len(self.data))
+                         if self.data[index] == datum]
         if len(labels) == 0: return [None]
         if len(labels) > 0: return labels
 
 
+class LabelList(list):
+    '''
+    List of labels of a data frame in the order of its columns (see
+    Dataframe.label). Sorting or reversing the list reorders the rows of
+    the data frame. Other changes to the list raise TypeError, as labels
+    are added, renamed and removed by the methods of the data frame (such
+    as Dataframe.addData, Dataframe.changeLabel and
+    Dataframe.removeLabel), which also update its columns and label index.
+    '''
+    def __init__(self, labels=(), frame=None):
+        list.__init__(self, labels)
+        self.frame = frame
+
+    def __reduce_ex__(self, protocol):
+        return (LabelList, (list(self),), self.__dict__)
+
+    def _unchangeable(self, *args, **kwargs):
+        raise TypeError('Labels of a data frame are changed by the '
+                        'methods of the data frame')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _unchangeable
+    append = extend = insert = pop = remove = clear = _unchangeable
+
+    def sort(self, key=None, reverse=False):
+        if key is None: rows = sorted(range(len(self)),
+                                      key=self.__getitem__,
+                                      reverse=reverse)
+        else: rows = sorted(range(len(self)),
+                            key=lambda row: key(self[row]),
+                            reverse=reverse)
+        self.frame._reorder(rows)
+
+    def reverse(self):
+        self.frame._reorder(list(range(len(self) - 1, -1, -1)))
+
+
+class Row(Sequence):
+    '''
+    A row of a data frame (the values of each series for a label), as
+    returned by Dataframe.data[label]. Values are read from, and changed
+    in, the columns of the data frame; hence, view[label][index] = value
+    changes the data frame.
+    '''
+    def __init__(self, frame, label):
+        '''
+        Constructor.
+
+        @param frame: data frame of the row.
+        @type frame: dataframe.Dataframe object
+        @param label: label of the row.
+        '''
+        self.frame = frame
+        self.label = label
+
+    def __getitem__(self, index):
+        row = self.frame.label_index[self.label]
+        if isinstance(index, slice):
+            return [column[row] for column in self.frame.columns[index]]
+        return self.frame.columns[index][row]
+
+    def __setitem__(self, index, value):
+        frame = self.frame
+        row = frame.label_index[self.label]
+        if isinstance(index, slice):
+            indices = range(len(frame.columns))[index]
+            value = list(value)
+            if len(value) != len(indices):
+                raise ValueError('number of values must be the same as \
+the number of series')
+            for i in range(len(indices)):
+                frame._store(indices[i], row, value[i])
+        else:
+            frame._store(range(len(frame.columns))[index], row, value)
+
+    def __len__(self):
+        return len(self.frame.columns)
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, tuple, Row)): return NotImplemented
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented: return result
+        return not result
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class RowView(MutableMapping):
+    '''
+    A row-major view of the columnar data in a data frame, which behaves
+    as the dictionary of {<label>: [<value of each series>]} used by
+    earlier versions of data frame. Each row (see dataframe.Row) reads and
+    changes the values in the columns; hence, a value can be changed
+    (using view[label][index] = value), a row can be replaced as a whole
+    (using view[label] = row) or removed (using del view[label]).
+    '''
+    def __init__(self, frame):
+        '''
+        Constructor.
+
+        @param frame: data frame to view.
+        @type frame: dataframe.Dataframe object
+        '''
+        self.frame = frame
+
+    def __getitem__(self, label):
+        if label not in self.frame.label_index: raise KeyError(label)
+        return Row(self.frame, label)
+
+    def __setitem__(self, label, values):
+        frame = self.frame
+        if label not in frame.label_index:
+            frame._addRow(label)
+        row = frame.label_index[label]
+        for index in range(len(frame.columns)):
+            if index < len(values): frame._store(index, row, values[index])
+            else: frame._store(index, row, None)
+
+    def __delitem__(self, label):
+        self.frame._removeRow(label)
+
+    def __iter__(self):
+        return iter(list(self.frame.row_labels))
+
+    def __len__(self):
+        return len(self.frame.row_labels)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+def _column(values):
+    '''
+    Private function to generate the storage for a column (the values of
+    a data series). A column of only floats is stored as an array of
+    doubles and a column of only (64-bit) integers is stored as an array
+    of signed long longs; otherwise, the column is stored as a list.
+
+    @param values: list of values in the column.
+    @return: array.array or list
+    '''
+    values = list(values)
+    if len(values) == 0:
+        return values
+    value_types = set(map(type, values))
+    if value_types == set([float]):
+        return array('d', values)
+    if value_types == set([int]) and \
+        min(values) >= _INT_MIN and max(values) <= _INT_MAX:
+        return array('q', values)
+    return values
+
+def _fits(column, value):
+    '''
+    Private function to check whether a value can be stored in a column
+    without changing its type.
+    '''
+    if type(column) is list:
+        return True
+    if column.typecode == 'd':
+        return type(value) is float
+    return type(value) is int and _INT_MIN <= value <= _INT_MAX
+
+def _caster(type):
+    '''
+    Private function to get the function to type cast into a data type.
+
+    @param type: data type ('int' or 'integer', 'float' or 'real', 'str'
+    or 'string').
+    @raise FunctionParameterValueError: if the data type is not allowed
+    '''
+    try:
+        return _casters[str(type)]
+    except KeyError:
+        raise FunctionParameterValueError('Unknown data type: ' + str(type))
+
+def _castValues(values, function, error_replace):
+    '''
+    Private function to type cast a list (or array) of values. All values
+    are first casted at once (without checking each value); if any value
+    fails, the values are casted one at a time and the values which cannot
+    be casted are replaced with error_replace.
+
+    @param values: list of values to type cast.
+    @param function: function to type cast each value (such as int). If
+    None, the values are not type casted.
+    @return: tuple of (list of type casted values, list of positions of
+    values which failed to be casted).
+    '''
+    if function is None:
+        return (list(values), [])
+    try:
+        return (list(map(function, values)), [])
+    except (TypeError, ValueError, OverflowError):
+        pass
+    result = [error_replace] * len(values)
+    failed = []
+    for i in range(len(values)):
+        try: result[i] = function(values[i])
+        except (TypeError, ValueError, OverflowError): failed.append(i)
+    return (result, failed)
+
+def _inferType(values):
+    '''
+    Private function to infer the data type of a list of strings, as
+    integer, float, or string (empty strings are not considered).
+
+    @return: function to type cast the strings (int, float, or str).
+    '''
+    values = [value for value in values if value != '']
+    for function in (int, float):
+        try:
+            for value in values: function(value)
+            return function
+        except ValueError: pass
+    return str
+
+def _widenTypes(rows, functions):
+    '''
+    Private function to infer the data types of a chunk of rows, read from
+    a CSV file, and to widen the data types of the series (from integer to
+    float to string) where needed.
+
+    @param rows: list of rows, where each row is a list of label name
+    followed by the data values (as strings) of each series.
+    @param functions: list of inferred data types of each series (int,
+    float or str), which is updated.
+    '''
+    order = [int, float, str]
+    for i in range(len(functions)):
+        function = _inferType([row[i + 1].strip() for row in rows
+                               if len(row) > i + 1])
+        if order.index(function) > order.index(functions[i]):
+            functions[i] = function
+
+def _castText(values, function, fill_in):
+    '''
+    Private function to type cast the strings of a column, as read from a
+    CSV file, into their inferred data type (see _inferType). Empty strings
+    are replaced with fill_in; other values (such as fill_in of missing
+    items), and strings which cannot be type casted, are not changed.
+
+    @return: new column.
+    '''
+    column = []
+    for value in values:
+        if value == '':
+            value = fill_in
+        elif isinstance(value, str):
+            try: value = function(value)
+            except ValueError: pass
+        column.append(value)
+    return _column(column)
+
+class _GroupSummary(object):
+    '''
+    Private accumulator of the data values of a series within a group (see
+    Dataframe.groupBy). The number of data values, the minimum and the
+    maximum are kept for data values of any type (the minimum and maximum
+    are data values of the series); the other aggregations are accumulated
+    by a samplestatistics.StreamingSummary object, which needs numerical
+    data values, only if they are asked for.
+    '''
+    def __init__(self, numeric, sketched):
+        '''
+        Constructor method.
+
+        @param numeric: boolean flag to accumulate the data values by a
+        samplestatistics.StreamingSummary object.
+        @param sketched: boolean flag to keep the data values in a quantile
+        sketch for median and quantiles.
+        '''
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+        self.summary = None
+        if numeric:
+            self.summary = StreamingSummary(sketch=QuantileSketch(seed=0)
+                                            if sketched else None)
+
+    def add(self, value):
+        '''
+        Adds one data value into the accumulator.
+        '''
+        self.count = self.count + 1
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        if self.summary is not None:
+            self.summary.add(value)
+
+    def merge(self, other):
+        '''
+        Combines another accumulator (of the same series) into this
+        accumulator.
+        '''
+        if other.count == 0:
+            return self
+        self.count = self.count + other.count
+        if self.minimum is None or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if self.maximum is None or other.maximum > self.maximum:
+            self.maximum = other.maximum
+        if self.summary is not None:
+            self.summary.merge(other.summary)
+        return self
+
+    def quantile(self, q):
+        '''
+        Returns the q-th quantile (0 <= q <= 1) of the data values, by
+        linear interpolation between the closest ranks (as
+        samplestatistics.SingleSample.quantile) while the quantile sketch
+        still keeps every data value; otherwise, as estimated by the
+        quantile sketch.
+        '''
+        sketch = self.summary.sketch
+        if len(sketch.compactors) > 1:
+            return sketch.quantile(q)
+        values = sketch.compactors[0]
+        position = q * (len(values) - 1)
+        lower = int(position)
+        value = select(values, lower)
+        if position > lower:
+            upper = select(values, lower + 1)
+            value = value + (position - lower) * (upper - value)
+        return value
+
+def _groupRows(keys, columns, numeric, sketched):
+    '''
+    Private function to accumulate the data values of one or more series
+    by group, in a single pass over the rows. Data values of None are
+    ignored.
+
+    @param keys: list of group keys, one for each row.
+    @param columns: list of columns (data values of each series to
+    aggregate), each of the same length as keys.
+    @param numeric: list of boolean flags, one for each column, to
+    accumulate the data values for numerical aggregations (see
+    _GroupSummary).
+    @param sketched: list of boolean flags, one for each column, to keep
+    the data values for median and quantiles.
+    @return: dictionary of {<group key>: [<_GroupSummary object for each
+    column>]}, in the order where the group keys are first found.
+    '''
+    groups = {}
+    for row in range(len(keys)):
+        key = keys[row]
+        if key not in groups:
+            groups[key] = [_GroupSummary(numeric[index], sketched[index])
+                           for index in range(len(columns))]
+        summaries = groups[key]
+        for index in range(len(columns)):
+            value = columns[index][row]
+            if value is not None:
+                summaries[index].add(value)
+    return groups
+
+def _aggregate(summary, aggregation):
+    '''
+    Private function to calculate an aggregation from the accumulated
+    data values of a group.
+
+    @param summary: accumulated data values.
+    @type summary: _GroupSummary object
+    @param aggregation: name of aggregation (see Dataframe.groupBy).
+    @return: aggregated value
+    '''
+    if aggregation == 'count': return summary.count
+    if summary.count == 0: return None
+    if aggregation == 'min': return summary.minimum
+    if aggregation == 'max': return summary.maximum
+    if aggregation == 'sum': return summary.summary.total
+    if aggregation == 'mean': return summary.summary.arithmeticMean()
+    if aggregation == 'var': return summary.summary.variance()
+    if aggregation == 'stdev': return summary.summary.variance() ** 0.5
+    if aggregation == 'median': return summary.quantile(0.5)
+    return summary.quantile(float(aggregation[1:]) / 100.0)
+
+def _isAggregation(aggregation):
+    '''
+    Private function to check the name of an aggregation.
+    '''
+    if aggregation in ('count', 'sum', 'mean', 'var', 'stdev',
+                       'min', 'max', 'median'):
+        return True
+    try:
+        return aggregation.startswith('q') and \
+            0 <= float(aggregation[1:]) <= 100
+    except ValueError:
+        return False
+
+def _take(column, rows):
+    '''
+    Private function to extract the values at given positions of a
+    column into a new column of the same storage type.
+    '''
+    if isinstance(column, list):
+        return [column[row] for row in rows]
+    return array(column.typecode, [column[row] for row in rows])
+
+def _isSorted(keys):
+    '''
+    Private function to check whether a list of keys is sorted in
+    ascending order, ignoring keys of None.
+    '''
+    keys = [key for key in keys if key is not None]
+    try:
+        return all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1))
+    except TypeError:
+        return False
+
+def _hashJoin(left_keys, right_keys, keep_left, keep_right):
+    '''
+    Private function to join 2 lists of keys by hash join.
+
+    @param left_keys: list of keys of the left data frame.
+    @param right_keys: list of keys of the right data frame.
+    @param keep_left: boolean flag to keep the left keys without matches.
+    @param keep_right: boolean flag to keep the right keys without
+    matches.
+    @return: tuple of (positions in left keys, positions in right keys)
+    of the matches, where the position is None for a key without match.
+    '''
+    table = {}
+    for position in range(len(right_keys)):
+        if right_keys[position] is not None:
+            table.setdefault(right_keys[position], []).append(position)
+    left_rows = []
+    right_rows = []
+    matched = set()
+    for position in range(len(left_keys)):
+        key = left_keys[position]
+        if key is not None and key in table:
+            for match in table[key]:
+                left_rows.append(position)
+                right_rows.append(match)
+            if keep_right: matched.add(key)
+        elif keep_left:
+            left_rows.append(position)
+            right_rows.append(None)
+    if keep_right:
+        for position in range(len(right_keys)):
+            if right_keys[position] not in matched:
+                left_rows.append(None)
+                right_rows.append(position)
+    return (left_rows, right_rows)
+
+def _mergeJoin(left_keys, right_keys, keep_left, keep_right):
+    '''
+    Private function to join 2 sorted lists of keys by sort-merge join.
+    The parameters and result are the same as _hashJoin, except that the
+    matches are in the order of the keys, followed by the keys of None
+    (which do not match, as in _hashJoin).
+    '''
+    lefts = [i for i in range(len(left_keys)) if left_keys[i] is not None]
+    rights = [j for j in range(len(right_keys))
+              if right_keys[j] is not None]
+    left_rows = []
+    right_rows = []
+    (i, j) = (0, 0)
+    while i < len(lefts) or j < len(rights):
+        if j == len(rights) or \
+            (i < len(lefts) and left_keys[lefts[i]] < right_keys[rights[j]]):
+            if keep_left:
+                left_rows.append(lefts[i])
+                right_rows.append(None)
+            i = i + 1
+        elif i == len(lefts) or \
+            right_keys[rights[j]] < left_keys[lefts[i]]:
+            if keep_right:
+                left_rows.append(None)
+                right_rows.append(rights[j])
+            j = j + 1
+        else:
+            key = left_keys[lefts[i]]
+            end = j
+            while end < len(rights) and right_keys[rights[end]] == key:
+                end = end + 1
+            while i < len(lefts) and left_keys[lefts[i]] == key:
+                for match in range(j, end):
+                    left_rows.append(lefts[i])
+                    right_rows.append(rights[match])
+                i = i + 1
+            j = end
+    if keep_left:
+        for i in range(len(left_keys)):
+            if left_keys[i] is None:
+                left_rows.append(i)
+                right_rows.append(None)
+    if keep_right:
+        for j in range(len(right_keys)):
+            if right_keys[j] is None:
+                left_rows.append(None)
+                right_rows.append(j)
+    return (left_rows, right_rows)
+
+def _takeJoined(column, rows):
+    '''
+    Private function to extract the values at given positions of a
+    column, where the value is None for a position of None.
+    '''
+    if None not in rows:
+        return _take(column, rows)
+    return [column[row] if row is not None else None for row in rows]
+
+class Predicate(object):
+    '''
+    A predicate (search criterion) on the data values of a data frame,
+    which is evaluated over whole columns into a mask (list of booleans,
+    one for each label in the storage order of the data frame). Predicates
+    can be combined using & (and) and | (or). For example,
+
+    >>> p = Predicate('seriesA', '>', 30) & Predicate('seriesB', '=', 'x')
+    >>> selection = df.select(p)
+
+    selects the labels where the value of seriesA is more than 30 and the
+    value of seriesB is 'x'. The operator is resolved when the predicate
+    is constructed; hence, evaluation does not compare operator strings.
+    '''
+    def __init__(self, series_name, operator, value):
+        '''
+        Constructor.
+
+        @param series_name: name of series to compare. If None, the
+        predicate is true for a label when any series meets the criterion.
+        @type series_name: string
+        @param operator: comparative operator. Allowed values are: '>' (more
+        than), '<' (less than), '>=' (more than or equals to), '<=' (less
+        than or equals to), '=' (equals to), '!=' (not equals to), and '*'
+        (all labels).
+        @param value: value of the data to compare.
+        '''
+        if operator != '*' and operator not in _comparators:
+            raise FunctionParameterValueError('Unknown operator: ' +
+                                              str(operator))
+        self.series_name = series_name
+        self.operator = operator
+        self.compare = _comparators.get(operator)
+        self.value = value
+
+    def __and__(self, other):
+        return CompoundPredicate(and_, self, other)
+
+    def __or__(self, other):
+        return CompoundPredicate(or_, self, other)
+
+    def mask(self, frame):
+        '''
+        Method to evaluate the predicate on a data frame. A series which
+        is not found in the data frame does not meet the criterion.
+
+        @param frame: data frame to evaluate.
+        @type frame: dataframe.Dataframe object
+        @return: list of booleans, one for each label in the storage order
+        of the data frame (Dataframe.row_labels).
+        '''
+        count = len(frame.row_labels)
+        if self.operator == '*':
+            return [True] * count
+        if self.series_name is None:
+            columns = frame.columns
+        elif self.series_name in frame.series_names:
+            columns = [frame.columns[
+                frame.series_names.index(self.series_name)]]
+        else:
+            columns = []
+        result = [False] * count
+        for column in columns:
+            mask = list(map(self.compare, column, repeat(self.value, count)))
+            result = list(map(or_, result, mask))
+        return result
+
+
+class CompoundPredicate(Predicate):
+    '''
+    A combination of 2 predicates by a logical operator (and_ or or_ from
+    the operator module).
+    '''
+    def __init__(self, combine, left, right):
+        '''
+        Constructor.
+
+        @param combine: function to combine the masks of the predicates.
+        @param left: first predicate.
+        @type left: dataframe.Predicate object
+        @param right: second predicate.
+        @type right: dataframe.Predicate object
+        '''
+        self.combine = combine
+        self.left = left
+        self.right = right
+
+    def mask(self, frame):
+        return list(map(self.combine,
+                        self.left.mask(frame), self.right.mask(frame)))
+
+
+class Selection(object):
+    '''
+    A lazy selection of labels from a data frame, which refers to the
+    positions of the selected labels in the data frame instead of copying
+    the data. The data frame should not be changed while the selection is
+    in use.
+    '''
+    def __init__(self, frame, rows):
+        '''
+        Constructor.
+
+        @param frame: data frame to select from.
+        @type frame: dataframe.Dataframe object
+        @param rows: positions of selected labels in the data frame.
+        @type rows: list
+        '''
+        self.frame = frame
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.labels())
+
+    def labels(self):
+        '''
+        Method to get the selected labels.
+
+        @return: list of label names
+        '''
+        return [self.frame.row_labels[row] for row in self.rows]
+
+    def column(self, series_name):
+        '''
+        Method to get the values of a series for the selected labels.
+
+        @param series_name: name of series
+        @type series_name: string
+        @return: list of data values (empty list if the series is not
+        found)
+        '''
+        try:
+            index = self.frame.series_names.index(series_name)
+        except ValueError: return []
+        column = self.frame.columns[index]
+        return [column[row] for row in self.rows]
+
+    def toDataframe(self, new_dataframe_name=''):
+        '''
+        Method to copy the selected labels into a new data frame.
+
+        @param new_dataframe_name: name for new data frame
+        @type new_dataframe_name: string
+        @return: dataframe.Dataframe object
+        '''
+        return self.frame._subframe(self.rows, new_dataframe_name)
+
+
 class Dataframe(object):
     '''
     A data frame is an encapsulation of one or more data series and its
@@ -181,6 +970,25 @@ class Dataframe(object):
 
     can be formed using 2 data series - Height, and Weight; where each
     data series has 'Tom', 'Ellis', 'Richard', and 'Melvin' as labels.
+
+    Data is stored by columns - the values of each series are kept in a
+    column (an array of doubles or long longs if all values are floats or
+    integers respectively, or a list otherwise) in the order of
+    series_names, where the position of each label in the columns is
+    given by the label index. Dataframe.label (the same list as
+    Dataframe.row_labels) is the list of labels in the order of the
+    columns; sorting or reversing it, or assigning a reordered list of
+    labels to it, reorders the rows. The row-major dictionary of {<label>:
+    [<value of each series>]} is available as Dataframe.data (see
+    dataframe.RowView). Columns which are shared with other objects (see
+    Dataframe.toSeries) are listed in Dataframe.shared, and are copied
+    before their first change by the data frame.
+
+    An inverted index of {<data value>: set([(<label>, <series name>)])}
+    is built when labels or series are first looked up by data value (see
+    Dataframe.getLabels, Dataframe.getSeries and Dataframe.getSeriesLabels),
+    and maintained as data, labels and series are added, changed or
+    removed.
     '''
     def __init__(self, name=''):
         '''
@@ -191,10 +999,185 @@ class Dataframe(object):
         '''
         self.name = str(name)
         self.series_names = []
-        self.data = {}
-        self.label = []
+        self.columns = []
+        self.row_labels = []
+        self.label_index = {}
+        self.value_index = None
+        self.shared = []
         self.analyses = {}
 
+    def _getRowLabels(self):
+        return self._row_labels
+
+    def _setRowLabels(self, labels):
+        self._row_labels = LabelList(labels, self)
+
+    row_labels = property(_getRowLabels, _setRowLabels)
+
+    def _getLabel(self):
+        return self._row_labels
+
+    def _setLabel(self, labels):
+        labels = list(labels)
+        if len(labels) != len(self._row_labels) or \
+            len(set(labels)) != len(labels) or \
+            any([label not in self.label_index for label in labels]):
+            raise FunctionParameterValueError('labels must be a \
+reordering of the labels of the data frame')
+        self._reorder([self.label_index[label] for label in labels])
+
+    label = property(_getLabel, _setLabel)
+
+    def _reorder(self, rows):
+        '''
+        Private method to reorder the labels (rows) of the data frame.
+
+        @param rows: positions of the labels (rows) in the new order.
+        '''
+        if rows == list(range(len(rows))): return None
+        self.columns = [_take(column, rows) for column in self.columns]
+        self.shared = []
+        labels = self._row_labels
+        list.__setitem__(labels, slice(None), [labels[row] for row in rows])
+        self.label_index = dict([(labels[i], i)
+                                 for i in range(len(labels))])
+
+    def _getData(self):
+        return RowView(self)
+
+    def _setData(self, rows):
+        self.row_labels = list(rows.keys())
+        self.label_index = dict([(self.row_labels[i], i)
+                                 for i in range(len(self.row_labels))])
+        width = max([len(rows[label]) for label in self.row_labels] +
+                    [0])
+        self.columns = [_column([rows[label][index]
+                                 if index < len(rows[label]) else None
+                                 for label in self.row_labels])
+                        for index in range(width)]
+        self.value_index = None
+
+    data = property(_getData, _setData)
+
+    def indexValues(self):
+        '''
+        Method to (re)build the inverted index of data values, which maps
+        each data value to the coordinates, (label name, series name),
+        where it is found. The inverted index cannot be built if any data
+        value is not hashable (such as a list), and will be set to None.
+        '''
+        self.value_index = {}
+        for index in range(len(self.columns)):
+            for row in range(len(self.columns[index])):
+                self._indexValue(index, row)
+
+    def _indexValue(self, index, row):
+        '''
+        Private method to add the coordinate of a series (column) and
+        label (row) into the inverted index of data values, if the index
+        had been built.
+
+        @param index: position of the series (column).
+        @param row: position of the label (row) in the column.
+        '''
+        if self.value_index is None: return None
+        value = self.columns[index][row]
+        try:
+            self.value_index.setdefault(value, set()).add(
+                (self.row_labels[row], self.series_names[index]))
+        except TypeError: self.value_index = None
+
+    def _unindexValue(self, index, row):
+        '''
+        Private method to remove the coordinate of a series (column) and
+        label (row) from the inverted index of data values, if the index
+        had been built.
+        '''
+        if self.value_index is None: return None
+        value = self.columns[index][row]
+        try:
+            coordinates = self.value_index[value]
+            coordinates.discard((self.row_labels[row],
+                                 self.series_names[index]))
+            if len(coordinates) == 0: del self.value_index[value]
+        except (KeyError, TypeError): self.value_index = None
+
+    def _store(self, index, row, value):
+        '''
+        Private method to store a value into a column, converting the
+        column into a list if the value does not fit its array type.
+
+        @param index: position of the series (column).
+        @param row: position of the label (row) in the column.
+        @param value: value to store.
+        '''
+        self._unindexValue(index, row)
+        self._own(index)
+        column = self.columns[index]
+        if not _fits(column, value):
+            column = list(column)
+            self.columns[index] = column
+        column[row] = value
+        self._indexValue(index, row)
+
+    def _own(self, index):
+        '''
+        Private method to copy a column if it is shared, before changing
+        it.
+
+        @param index: position of the series (column).
+        '''
+        column = self.columns[index]
+        for position in range(len(self.shared)):
+            if self.shared[position] is column:
+                self.columns[index] = column[:]
+                self.shared.pop(position)
+                return None
+
+    def _addRow(self, label, fill_in=None):
+        '''
+        Private method to add a new label (row) into the data frame, where
+        the value of every series is fill_in.
+        '''
+        self.label_index[label] = len(self.row_labels)
+        list.append(self.row_labels, label)
+        for index in range(len(self.columns)):
+            self._own(index)
+            column = self.columns[index]
+            if not _fits(column, fill_in):
+                column = list(column)
+                self.columns[index] = column
+            column.append(fill_in)
+            self._indexValue(index, len(self.row_labels) - 1)
+
+    def _removeRow(self, label):
+        '''
+        Private method to remove a label (row) from the data frame.
+        '''
+        row = self.label_index[label]
+        for index in range(len(self.columns)):
+            self._unindexValue(index, row)
+        del self.label_index[label]
+        list.pop(self.row_labels, row)
+        for index in range(len(self.columns)):
+            self._own(index)
+            self.columns[index].pop(row)
+        for position in range(row, len(self.row_labels)):
+            self.label_index[self.row_labels[position]] = position
+
+    def _subframe(self, rows, new_dataframe_name=''):
+        '''
+        Private method to generate a new data frame from the given label
+        positions (rows) of the current data frame.
+        '''
+        df = Dataframe(str(new_dataframe_name))
+        df.series_names = [name for name in self.series_names]
+        df.columns = [_take(column, rows) for column in self.columns]
+        df.row_labels = [self.row_labels[row] for row in rows]
+        df.label_index = dict([(df.row_labels[i], i)
+                               for i in range(len(df.row_labels))])
+        return df
+
     def cast(self, type, error_replace, series_name='all'):
         '''
         Method to cast data in the one or all series into a specific data
@@ -214,55 +1197,61 @@ class Dataframe(object):
         @param series_name: series name to cast values into a specific
         data type. If 'all', the entire data frame (all data series) will
         be type casted. Default = 'all'
+        @return: dictionary of {<series name>: [<labels where the data
+        element failed to be casted>]} for each casted series, or 0 if
+        the series is not found
+        @raise FunctionParameterValueError: if the data type is not allowed
         '''
         if series_name != 'all':
             try:
-                index = self.series_names.index(series_name)
+                indices = [self.series_names.index(series_name)]
             except:
                 return 0
-        if series_name == 'all':
-            for k in self.data.keys():
-                data = [0] * len(self.data[k])
-                type = str(type)
-                for i in range(len(self.data[k])):
-                    try:
-                        if type == 'int' or type == 'integer':
-                            data[i] = int(self.data[k][i])
-                        if type == 'real' or type == 'float':
-                            data[i] = float(self.data[k][i])
-                        if type == 'str' or type == 'string':
-                            data[i] = str(self.data[k][i])
-                    except:
-                        data[i] = error_replace
-                self.data[k] = data
         else:
-            for k in self.data.keys():
-                try:
-                    if type == 'int' or type == 'integer':
-                        self.data[k][index] = int(self.data[k][index])
-                    if type == 'real' or type == 'float':
-                         self.data[k][index] = float(self.data[k][index])
-                    if type == 'str' or type == 'string':
-                         self.data[k][index] = str(self.data[k][index])
-                except:
-                     self.data[k][index] = error_replace
-
-    def toSeries(self, series_name):
+            indices = range(len(self.columns))
+        function = _caster(type)
+        failures = {}
+        for index in indices:
+            column = self.columns[index]
+            if function is float and isinstance(column, array):
+                (data, failed) = (array('d', column), [])
+            elif function is int and isinstance(column, array) and \
+                column.typecode == 'q':
+                (data, failed) = (column, [])
+            else:
+                (data, failed) = _castValues(column, function, error_replace)
+                data = _column(data)
+            self.columns[index] = data
+            failures[self.series_names[index]] = [self.row_labels[position]
+                                                  for position in failed]
+        self.value_index = None
+        return failures
+
+    def toSeries(self, series_name, share=False):
         '''
         Method to extract a series within the current data frame into a
         Series object.
 
         @param series_name: name of series to extract
         @type series_name: string
+        @param share: boolean flag to share the column of data values with
+        the Series object instead of copying it, which is only possible
+        if the column is a list. The column is copied before its first
+        change by either the data frame or the Series object. Default =
+        False
         @return: dataframe.Series object
         '''
         series_name = str(series_name)
         s = Series(series_name)
         try:
-            si = self.series_names.index(series_name)
-            data = [self.data[self.label[li]][si]
-                    for li in range(len(self.label))]
-            s.addData(data, self.label)
+            column = self.columns[self.series_names.index(series_name)]
+            if share and type(column) is list:
+                s.data = column
+                s.label = [label for label in self.row_labels]
+                s.shared = True
+                self.shared.append(column)
+                return s
+            s.addData(list(column), self.row_labels)
             return s
         except ValueError: return s
         except KeyError: return s
@@ -341,28 +1330,12 @@ class Dataframe(object):
         @type new_dataframe_name: string
         @return: dataframe.Dataframe object
         '''
-        df = Dataframe(new_dataframe_name)
-        try:
-            data = {}
-            index = self.series_names.index(series_name)
-            for label in self.data.keys():
-                if operator == '=' and self.data[label][index] == value:
-                    data[label] = [x for x in self.data[label]]
-                elif operator == '>' and self.data[label][index] > value:
-                    data[label] = [x for x in self.data[label]]
-                elif operator == '<' and self.data[label][index] < value:
-                    data[label] = [x for x in self.data[label]]
-                elif operator == '>=' and self.data[label][index] >= value:
-                    data[label] = [x for x in self.data[label]]
-                elif operator == '<=' and self.data[label][index] <= value:
-                    data[label] = [x for x in self.data[label]]
-                elif operator == '*':
-                    data[label] = [x for x in self.data[label]]
-                df.data = data
-                df.series_names = [name for name in self.series_names]
-                df.label = data.keys()
-        except IOError: pass
-        return df
+        if series_name not in self.series_names:
+            return Dataframe(new_dataframe_name)
+        if operator != '*' and operator not in _comparators:
+            return self._subframe([], new_dataframe_name)
+        predicate = Predicate(series_name, operator, value)
+        return self.select(predicate).toDataframe(new_dataframe_name)
 
     def extractLabels(self, label_names, new_dataframe_name=''):
         '''
@@ -376,15 +1349,9 @@ class Dataframe(object):
         @type new_dataframe_name: string
         @return: dataframe.Dataframe object
         '''
-        df = Dataframe(str(new_dataframe_name))
-        data = {}
-        for label in label_names:
-            try: data[label] = [x for x in self.data[label]]
-            except KeyError: pass
-        df.data = data
-        df.label = label_names
-        df.series_names = [x for x in self.series_names]
-        return df
+        rows = [self.label_index[label] for label in label_names
+                if label in self.label_index]
+        return self._subframe(rows, new_dataframe_name)
 
     def extractValue(self, operator, value, new_dataframe_name=''):
         '''
@@ -407,34 +1374,134 @@ class Dataframe(object):
         @type new_dataframe_name: string
         @return: dataframe.Dataframe object
         '''
-        df = Dataframe(str(new_dataframe_name))
-        data = {}
-        for label in self.data.keys():
+        if operator != '*' and operator not in _comparators:
+            return self._subframe([], new_dataframe_name)
+        predicate = Predicate(None, operator, value)
+        return self.select(predicate).toDataframe(new_dataframe_name)
+
+    def select(self, predicate):
+        '''
+        Method to select labels where a predicate is true, without copying
+        the data. For example, the following selects the labels where the
+        value of seriesA is more than 30 or the value of seriesB is less
+        than 10, and copies them into a new data frame (ndf).
+
+        >>> p = Predicate('seriesA', '>', 30) | Predicate('seriesB', '<', 10)
+        >>> ndf = df.select(p).toDataframe('newframe')
+
+        @param predicate: search criterion.
+        @type predicate: dataframe.Predicate object
+        @return: dataframe.Selection object
+        '''
+        mask = predicate.mask(self)
+        return Selection(self, list(compress(range(len(mask)), mask)))
+
+    def groupBy(self, series_names, aggregations, new_dataframe_name='',
+                processes=1):
+        '''
+        Method to group labels by the data values of one or more series,
+        and aggregate the data values of other series within each group.
+        The data values are accumulated in a single pass over the labels,
+        using mergeable accumulators (samplestatistics.StreamingSummary);
+        hence, the labels can be split across worker processes and the
+        partial aggregates merged.
+
+        For example, the following calculates the number of labels and the
+        mean of seriesB for each data value of seriesA,
+
+        >>> ndf = df.groupBy('seriesA', {'seriesB': ['count', 'mean']})
+
+        where the labels of the new data frame are the data values of
+        seriesA, and the series are named 'seriesB_count' and
+        'seriesB_mean'.
+
+        Allowable aggregations are: 'count' (number of data values which
+        are not None), 'sum', 'mean', 'var' (sample variance), 'stdev'
+        (sample standard deviation), 'min', 'max', 'median', and quantiles
+        as 'q' followed by percentile (such as 'q90'). Data values of None
+        are ignored. 'count', 'min' and 'max' take data values of any type
+        (such as strings), and 'min' and 'max' are data values of the
+        series; the other aggregations need numerical data values. Median
+        and quantiles are interpolated between the closest ranks (as
+        samplestatistics.SingleSample.quantile) for up to 200 data values
+        in a group, and estimated by quantile sketches
+        (samplestatistics.QuantileSketch) for larger groups.
+
+        @param series_names: name (or list of names) of series to group by.
+        If more than one series, the group labels are tuples of data
+        values.
+        @param aggregations: dictionary of {<series name>: [<aggregation>]}
+        @type aggregations: dictionary
+        @param new_dataframe_name: name for new data frame (that is to be
+        returned)
+        @type new_dataframe_name: string
+        @param processes: number of worker processes. Default = 1 (no worker
+        process)
+        @type processes: integer
+        @return: dataframe.Dataframe object
+        @raise FunctionParameterValueError: if a series is not found or an
+        aggregation is not allowed.
+        '''
+        if isinstance(series_names, str):
+            series_names = [series_names]
+        names = list(series_names) + list(aggregations.keys())
+        for name in names:
+            if name not in self.series_names:
+                raise FunctionParameterValueError('Series not found: ' +
+                                                  str(name))
+        aggregated = list(aggregations.keys())
+        for name in aggregated:
+            for aggregation in aggregations[name]:
+                if not _isAggregation(aggregation):
+                    raise FunctionParameterValueError(
+                        'Unknown aggregation: ' + str(aggregation))
+        numeric = [any([aggregation not in ('count', 'min', 'max')
+                        for aggregation in aggregations[name]])
+                   for name in aggregated]
+        sketched = [any([aggregation == 'median' or aggregation[0] == 'q'
+                         for aggregation in aggregations[name]])
+                    for name in aggregated]
+        key_columns = [self.columns[self.series_names.index(name)]
+                       for name in series_names]
+        if len(key_columns) == 1: keys = list(key_columns[0])
+        else: keys = list(zip(*key_columns))
+        columns = [self.columns[self.series_names.index(name)]
+                   for name in aggregated]
+        processes = max(1, processes or 1)
+        if processes == 1 or len(keys) < 2 * processes:
+            groups = _groupRows(keys, columns, numeric, sketched)
+        else:
+            size = (len(keys) + processes - 1) // processes
+            argsets = [(keys[start:start + size],
+                        [list(column[start:start + size])
+                         for column in columns],
+                        numeric, sketched)
+                       for start in range(0, len(keys), size)]
+            pool = multiprocessing.Pool(processes)
             try:
-                if (operator == '>') and \
-                    sum([1 for item in self.data[label] if item > value]):
-                    data[label] = [x for x in self.data[label]]
-                elif (operator == '<') and \
-                    sum([1 for item in self.data[label] if item < value]):
-                    data[label] = [x for x in self.data[label]]
-                elif (operator == '>=') and \
-                    sum([1 for item in self.data[label] if item >= value]):
-                    data[label] = [x for x in self.data[label]]
-                elif (operator == '<=') and \
-                    sum([1 for item in self.data[label] if item <= value]):
-                    data[label] = [x for x in self.data[label]]
-                elif (operator == '=') and \
-                    sum([1 for item in self.data[label] if item == value]):
-                    data[label] = [x for x in self.data[label]]
-                elif (operator == '!=') and \
-                    sum([1 for item in self.data[label] if item != value]):
-                    data[label] = [x for x in self.data[label]]
-                elif (operator == '*'):
-                    data[label] = [x for x in self.data[label]]
-            except KeyError: pass
-        df.data = data
-        df.label = data.keys()
-        df.series_names = [x for x in self.series_names]
+                partials = pool.starmap(_groupRows, argsets)
+            finally:
+                pool.close()
+                pool.join()
+            groups = {}
+            for partial in partials:
+                for key in partial:
+                    if key not in groups:
+                        groups[key] = partial[key]
+                    else:
+                        for index in range(len(columns)):
+                            groups[key][index].merge(partial[key][index])
+        df = Dataframe(str(new_dataframe_name))
+        labels = list(groups.keys())
+        df.row_labels = labels
+        df.label_index = dict([(labels[i], i) for i in range(len(labels))])
+        for index in range(len(aggregated)):
+            for aggregation in aggregations[aggregated[index]]:
+                df.series_names.append(aggregated[index] + '_' +
+                                       aggregation)
+                df.columns.append(_column([_aggregate(groups[key][index],
+                                                      aggregation)
+                                           for key in labels]))
         return df
 
     def _generateRandomName(self):
@@ -447,7 +1514,7 @@ class Dataframe(object):
         '''
         name = ''.join([random.choice(string.ascii_uppercase)
                         for i in range(8)])
-        while name in self.series_name:
+        while name in self.series_names:
             name = ''.join([random.choice(string.ascii_uppercase)
                             for i in range(8)])
         return name
@@ -469,23 +1536,19 @@ class Dataframe(object):
         '''
         if series.name == '':
             series.name = self._generateRandomName()
-        df_label = self.data.keys()
-        for i in range(len(series.data)):
-            if series.label[i] not in df_label:
-                temp = [fill_in] * len(self.series_names)
-                temp.append(series.data[i])
-                self.data[series.label[i]] = temp
-            else:
-                temp = self.data[series.label[i]]
-                temp.append(series.data[i])
-                self.data[series.label[i]] = temp
+        if list(series.label) == self.row_labels:
+            self.columns.append(_column(series.data))
+        else:
+            for label in series.label:
+                if label not in self.label_index:
+                    self._addRow(label, fill_in)
+            data = [fill_in] * len(self.row_labels)
+            for i in range(len(series.data)):
+                data[self.label_index[series.label[i]]] = series.data[i]
+            self.columns.append(_column(data))
         self.series_names.append(series.name)
-        self.label = self.data.keys()
-        for k in self.label:
-            if len(self.data[k]) < len(self.series_names):
-                temp = self.data[k]
-                temp.append(fill_in)
-                self.data[k] = temp
+        for row in range(len(self.row_labels)):
+            self._indexValue(len(self.columns) - 1, row)
 
     def addData(self, dataset, labels, fill_in=None):
         '''
@@ -526,25 +1589,27 @@ class Dataframe(object):
         added data series (this will require filling in of missing values
         to the newly added data series). Default = None.
         '''
-        series_names = dataset.keys()
-        series_names.sort()
+        series_names = sorted(dataset.keys())
         for series_name in series_names:
             s = Series(str(series_name))
             s.addData(dataset[series_name], labels)
             self.addSeries(s, fill_in)
 
     def addCSV(self, filepath, series_header=True, separator=',',
-               fill_in=None, newline='\n'):
+               fill_in=None, newline='\n', types=None, chunk_size=10000):
         '''
         Method to add data from comma-delimited file (CSV) into current
-        data frame.
+        data frame. The file is read and parsed in chunks of rows; hence,
+        the memory used (in addition to the data frame) is bounded by the
+        chunk size. Quoted items are handled as in the csv module.
 
         @param filepath: path to CSV file.
         @type filepath: string
         @param series_header: boolean flag to denote whether the first row
         in the CSV file contains the data header. It is highly recommended
         that header is included in the CSV file. Default = True (header is
-        included)
+        included). If there is no header, series will be given randomly
+        generated 8-character names.
         @param separator: item separator within the CSV file. Default = ','
         @param fill_in: value to fill into missing values during process.
         This is required as the number of data elements across each label
@@ -554,25 +1619,188 @@ class Dataframe(object):
         in of missing values in the current data frame), or (2) the current
         data frame consists of labels that are not found in the newly
         added data series (this will require filling in of missing values
-        to the newly added data series). Default = None.
-        @param newline: character to denote new line or line feed in the
-        CSV file.
-        '''
-        data = open(filepath, 'r').readlines()
-        data = [x[:(-1)*len(newline)] for x in data]
-        data = [[item.strip()
-                 for item in x.split(separator)]
-                for x in data]
-        if series_header:
-            series = data[0][1:]
-            data = data[1:]
-        labels = [x[0] for x in data]
-        data = [x[1:] for x in data]
-        data = zip(*data)
-        for i in range(len(series)):
-            s = Series(series[i])
-            s.addData(data[i], labels)
-            self.addSeries(s, fill_in)
+        to the newly added data series). Items which cannot be type casted
+        (see types) are also replaced with fill_in, except for inferred
+        data types. Default = None.
+        @param newline: not used; line endings (including line endings
+        within quoted items) are handled by the csv module. Kept for
+        compatibility.
+        @param types: data types of the series. Allowable data types are
+        'int' (or 'integer'), 'float' (or 'real') and 'str' (or 'string').
+        This can be a list of data types (one for each series in the CSV
+        file), a dictionary of {<series name>: <data type>} (series not in
+        the dictionary are not casted), or 'infer' (data type of each series
+        is inferred from all rows as integer, float, or string, where empty
+        items are replaced with fill_in; the items are kept as strings
+        while the file is read, and type casted once the data type is
+        known, so the data values do not depend on chunk_size). Default =
+        None (all data values are strings).
+        @param chunk_size: number of rows to read and parse at a time.
+        Default = 10000.
+        @raise FunctionParameterValueError: if types is a list which is not
+        of the same length as the series in the CSV file.
+        '''
+        with open(filepath, 'r', newline='') as f:
+            reader = csv.reader(f, delimiter=separator,
+                                skipinitialspace=True)
+            if series_header:
+                try: series = [name.strip() for name in next(reader)[1:]]
+                except StopIteration: return None
+                chunk = list(islice(reader, chunk_size))
+            else:
+                chunk = list(islice(reader, chunk_size))
+                width = max([len(row) for row in chunk] + [1]) - 1
+                series = [self._generateRandomName() for i in range(width)]
+            inferred = None
+            if types == 'infer':
+                inferred = [int] * len(series)
+                functions = [None] * len(series)
+            elif isinstance(types, dict):
+                functions = [_casters.get(types.get(name)) for name in series]
+            elif types is not None:
+                if len(types) != len(series):
+                    raise FunctionParameterValueError(
+                        'Number of types (' + str(len(types)) + ') is not '
+                        'the number of series (' + str(len(series)) + ')')
+                functions = [_casters.get(t) for t in types]
+            else:
+                functions = [None] * len(series)
+            start = len(self.columns)
+            for name in series:
+                self.series_names.append(name)
+                self.columns.append([fill_in] * len(self.row_labels))
+            self.value_index = None
+            while len(chunk) > 0:
+                if inferred is not None:
+                    _widenTypes(chunk, inferred)
+                self._addRows(chunk, start, functions, fill_in)
+                chunk = list(islice(reader, chunk_size))
+            if inferred is not None:
+                for i in range(len(series)):
+                    self.columns[start + i] = _castText(
+                        self.columns[start + i], inferred[i], fill_in)
+
+    def _addRows(self, rows, start, functions, fill_in):
+        '''
+        Private method to add a chunk of rows, read from a CSV file, into
+        the series (columns) starting from a given position.
+
+        @param rows: list of rows, where each row is a list of label name
+        followed by the data values (as strings) of each series.
+        @param start: position of the first series (column).
+        @param functions: list of functions to type cast the data values of
+        each series (None if the data values are not casted).
+        @param fill_in: value to fill into missing values.
+        '''
+        rows = [row for row in rows if len(row) > 0]
+        labels = [row[0].strip() for row in rows]
+        values = [[row[i + 1].strip() if len(row) > i + 1 else fill_in
+                   for row in rows]
+                  for i in range(len(functions))]
+        values = [_castValues(values[i], functions[i], fill_in)[0]
+                  for i in range(len(functions))]
+        if len(set(labels)) == len(labels) and \
+            not any([label in self.label_index for label in labels]):
+            for label in labels:
+                self.label_index[label] = len(self.row_labels)
+                list.append(self.row_labels, label)
+            for index in range(len(self.columns)):
+                if index < start:
+                    column = [fill_in] * len(labels)
+                else:
+                    column = values[index - start]
+                self._extend(index, column)
+        else:
+            for position in range(len(labels)):
+                if labels[position] not in self.label_index:
+                    self._addRow(labels[position], fill_in)
+                row = self.label_index[labels[position]]
+                for i in range(len(functions)):
+                    self._store(start + i, row, values[i][position])
+
+    def _extend(self, index, values):
+        '''
+        Private method to append a list of values to a column, keeping the
+        array type of the column if all values fit into it.
+        '''
+        self._own(index)
+        column = self.columns[index]
+        values = _column(values)
+        if len(column) == 0:
+            self.columns[index] = values
+        elif type(column) is list:
+            column.extend(values)
+        elif type(values) is not list and \
+            values.typecode == column.typecode:
+            column.extend(values)
+        else:
+            self.columns[index] = list(column) + list(values)
+
+    def writeCSV(self, filepath, series_header=True, separator=','):
+        '''
+        Method to write the current data frame into a comma-delimited file
+        (CSV), which can be read by Dataframe.addCSV. Rows are generated
+        and written one at a time; hence, the data frame is not copied.
+        Labels are written in the order of Dataframe.label.
+
+        @param filepath: path to CSV file.
+        @type filepath: string
+        @param series_header: boolean flag to denote whether to write the
+        series names as the first row. Default = True
+        @param separator: item separator within the CSV file. Default = ','
+        '''
+        columns = self.columns
+        label_index = self.label_index
+        with open(filepath, 'w', newline='') as f:
+            writer = csv.writer(f, delimiter=separator)
+            if series_header:
+                writer.writerow([''] + self.series_names)
+            writer.writerows([label] + [column[label_index[label]]
+                                        for column in columns]
+                             for label in self.row_labels)
+
+    def writeBinary(self, filepath, compressed=False):
+        '''
+        Method to write the current data frame into a binary file (see
+        dataframe.writeFrames), which is faster to read than a CSV file
+        and allows a subset of series to be read.
+
+        @param filepath: path to binary file.
+        @type filepath: string
+        @param compressed: boolean flag to compress the data values of each
+        series using zlib. Default = False
+        '''
+        writeFrames(filepath, [self], compressed)
+
+    def readBinary(self, filepath, series_names=None, memory_map=True):
+        '''
+        Method to replace the data in the current data frame with a data
+        frame from a binary file written by Dataframe.writeBinary or
+        MultiDataframe.writeBinary. The data frame of the same name as the
+        current data frame is read if it is in the file; otherwise, the
+        first data frame in the file is read.
+
+        @param filepath: path to binary file.
+        @type filepath: string
+        @param series_names: names of series to read. Default = None (all
+        series)
+        @type series_names: list
+        @param memory_map: boolean flag to memory-map the file instead of
+        seeking and reading. Either way, only the blocks of the requested
+        series are read, and their values are copied into the columns of
+        the data frame. Default = True
+        '''
+        frames = readFrames(filepath, [self.name], series_names,
+                            memory_map)
+        if len(frames) == 0:
+            frames = readFrames(filepath, None, series_names, memory_map)
+        if len(frames) == 0: return None
+        df = frames[0]
+        self.series_names = df.series_names
+        self.columns = df.columns
+        self.row_labels = df.row_labels
+        self.label_index = df.label_index
+        self.value_index = None
 
     def removeSeries(self, series_name):
         '''
@@ -585,8 +1813,10 @@ class Dataframe(object):
         series_name = str(series_name)
         try:
             index = self.series_names.index(series_name)
+            for row in range(len(self.row_labels)):
+                self._unindexValue(index, row)
             self.series_names.pop(index)
-            for label in self.data.keys(): self.data[label].pop(index)
+            self.columns.pop(index)
         except: pass
 
     def popSeries(self, series_names, new_dataframe_name=''):
@@ -615,11 +1845,8 @@ class Dataframe(object):
         @type label: string
         '''
         label = str(label)
-        try:
-            index = self.label.index(label)
-            self.label.pop(index)
-            del self.data[label]
-        except: pass
+        if label in self.label_index:
+            self._removeRow(label)
 
     def popLabels(self, label_names, new_dataframe_name=''):
         '''
@@ -651,7 +1878,7 @@ class Dataframe(object):
         '''
         try:
             s = self.series_names.index(series)
-            self.data[label][s] = new_value
+            self._store(s, self.label_index[label], new_value)
         except ValueError: pass
         except KeyError: pass
 
@@ -667,8 +1894,12 @@ class Dataframe(object):
         '''
         try:
             index = self.series_names.index(original_name)
-            self.series_names[index] = new_name
-        except ValueError: pass
+        except ValueError: return None
+        for row in range(len(self.row_labels)):
+            self._unindexValue(index, row)
+        self.series_names[index] = new_name
+        for row in range(len(self.row_labels)):
+            self._indexValue(index, row)
 
     def changeLabel(self, new_label, original_label):
         '''
@@ -680,15 +1911,17 @@ class Dataframe(object):
         @param original_label: the existing (original) label name to be
         changed.
         '''
-        try:
-            data = [x for x in self.data[original_label]]
-            self.data[new_label] = data
-            del self.data[original_label]
-        except KeyError: pass
-        try:
-            index = self.label.index(original_label)
-            self.label[index] = new_label
-        except ValueError: pass
+        if original_label in self.label_index and \
+            new_label != original_label:
+            if new_label in self.label_index:
+                self._removeRow(new_label)
+            row = self.label_index.pop(original_label)
+            for index in range(len(self.columns)):
+                self._unindexValue(index, row)
+            list.__setitem__(self.row_labels, row, new_label)
+            self.label_index[new_label] = row
+            for index in range(len(self.columns)):
+                self._indexValue(index, row)
 
     def getDatum(self, series, label):
         '''
@@ -703,10 +1936,31 @@ class Dataframe(object):
         '''
         try:
             s = self.series_names.index(series)
-            return self.data[label][s]
+            return self.columns[s][self.label_index[label]]
         except ValueError: return None
         except KeyError: return None
 
+    def _find(self, datum):
+        '''
+        Private method to find the positions of a data value.
+
+        @param datum: the data value to find.
+        @return: list of (label position, series position) tuples.
+        '''
+        if self.value_index is None:
+            self.indexValues()
+        try:
+            coordinates = self.value_index.get(datum, set())
+            series = dict([(self.series_names[index], index)
+                           for index in range(len(self.series_names))])
+            return sorted([(self.label_index[label], series[name])
+                           for (label, name) in coordinates])
+        except (AttributeError, TypeError): pass
+        return [(row, index)
+                for row in range(len(self.row_labels))
+                    for index in range(len(self.columns))
+                        if self.columns[index][row] == datum]
+
     def getLabels(self, datum):
         '''
         Method to get label name(s) for a given data value. However, this
@@ -718,10 +1972,7 @@ class Dataframe(object):
         label names if the data value is found.
         @rtype: list
         '''
-        labels = [label
-                  for label in self.data.keys()
-                     for series in range(len(self.data[label]))
-                         if self.data[label][series] == datum]
+        labels = [self.row_labels[row] for (row, index) in self._find(datum)]
         if len(labels) == 0: return [None]
         if len(labels) > 0: return labels
 
@@ -736,10 +1987,8 @@ class Dataframe(object):
         series names if the data value is found.
         @rtype: list
         '''
-        series = [self.series_names[series]
-                  for label in self.data.keys()
-                     for series in range(len(self.data[label]))
-                         if self.data[label][series] == datum]
+        series = [self.series_names[index]
+                  for (row, index) in self._find(datum)]
         if len(series) == 0: return [None]
         if len(series) > 0: return series
 
@@ -755,10 +2004,8 @@ class Dataframe(object):
         more coordinates if the data value is found.
         @rtype: list
         '''
-        coordinates = [(self.series_names[series], label)
-                       for label in self.data.keys()
-                           for series in range(len(self.data[label]))
-                               if self.data[label][series] == datum]
+        coordinates = [(self.series_names[index], self.row_labels[row])
+                       for (row, index) in self._find(datum)]
         if len(coordinates) == 0:  return [(None, None)]
         else: return list(set(coordinates))
 
@@ -780,26 +2027,13 @@ class Dataframe(object):
         @param original_value: original value of the data.
         @param new_value: new value to be replaced when the criterion is met.
         '''
-        if label_name not in self.data: return None
-        for i in range(len(self.data[label_name])):
-            if (operator == '=') and \
-                (self.data[label_name][i] == original_value):
-                    self.data[label_name][i] = new_value
-            elif (operator == '>') and \
-                (self.data[label_name][i] > original_value):
-                    self.data[label_name][i] = new_value
-            elif (operator == '<') and \
-                (self.data[label_name][i] < original_value):
-                    self.data[label_name][i] = new_value
-            elif (operator == '>=') and \
-                (self.data[label_name][i] >= original_value):
-                    self.data[label_name][i] = new_value
-            elif (operator == '<=') and \
-                (self.data[label_name][i] <= original_value):
-                    self.data[label_name][i] = new_value
-            elif (operator == '!=') and \
-                (self.data[label_name][i] != original_value):
-                    self.data[label_name][i] = new_value
+        if label_name not in self.label_index: return None
+        if operator not in _comparators: return None
+        compare = _comparators[operator]
+        row = self.label_index[label_name]
+        for index in range(len(self.columns)):
+            if compare(self.columns[index][row], original_value):
+                self._store(index, row, new_value)
 
     def replaceSeries(self, series_name, operator, original_value, new_value):
         '''
@@ -821,25 +2055,11 @@ class Dataframe(object):
         '''
         if series_name not in self.series_names: return None
         else: index = self.series_names.index(series_name)
-        for label in self.data.keys():
-            if (operator == '=') and \
-                (self.data[label][index] == original_value):
-                    self.data[label][index] = new_value
-            elif (operator == '>') and \
-                (self.data[label][index] > original_value):
-                    self.data[label][index] = new_value
-            elif (operator == '<') and \
-                (self.data[label][index] < original_value):
-                    self.data[label][index] = new_value
-            elif (operator == '>=') and \
-                (self.data[label][index] >= original_value):
-                    self.data[label][index] = new_value
-            elif (operator == '<=') and \
-                (self.data[label][index] <= original_value):
-                    self.data[label][index] = new_value
-            elif (operator == '!=') and \
-                (self.data[label][index] != original_value):
-                    self.data[label][index] = new_value
+        if operator not in _comparators: return None
+        compare = _comparators[operator]
+        for row in range(len(self.columns[index])):
+            if compare(self.columns[index][row], original_value):
+                self._store(index, row, new_value)
 
 
 class MultiDataframe(object):
@@ -890,4 +2110,320 @@ class MultiDataframe(object):
                                 for i in range(8)])
             dataframe.name = name
         self.frames[dataframe.name] = dataframe
-        self.frame_names.append(dataframe.name)
+        if dataframe.name not in self.frame_names:
+            self.frame_names.append(dataframe.name)
+
+    def writeBinary(self, filepath, compressed=False):
+        '''
+        Method to write all data frames into a binary file (see
+        dataframe.writeFrames).
+
+        @param filepath: path to binary file.
+        @type filepath: string
+        @param compressed: boolean flag to compress the data values of each
+        series using zlib. Default = False
+        '''
+        writeFrames(filepath,
+                    [self.frames[name] for name in self.frame_names],
+                    compressed)
+
+    def readBinary(self, filepath, frame_names=None, series_names=None,
+                   memory_map=True):
+        '''
+        Method to add data frames from a binary file written by
+        MultiDataframe.writeBinary or Dataframe.writeBinary. Existing data
+        frames of the same names will be replaced.
+
+        @param filepath: path to binary file.
+        @type filepath: string
+        @param frame_names: names of data frames to read. Default = None
+        (all data frames in the file)
+        @type frame_names: list
+        @param series_names: names of series to read. Default = None (all
+        series)
+        @type series_names: list
+        @param memory_map: boolean flag to memory-map the file instead of
+        seeking and reading. Either way, only the blocks of the requested
+        series are read, and their values are copied into the columns of
+        the data frame. Default = True
+        '''
+        for df in readFrames(filepath, frame_names, series_names,
+                             memory_map):
+            self.addDataframe(df, True)
+
+    def join(self, left_name, right_name, how='inner', on=None,
+             new_dataframe_name='', method='auto'):
+        '''
+        Method to join 2 data frames into a new data frame, on labels or
+        on the data values of a series in each data frame (as in SQL join).
+        For example, the following joins the labels of frame1 with the
+        labels of frame2 where the value of seriesA in frame1 equals the
+        value of seriesX in frame2, keeping the labels of frame1 without
+        matches.
+
+        >>> ndf = mdf.join('frame1', 'frame2', 'left', ('seriesA', 'seriesX'))
+
+        The new data frame consists of the series of the left data frame
+        followed by the series of the right data frame, where a series
+        name found in both data frames is prefixed with the data frame
+        name (<frame name>.<series name>), or with 'left' and 'right' when
+        a data frame is joined with itself. Values are None where a label
+        has no match in the other data frame. When joining on labels, the
+        labels of the new data frame are the joined labels; otherwise, the
+        labels are (<left label>, <right label>) tuples. Labels or data
+        values of None do not match.
+
+        Hash join (building a hash table on the right data frame and
+        probing it with the left data frame) is used, unless both data
+        frames are sorted on the joined labels or data values, in which
+        case sort-merge join is used. The columns of the new data frame are
+        taken directly from the label positions of the matches.
+
+        @param left_name: name of the left data frame.
+        @type left_name: string
+        @param right_name: name of the right data frame.
+        @type right_name: string
+        @param how: type of join. Allowed values are 'inner' (only labels
+        with matches), 'left' (all labels of the left data frame), 'right'
+        (all labels of the right data frame), and 'outer' (all labels of
+        both data frames). Default = 'inner'
+        @param on: series name (found in both data frames) or a tuple of
+        (left series name, right series name) to join on. Default = None
+        (join on labels)
+        @param new_dataframe_name: name for new data frame (that is to be
+        returned)
+        @type new_dataframe_name: string
+        @param method: join algorithm. Allowed values are 'hash', 'merge'
+        (sort-merge, which requires both data frames to be sorted), and
+        'auto' (sort-merge if both data frames are sorted, otherwise hash).
+        Default = 'auto'
+        @return: dataframe.Dataframe object
+        @raise FunctionParameterValueError: if the type of join or method
+        is not allowed, or a series is not found.
+        '''
+        if how not in ('inner', 'left', 'right', 'outer'):
+            raise FunctionParameterValueError('Unknown join: ' + str(how))
+        if method not in ('auto', 'hash', 'merge'):
+            raise FunctionParameterValueError('Unknown join method: ' +
+                                              str(method))
+        left = self.frames[left_name]
+        right = self.frames[right_name]
+        if how == 'right':
+            (left, right) = (right, left)
+        if on is None:
+            left_keys = left.row_labels
+            right_keys = right.row_labels
+        else:
+            if isinstance(on, str): on = (on, on)
+            if how == 'right': on = (on[1], on[0])
+            try:
+                left_keys = left.columns[left.series_names.index(on[0])]
+                right_keys = right.columns[right.series_names.index(on[1])]
+            except ValueError:
+                raise FunctionParameterValueError('Series not found: ' +
+                                                  str(on))
+        if method == 'auto':
+            if _isSorted(left_keys) and _isSorted(right_keys):
+                method = 'merge'
+            else:
+                method = 'hash'
+        if method == 'merge':
+            (left_rows, right_rows) = _mergeJoin(left_keys, right_keys,
+                                                 how != 'inner',
+                                                 how == 'outer')
+        else:
+            (left_rows, right_rows) = _hashJoin(left_keys, right_keys,
+                                                how != 'inner',
+                                                how == 'outer')
+        if how == 'right':
+            (left, right) = (right, left)
+            (left_rows, right_rows) = (right_rows, left_rows)
+        df = Dataframe(str(new_dataframe_name))
+        if left_name == right_name: prefixes = ('left', 'right')
+        else: prefixes = (left.name, right.name)
+        for (frame, rows, other, prefix) in \
+            ((left, left_rows, right, prefixes[0]),
+             (right, right_rows, left, prefixes[1])):
+            for index in range(len(frame.columns)):
+                name = frame.series_names[index]
+                if name in other.series_names:
+                    name = prefix + '.' + name
+                df.series_names.append(name)
+                df.columns.append(_takeJoined(frame.columns[index], rows))
+        if on is None:
+            labels = [left.row_labels[left_rows[i]]
+                      if left_rows[i] is not None
+                      else right.row_labels[right_rows[i]]
+                      for i in range(len(left_rows))]
+        else:
+            labels = list(zip(_takeJoined(left.row_labels, left_rows),
+                              _takeJoined(right.row_labels, right_rows)))
+        df.row_labels = labels
+        df.label_index = dict([(labels[i], i) for i in range(len(labels))])
+        return df
+
+
+def _writeBlock(f, data, compressed):
+    '''
+    Private function to write a block of bytes into a binary data frame
+    file.
+
+    @param f: file object opened for binary writing.
+    @param data: bytes to write.
+    @param compressed: boolean flag to compress the bytes with zlib.
+    @return: dictionary of block offset, length and compression flag.
+    '''
+    if compressed: data = zlib.compress(data)
+    block = {'offset': f.tell(), 'length': len(data),
+             'compressed': compressed}
+    f.write(data)
+    return block
+
+def _writeColumn(f, column, compressed):
+    '''
+    Private function to write a column (or list of labels) into a binary
+    data frame file. Arrays are written as raw bytes, lists of strings,
+    numbers, booleans and None are written as JSON, and other lists (such
+    as tuple labels, which JSON turns into lists) are pickled.
+    '''
+    if isinstance(column, list) and \
+        all([type(value) in _json_types for value in column]):
+        block = _writeBlock(f, json.dumps(column).encode('utf-8'),
+                            compressed)
+        block['encoding'] = 'json'
+    elif isinstance(column, list):
+        block = _writeBlock(f, pickle.dumps(list(column),
+                                            pickle.HIGHEST_PROTOCOL),
+                            compressed)
+        block['encoding'] = 'pickle'
+    else:
+        block = _writeBlock(f, column.tobytes(), compressed)
+        block['encoding'] = column.typecode
+    return block
+
+def _readColumn(source, block, byteorder):
+    '''
+    Private function to read a column (or list of labels) from a binary
+    data frame file.
+
+    @param source: memory-mapped file (mmap.mmap object) or file object
+    opened for binary reading.
+    @param block: dictionary of block offset, length, compression flag
+    and encoding.
+    @param byteorder: byte order of the file ('little' or 'big').
+    @return: array.array or list
+    '''
+    if isinstance(source, mmap.mmap):
+        data = source[block['offset']:block['offset'] + block['length']]
+    else:
+        source.seek(block['offset'])
+        data = source.read(block['length'])
+    if block['compressed']: data = zlib.decompress(data)
+    if block['encoding'] == 'json':
+        return json.loads(data.decode('utf-8'))
+    if block['encoding'] == 'pickle':
+        return pickle.loads(data)
+    column = array(block['encoding'])
+    column.frombytes(data)
+    if byteorder != sys.byteorder: column.byteswap()
+    return column
+
+def writeFrames(filepath, frames, compressed=False):
+    '''
+    Function to write one or more data frames into a binary file, where
+    the data values of each series (column) are stored in a separate
+    block. This allows a subset of series to be read without reading the
+    other series (see readFrames).
+
+    The file consists of::
+
+        <BINARY_MAGIC> <blocks> <header> <length of header>
+
+    where the header is a JSON document of the names, labels and series
+    names of the data frames, and the offset, length, compression flag
+    and encoding of each block. Length of header is an 8-byte little
+    endian unsigned integer. Columns of floats and integers are stored as
+    raw arrays of doubles and long longs respectively; other columns and
+    labels are stored as JSON if they consist of strings, numbers,
+    booleans and None, or pickled otherwise (such as the tuple labels of
+    data frames grouped by more than one series). As pickled blocks are
+    unpickled on reading, files should only be read from trusted sources.
+
+    @param filepath: path to binary file.
+    @type filepath: string
+    @param frames: list of data frames to write.
+    @param compressed: boolean flag to compress each block using zlib.
+    Default = False
+    '''
+    header = {'version': 1, 'byteorder': sys.byteorder, 'frames': []}
+    with open(filepath, 'wb') as f:
+        f.write(BINARY_MAGIC)
+        for frame in frames:
+            entry = {'name': frame.name,
+                     'labels': _writeColumn(f, frame.row_labels, compressed),
+                     'series': []}
+            for index in range(len(frame.columns)):
+                block = _writeColumn(f, frame.columns[index], compressed)
+                block['name'] = frame.series_names[index]
+                entry['series'].append(block)
+            header['frames'].append(entry)
+        header = json.dumps(header).encode('utf-8')
+        f.write(header)
+        f.write(struct.pack('<Q', len(header)))
+
+def readFrames(filepath, frame_names=None, series_names=None,
+               memory_map=True):
+    '''
+    Function to read data frames from a binary file written by
+    writeFrames.
+
+    @param filepath: path to binary file.
+    @type filepath: string
+    @param frame_names: names of data frames to read. Default = None (all
+    data frames in the file)
+    @type frame_names: list
+    @param series_names: names of series to read (column projection); only
+    the blocks of these series are read from the file. Default = None
+    (all series)
+    @type series_names: list
+    @param memory_map: boolean flag to memory-map the file instead of
+    seeking and reading. Either way, only the blocks of the requested
+    series are read, and their values are copied into the columns of the
+    data frames. Default = True
+    @return: list of data frames (dataframe.Dataframe objects)
+    @raise FunctionParameterValueError: if the file is not a binary data
+    frame file.
+    '''
+    frames = []
+    with open(filepath, 'rb') as f:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise FunctionParameterValueError(filepath + \
+                ' is not a binary data frame file')
+        f.seek(-8, os.SEEK_END)
+        length = struct.unpack('<Q', f.read(8))[0]
+        f.seek(-8 - length, os.SEEK_END)
+        header = json.loads(f.read(length).decode('utf-8'))
+        if memory_map: source = mmap.mmap(f.fileno(), 0,
+                                          access=mmap.ACCESS_READ)
+        else: source = f
+        try:
+            for entry in header['frames']:
+                if frame_names is not None and \
+                    entry['name'] not in frame_names:
+                    continue
+                df = Dataframe(entry['name'])
+                df.row_labels = _readColumn(source, entry['labels'],
+                                            header['byteorder'])
+                df.label_index = dict([(df.row_labels[i], i)
+                                       for i in range(len(df.row_labels))])
+                for block in entry['series']:
+                    if series_names is not None and \
+                        block['name'] not in series_names:
+                        continue
+                    df.series_names.append(block['name'])
+                    df.columns.append(_readColumn(source, block,
+                                                  header['byteorder']))
+                frames.append(df)
+        finally:
+            if memory_map: source.close()
+    return frames
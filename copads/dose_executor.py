@@ -9,6 +9,9 @@ Papers 7: 5.
 '''
 
 import sys, os
+import random
+import multiprocessing
+from collections import OrderedDict
 from datetime import datetime
 
 from . import ragaraja as N
@@ -41,11 +44,263 @@ def set_instruction_version(ragaraja_version,
         ragaraja_instructions = N.nBF_instructions
     if ragaraja_version == 1:
         ragaraja_instructions = N.ragaraja_v1
-    for instruction in N.ragaraja:
-        if instruction not in ragaraja_instructions:
-            N.ragaraja[instruction] = N.not_used
+    N.activate_version(0, ragaraja_instructions)
     return ragaraja_instructions
 
+class ExecutionCache(object):
+    '''
+    Least recently used (LRU) cache of the results of executing genomes,
+    for genomes which give the same results for the same input data and
+    cytoplasm - genomes whose instructions are all deterministic (see
+    ExecutionCache.key). Clonal organisms, and organisms whose genomes are
+    not changed over generations, are executed once for each input data
+    and cytoplasm.
+
+    The number of executions found in the cache (ExecutionCache.hits),
+    not found in the cache (ExecutionCache.misses), and not cached as the
+    genome is not deterministic (ExecutionCache.skips) are counted.
+    '''
+    def __init__(self, size=10000, nondeterministic=None):
+        '''
+        Constructor method.
+
+        @param size: Maximum number of results to keep. Default = 10000
+        @type size: integer
+        @param nondeterministic: Instructions which are not deterministic.
+        Default = None (ragaraja.nondeterministic_instructions)
+        @type nondeterministic: list
+        '''
+        if nondeterministic is None:
+            nondeterministic = N.nondeterministic_instructions
+        self.size = size
+        self.nondeterministic = set(nondeterministic)
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.skips = 0
+
+    def key(self, source, inputdata, array):
+        '''
+        Method to generate the key of an execution, which is None if the
+        genome is not deterministic - a genome is deterministic if none of
+        its instructions (at every 3 characters) is declared as not
+        deterministic (see ragaraja.nondeterministic_instructions); that
+        is, they do not use random numbers (such as the NucleotideBF random
+        operations) or registers, and do not change the genome.
+
+        @param source: Genome.
+        @type source: string
+        @param inputdata: Input data.
+        @type inputdata: list
+        @param array: Cytoplasm.
+        @type array: list
+        @return: key of the execution, or None
+        '''
+        nondeterministic = self.nondeterministic
+        for position in range(0, len(source), 3):
+            if source[position:position+3] in nondeterministic:
+                self.skips = self.skips + 1
+                return None
+        return (source, tuple(inputdata), tuple(array))
+
+    def get(self, key):
+        '''
+        Method to get the results of an execution.
+
+        @param key: Key of the execution (see ExecutionCache.key).
+        @return: results of the execution, or None if not cached
+        '''
+        if key not in self.results:
+            self.misses = self.misses + 1
+            return None
+        self.hits = self.hits + 1
+        self.results.move_to_end(key)
+        return self.results[key]
+
+    def put(self, key, results):
+        '''
+        Method to cache the results of an execution, removing the least
+        recently used results if the cache is full.
+
+        @param key: Key of the execution (see ExecutionCache.key).
+        @param results: Results of the execution.
+        '''
+        self.results[key] = results
+        self.results.move_to_end(key)
+        while len(self.results) > self.size:
+            self.results.popitem(last=False)
+
+    def hit_rate(self):
+        '''
+        Method to calculate the proportion of executions of deterministic
+        genomes found in the cache.
+
+        @return: hit rate (0 if no deterministic genome is executed)
+        '''
+        if self.hits + self.misses == 0:
+            return 0.0
+        return float(self.hits) / (self.hits + self.misses)
+
+execution_cache = None
+
+def _run_genome(source, array, inputdata):
+    '''
+    Private function to execute a genome, where the cytoplasm and input
+    data may be changed in place by the Ragaraja interpreter.
+
+    @return: results of the execution as the tuple of (<cytoplasm>,
+    <input data>, <returned cytoplasm>, <returned input data>, <output>),
+    where the cytoplasm and input data are the contents of the given lists
+    after the execution, the returned cytoplasm and input data are None if
+    they are the given lists, and the output is None if the execution is
+    stopped by an error. This is also the layout of the results in the
+    execution cache.
+    '''
+    (cytoplasm, data, output) = (array, inputdata, None)
+    try: (cytoplasm, apointer, data,
+          output, source, spointer) = \
+            r.interpret(source, N.ragaraja, 3,
+                        inputdata, array,
+                        max_cytoplasm_size,
+                        max_codon)
+    except IndexError: pass
+    except ZeroDivisionError: pass
+    except OverflowError: pass
+    except ValueError: pass
+    returned_cells = None
+    returned_data = None
+    if cytoplasm is not array:
+        returned_cells = tuple(cytoplasm)
+    if data is not inputdata:
+        returned_data = tuple(data)
+    if output is not None:
+        output = tuple(output)
+    return (tuple(array), tuple(inputdata), returned_cells, returned_data,
+            output)
+
+def _replay(results, array, inputdata):
+    '''
+    Private function to apply the results of an execution (see _run_genome)
+    to the cytoplasm and input data lists.
+
+    @return: tuple of (<cytoplasm>, <remaining input data>, <output>),
+    where the output is None if the execution is stopped by an error.
+    '''
+    (cells, data, returned_cells, returned_data, output) = results
+    array[:] = cells
+    inputdata[:] = data
+    if returned_cells is not None:
+        array = list(returned_cells)
+    if returned_data is not None:
+        inputdata = list(returned_data)
+    if output is not None:
+        output = list(output)
+    return (array, inputdata, output)
+
+def _initialize_worker(instructions, tape_size, codons):
+    '''
+    Private function to initialize a worker process for parallel execution
+    of genomes, by setting the active Ragaraja instructions and execution
+    parameters of the worker once.
+    '''
+    global max_cytoplasm_size, max_codon
+    N.activate_version(0, instructions)
+    max_cytoplasm_size = tape_size
+    max_codon = codons
+
+def _execute_genome(task):
+    '''
+    Private function to execute a genome in a worker process, or in this
+    process (see _execute_serial).
+
+    @param task: tuple of (<genome source>, <cytoplasm>, <input data>,
+    <random seed>).
+    @return: results of the execution (see _run_genome).
+    '''
+    (source, array, inputdata, seed) = task
+    random.seed(seed)
+    N.register[:] = [0]*99
+    return _run_genome(source, array, inputdata)
+
+def _execute_serial(tasks):
+    '''
+    Private function to execute genomes in this process as they are
+    executed in worker processes (see _execute_genome). The state of the
+    random number generator and the Ragaraja registers of this process
+    are restored after the executions.
+
+    @param tasks: list of tasks (see _execute_genome).
+    @return: list of results of the executions (see _run_genome).
+    '''
+    state = random.getstate()
+    register = [x for x in N.register]
+    try:
+        return [_execute_genome(task) for task in tasks]
+    finally:
+        random.setstate(state)
+        N.register[:] = register
+
+def _execute_genomes(pool, populations, world, processes):
+    '''
+    Private function to execute the genomes of all organisms, in worker
+    processes (in chunks, if a pool of worker processes is given) or in
+    this process (see _execute_serial); and the results are gathered in
+    the order of organisms. Each organism is executed on a copy of the
+    local input of its ecological cell, with the random number generator
+    seeded by its population name and position (from a base seed drawn
+    once per generation), and with cleared Ragaraja registers; hence, the
+    results are reproducible regardless of the number of processes.
+    Deterministic genomes are executed once for each input data and
+    cytoplasm in the generation, and not executed if found in the
+    execution cache (if any).
+    '''
+    base = random.getrandbits(64)
+    tasks = []
+    organisms = []
+    shared = {}
+    for name in population_names:
+        for i in range(len(populations[name].agents)):
+            source = populations[name].agents[i].genome[0].sequence
+            source = ''.join(source)
+            if clean_cytoplasm:
+                array = [0]*cytoplasm_size
+            else:
+                array = populations[name].agents[i].cytoplasm
+            L = populations[name].agents[i].status['location']
+            inputdata = world.ecosystem[L[0]][L[1]][L[2]]['local_input']
+            seed = '-'.join([str(base), str(name), str(i)])
+            key = None
+            cached = None
+            if execution_cache is not None:
+                key = execution_cache.key(source, inputdata, array)
+            if key is not None and key in shared:
+                execution_cache.hits = execution_cache.hits + 1
+                organisms.append((name, i, L, shared[key], None))
+                continue
+            if key is not None:
+                cached = execution_cache.get(key)
+            if cached is None:
+                if key is not None:
+                    shared[key] = len(tasks)
+                tasks.append((source, list(array), list(inputdata), seed))
+            organisms.append((name, i, L, len(tasks) - 1, cached))
+    if pool is None:
+        executed = _execute_serial(tasks)
+    else:
+        chunksize = max(1, len(tasks) // (processes * 4))
+        executed = pool.map(_execute_genome, tasks, chunksize)
+    for key in shared:
+        execution_cache.put(key, executed[shared[key]])
+    for (name, i, L, task, cached) in organisms:
+        if cached is None:
+            cached = executed[task]
+        (array, inputdata, output) = _replay(cached, [], [])
+        if output is None:
+            output = []
+        populations[name].agents[i].cytoplasm = array
+        world.ecosystem[L[0]][L[1]][L[2]]['temporary_input'] = inputdata
+        world.ecosystem[L[0]][L[1]][L[2]]['temporary_output'] = output
+
 def write_parameters():
     '''
     Write parameters into file.
@@ -77,7 +332,7 @@ def write_parameters():
         f.write('instruction_set = ' + str(ragaraja_instructions) + '\n')
         f.close()
     
-def simulate(entity_module):
+def simulate(entity_module, processes=1, cache_size=0):
     '''
     Simulate the entities in DOSE.
     
@@ -85,10 +340,25 @@ def simulate(entity_module):
     classes in entity_module are Chromosome (inherited from genetic.Chromosome),
     Organism (inherited from genetic.Organism), Population (inherited from 
     genetic.Population) and World (inherited from dose_world.World).
+    @param processes: number of worker processes to execute genomes. The
+    genomes of all organisms in a generation are executed independently -
+    each organism is executed on a copy of the local input of its
+    ecological cell (instead of the local input remaining after the
+    previous organism) with a reproducible random seed and cleared
+    Ragaraja registers, and an organism whose execution is stopped by an
+    error reports an empty output ([]) - in parallel if more than 1, or
+    one after another in this process; hence, the results do not depend
+    on the number of processes. Default = 1
+    @type processes: integer
+    @param cache_size: maximum number of execution results of
+    deterministic genomes to cache (see ExecutionCache), where the cache
+    is kept as execution_cache for its hit rate. Default = 0 (no caching)
+    @type cache_size: integer
     
     @since: version 0.4.1
     '''
-    exec('from %s import World, Population' % entity_module)
+    global execution_cache
+    exec('from %s import World, Population' % entity_module, globals())
     
     populations = {}
     world = World()
@@ -105,98 +375,93 @@ def simulate(entity_module):
     # Default Simulation Driver                                            #
     # (do not change anything above this line)                             #
     ########################################################################
+    execution_cache = None
+    if cache_size > 0:
+        execution_cache = ExecutionCache(cache_size)
+    pool = None
+    if processes > 1:
+        instructions = [instruction for instruction in N.ragaraja
+                        if N.ragaraja[instruction] is not N.not_used]
+        pool = multiprocessing.Pool(processes, _initialize_worker,
+                                    (instructions, max_cytoplasm_size,
+                                     max_codon))
     generation_count = 0
-    while generation_count < maximum_generations:
-        generation_count = generation_count + 1
-        '''
-        Run World.ecoregulate function
-        '''
-        world.ecoregulate()
+    try:
+        while generation_count < maximum_generations:
+            generation_count = generation_count + 1
+            '''
+            Run World.ecoregulate function
+            '''
+            world.ecoregulate()
         
-        '''
-        For each ecological cell, run World.update_ecology and 
-        World.update_local functions
-        '''
-        for x in range(world.world_x):
-            for y in range(world.world_y):
-                for z in range(world.world_z):
-                    world.update_ecology(x, y, z)
-                    world.update_local(x, y, z)  
+            '''
+            For each ecological cell, run World.update_ecology and 
+            World.update_local functions
+            '''
+            for x in range(world.world_x):
+                for y in range(world.world_y):
+                    for z in range(world.world_z):
+                        world.update_ecology(x, y, z)
+                        world.update_local(x, y, z)  
                     
-        '''
-        For each organism
-            Execute genome by Ragaraja interpreter using 
-               existing cytoplasm, local conditions as input
-            Update cytoplasm (Organism.cytoplasm)
-            Add input/output from organism intermediate condition of local cell
-        '''
-        for name in population_names:
-            for i in range(len(populations[name].agents)):
-                source = populations[name].agents[i].genome[0].sequence
-                source = ''.join(source)
-                if clean_cytoplasm:
-                    array = [0]*cytoplasm_size
-                else:
-                    array = populations[name].agents[i].cytoplasm
-                L = populations[name].agents[i].status['location']
-                inputdata = world.ecosystem[L[0]][L[1]][L[2]]['local_input']
-                try: (array, apointer, inputdata,
-                      output, source, spointer) = \
-                        r.interpret(source, N.ragaraja, 3,
-                                    inputdata, array,
-                                    max_cytoplasm_size,
-                                    max_codon)
-                except IndexError: pass
-                except ZeroDivisionError: pass
-                except OverflowError: pass
-                except ValueError: pass
-                populations[name].agents[i].cytoplasm = array
-                world.ecosystem[L[0]][L[1]][L[2]]['temporary_input'] = inputdata
-                world.ecosystem[L[0]][L[1]][L[2]]['temporary_output'] = output
+            '''
+            For each organism
+                Execute genome by Ragaraja interpreter using 
+                   existing cytoplasm, local conditions as input
+                Update cytoplasm (Organism.cytoplasm)
+                Add input/output from organism intermediate condition of
+                local cell
+            '''
+            _execute_genomes(pool, populations, world, processes)
         
-        '''        
-        For each population
-            Run Population.prepopulation_control function
-            Run Population.mating function and add new organisms to cell
-            For each organism, run Organism.mutation_scheme function
-            Run Population.generation_events function
-            Add 1 to generation count
-            Run Population.report function
-            Fossilize population if needed
-        '''
-        for name in population_names:
-            report = populations[name].generation_step()
-            if generation_count % int(fossilized_frequency) == 0:
-                ffile = fossil_files[name] + '_'
-                populations[name].freeze(ffile, fossilized_ratio)
-            if generation_count % int(print_frequency) == 0:
-                print(str(generation_count), str(report))
-                f = open(result_files[name] + '.result.txt', 'a')
-                dtstamp = str(datetime.utcnow())
-                f.write('\t'.join([dtstamp, str(generation_count),
-                                   str(report)]))
-                f.write('\n')
-                f.close()
+            '''        
+            For each population
+                Run Population.prepopulation_control function
+                Run Population.mating function and add new organisms to cell
+                For each organism, run Organism.mutation_scheme function
+                Run Population.generation_events function
+                Add 1 to generation count
+                Run Population.report function
+                Fossilize population if needed
+            '''
+            for name in population_names:
+                report = populations[name].generation_step()
+                if generation_count % int(fossilized_frequency) == 0:
+                    ffile = fossil_files[name] + '_'
+                    populations[name].freeze(ffile, fossilized_ratio)
+                if generation_count % int(print_frequency) == 0:
+                    print(str(generation_count), str(report))
+                    f = open(result_files[name] + '.result.txt', 'a')
+                    dtstamp = str(datetime.utcnow())
+                    f.write('\t'.join([dtstamp, str(generation_count),
+                                       str(report)]))
+                    f.write('\n')
+                    f.close()
                 
-        '''
-        For each ecological cell
-            Run World.organism_movement function
-            Run World.organism_location function
-            Run World.report function
-        '''
-        for x in range(world.world_x):
-            for y in range(world.world_y):
-                for z in range(world.world_z):
-                    world.organism_movement(x, y, z)
-                    world.organism_location(x, y, z)
-                    world.report()
+            '''
+            For each ecological cell
+                Run World.organism_movement function
+                Run World.organism_location function
+                Run World.report function
+            '''
+            for x in range(world.world_x):
+                for y in range(world.world_y):
+                    for z in range(world.world_z):
+                        world.organism_movement(x, y, z)
+                        world.organism_location(x, y, z)
+                        world.report()
         
-        '''
-        Bury ecosystem if needed
-        '''
-        if generation_count % int(eco_buried_frequency) == 0:
-            filename = eco_burial_file + '_' + str(generation_count) + '.eco'
-            world.eco_burial(filename)
+            '''
+            Bury ecosystem if needed
+            '''
+            if generation_count % int(eco_buried_frequency) == 0:
+                filename = eco_burial_file + '_' + \
+                    str(generation_count) + '.eco'
+                world.eco_burial(filename)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
             
 if __name__ == "__main__":
     if len(sys.argv) != 3:
@@ -218,4 +483,5 @@ if __name__ == "__main__":
         ragaraja_instructions = set_instruction_version(ragaraja_version,
                                                 user_defined_instructions)
         write_parameters()
-        simulate(entity_module)
+        simulate(entity_module, globals().get('processes', 1),
+                 globals().get('cache_size', 0))
@@ -16,8 +16,9 @@ following differences:
 	3. However, it is possible to have an end loop operator ("]") 
 	without a preceding start loop operator ("["). In this case, 
 	the end loop operator ("]") will be ignored and execution continues.
-	4. Unclosed or unopened loops may result in non-deterministic 
-	behaviour.
+	4. Loop operators are matched as nested brackets (see 
+	register_machine.bracket_table); an unclosed start loop operator 
+	terminates the program and an unopened end loop operator is ignored.
 	5. All inputs are pre-defined at the start of the program.
 	
 @see: http://esolangs.org/wiki/Loose_Circular_Brainfuck_(LCBF)
@@ -72,49 +73,104 @@ def accept_predefined(array, apointer, inputdata, output, source, spointer):
 def cbf_start_loop(array, apointer, inputdata, output, source, spointer):
     '''
     Start loop. Operations after a start loop operator ("[") will only 
-    be executed provided the loop(s) are properly closed. If the loops 
-    are open, the program will terminate. Note that unclosed or unopened 
-    loops may result in non-deterministic behaviour. 
+    be executed provided the loop(s) are properly closed. If the loop is 
+    not closed (the start loop operator has no matching end loop operator 
+    in the bracket table), the program will terminate. 
     '''
     if array[apointer] > 0:
         return (array, apointer, inputdata, output, source, spointer)
+    table = r.bracket_table(source, '[', ']')
+    if spointer in table:
+        spointer = table[spointer]
     else:
-        count = 1
-        try:
-            while count > 0:
-                spointer = spointer + 1
-                if source[spointer] == ']':
-                    count = count - 1
-                if source[spointer] == '[':
-                    count = count + 1
-        except IndexError:
-            spointer = len(source) - 1
+        spointer = len(source) - 1
     return (array, apointer, inputdata, output, source, spointer)
 
 def cbf_end_loop(array, apointer, inputdata, output, source, spointer):
     '''
     End loop. However, it is possible to have an end loop operator 
-    ("]") without a preceding start loop operator ("["). In this case, 
-    the end loop operator ("]") will be ignored and execution continues. 
-    Note that unclosed or unopened loops may result in non-deterministic 
-    behaviour. 
+    ("]") without a preceding start loop operator ("["). In this case 
+    (the end loop operator has no matching start loop operator in the 
+    bracket table), the end loop operator ("]") will be ignored and 
+    execution continues. 
     '''
-    temp = spointer
     if array[apointer] < 1:
         return (array, apointer, inputdata, output, source, spointer + 1)
-    else:
-        count = 1
-        try:
-            while count > 0:
-                spointer = spointer - 1
-                if source[spointer] == ']':
-                    count = count + 1
-                if source[spointer] == '[':
-                    count = count - 1
-        except IndexError:
-            spointer = temp
+    table = r.bracket_table(source, '[', ']')
+    if spointer in table:
+        spointer = table[spointer]
     return (array, apointer, inputdata, output, source, spointer)
 
+def _increment(state):
+    '''
+    In-place form of increment (see register_machine.in_place).
+    '''
+    state.array[state.apointer] = state.array[state.apointer] + 1
+
+def _decrement(state):
+    '''
+    In-place form of decrement (see register_machine.in_place).
+    '''
+    state.array[state.apointer] = state.array[state.apointer] - 1
+
+def _forward(state):
+    '''
+    In-place form of forward (see register_machine.in_place).
+    '''
+    state.apointer = state.apointer + 1
+
+def _backward(state):
+    '''
+    In-place form of backward (see register_machine.in_place).
+    '''
+    state.apointer = state.apointer - 1
+
+def _call_out(state):
+    '''
+    In-place form of call_out (see register_machine.in_place).
+    '''
+    state.output.append(state.array[state.apointer])
+
+def _accept_predefined(state):
+    '''
+    In-place form of accept_predefined (see register_machine.in_place).
+    '''
+    if len(state.inputdata) > 0:
+        state.array[state.apointer] = state.inputdata.pop(0)
+    else: state.array[state.apointer] = 0
+
+def _cbf_start_loop(state):
+    '''
+    In-place form of cbf_start_loop (see register_machine.in_place).
+    '''
+    if state.array[state.apointer] > 0:
+        return
+    table = r.bracket_table(state.source, '[', ']')
+    if state.spointer in table:
+        state.spointer = table[state.spointer]
+    else:
+        state.spointer = len(state.source) - 1
+
+def _cbf_end_loop(state):
+    '''
+    In-place form of cbf_end_loop (see register_machine.in_place).
+    '''
+    if state.array[state.apointer] < 1:
+        state.spointer = state.spointer + 1
+        return
+    table = r.bracket_table(state.source, '[', ']')
+    if state.spointer in table:
+        state.spointer = table[state.spointer]
+
+increment.in_place = _increment
+decrement.in_place = _decrement
+forward.in_place = _forward
+backward.in_place = _backward
+call_out.in_place = _call_out
+accept_predefined.in_place = _accept_predefined
+cbf_start_loop.in_place = _cbf_start_loop
+cbf_end_loop.in_place = _cbf_end_loop
+
 LCBF = {'+': increment,
         '-': decrement,
         '>': forward,
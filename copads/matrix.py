@@ -18,6 +18,13 @@ class Vector(object):
     A list based vector class, based on the implementation by A. Pletzer
     (http://aspn.activestate.com/ASPN/Cookbook/Python/Recipe/52272), that
     supports elementwise mathematical operations.
+
+    The list of values may be shared with another object (such as the
+    data of a dataframe.Series, see typecast.tc_Series_Vector), or be a
+    shared array of floats (such as a float column of a
+    dataframe.Dataframe, see typecast.tc_Dataframe_Vector), in which case
+    Vector.shared is True and the values are copied into a list before
+    their first change by the vector.
     '''
     def __init__(self, values=[]):
         '''
@@ -27,6 +34,7 @@ class Vector(object):
         @type values: list
         '''
         self.values = [float(x) for x in values]
+        self.shared = False
 
     def zeros(self, num_of_elements):
         '''
@@ -366,6 +374,9 @@ class Vector(object):
         @param value: value to set.
         '''
         index = int(index)
+        if self.shared:
+            self.values = list(self.values)
+            self.shared = False
         self.values[index] = value
 
     def __getitem__(self, index, default_value=None):
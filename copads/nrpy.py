@@ -100,6 +100,74 @@ def SIGN(a, b):
 
 # End of Support Functions
 
+def amoeba(func, start, step=None, ftol=1.0e-10, itmax=5000):
+    """
+    Minimization of a function of one or more variables by downhill simplex
+    method of Nelder and Mead.
+    @see: NRC2 10.4
+
+    @param func: function to minimize, which takes a list of variables and
+    returns a float
+    @param start: list of starting values of the variables
+    @param step: list of initial step sizes of the variables. Default = 10%
+    of starting values (or 0.1 for zero starting values)
+    @param ftol: fractional tolerance of function value for convergence
+    @param itmax: maximum number of function evaluations
+    @return: (point, value) where point is the list of variables at the
+    minimum and value is the function value at the minimum
+    """
+    ndim = len(start)
+    if step is None:
+        step = [0.1 * x if x != 0 else 0.1 for x in start]
+    simplex = [list(start)]
+    for i in range(ndim):
+        point = list(start)
+        point[i] = point[i] + step[i]
+        simplex.append(point)
+    values = [func(p) for p in simplex]
+    nfunc = ndim + 1
+    while True:
+        order = sorted(range(ndim + 1), key=lambda i: values[i])
+        simplex = [simplex[i] for i in order]
+        values = [values[i] for i in order]
+        rtol = 2.0 * abs(values[-1] - values[0]) / \
+            (abs(values[-1]) + abs(values[0]) + 1.0e-20)
+        if rtol < ftol or nfunc >= itmax:
+            return (simplex[0], values[0])
+        centroid = [sum([p[j] for p in simplex[:-1]]) / ndim
+                    for j in range(ndim)]
+        def extrapolate(factor):
+            return [centroid[j] + factor * (simplex[-1][j] - centroid[j])
+                    for j in range(ndim)]
+        reflected = extrapolate(-1.0)
+        freflected = func(reflected)
+        nfunc = nfunc + 1
+        if freflected < values[0]:
+            expanded = extrapolate(-2.0)
+            fexpanded = func(expanded)
+            nfunc = nfunc + 1
+            if fexpanded < freflected:
+                (simplex[-1], values[-1]) = (expanded, fexpanded)
+            else:
+                (simplex[-1], values[-1]) = (reflected, freflected)
+        elif freflected < values[-2]:
+            (simplex[-1], values[-1]) = (reflected, freflected)
+        else:
+            if freflected < values[-1]:
+                contracted = extrapolate(-0.5)
+            else:
+                contracted = extrapolate(0.5)
+            fcontracted = func(contracted)
+            nfunc = nfunc + 1
+            if fcontracted < min(freflected, values[-1]):
+                (simplex[-1], values[-1]) = (contracted, fcontracted)
+            else:
+                for i in range(1, ndim + 1):
+                    simplex[i] = [0.5 * (simplex[0][j] + simplex[i][j])
+                                  for j in range(ndim)]
+                    values[i] = func(simplex[i])
+                nfunc = nfunc + ndim
+
 def bessi0(x):
     """
     Modified Bessel function I-sub-0(x).
@@ -884,7 +952,6 @@ def svdvar(v, ma, w, cvm):
     return cvm
 
 #def adi(): raise NotImplementedError
-#def amoeba(): raise NotImplementedError
 #def anneal(): raise NotImplementedError
 #def avevar(): raise NotImplementedError
 #def badluk(): raise NotImplementedError
@@ -6,7 +6,7 @@ Copyright (c) Maurice H.T. Ling <mauriceling@acm.org>
 Date created: 19th March 2008
 '''
 
-import types
+from array import array
 from .copadsexceptions import ParallelArrayError
 
 class ParallelArray(object):
@@ -14,20 +14,58 @@ class ParallelArray(object):
     Parallel Array is an array whereby each data list in the array is of
     the same size.
     Ref: http://en.wikipedia.org/wiki/Parallel_array
+
+    Each field is stored as a list, or as an array (array.array) of a
+    given type code (such as 'd' for double and 'q' for long long) for
+    typed fields. Typed fields use less memory and grow in amortized
+    constant time, but can only hold values of its type; hence, missing
+    values in typed fields are NaN for floating point type codes, and 0
+    for other type codes.
     '''
 
-    def __init__(self, fieldnames=[]):
+    def __init__(self, fieldnames=[], typecodes=None):
         '''
         Constructor method.
 
         @param fieldnames: field names to initiate. Default = empty list.
         @type fieldnames: list
+        @param typecodes: dictionary of {<field name>: <type code>} for
+        typed fields. Default = None (all fields are lists)
+        @type typecodes: dictionary
         '''
         self.data = {}
         self.fields = []
-        if len(fieldnames) > 0 and isinstance(fieldnames, types.ListType):
+        self.typecodes = {}
+        if typecodes is not None:
+            self.typecodes.update(typecodes)
+        if len(fieldnames) > 0 and isinstance(fieldnames, list):
             self.addFields(fieldnames)
 
+    @classmethod
+    def fromColumns(cls, columns, typecodes=None):
+        '''
+        Method to create a parallel array from columns of values (one
+        sequence of values for each field), without adding the values
+        record by record.
+
+        @param columns: dictionary of {<field name>: <sequence of values>},
+        where all sequences are of the same length.
+        @type columns: dictionary
+        @param typecodes: dictionary of {<field name>: <type code>} for
+        typed fields. Default = None (all fields are lists)
+        @type typecodes: dictionary
+        @return: ParallelArray object
+        '''
+        lengths = set([len(values) for values in columns.values()])
+        if len(lengths) > 1:
+            raise ParallelArrayError('columns must have the same number \
+            of elements')
+        parray = cls([], typecodes)
+        for fname in columns:
+            parray.fields.append(fname)
+            parray.data[fname] = parray._storage(fname, columns[fname])
+        return parray
+
     def fieldnames(self):
         '''
         Method to return a list of field names.
@@ -36,6 +74,44 @@ class ParallelArray(object):
         '''
         return self.fields
 
+    def field(self, fieldname):
+        '''
+        Method to get the values of a field without copying them. Typed
+        fields are returned as a memoryview of the array (changing the
+        memoryview changes the field, but the field cannot grow while the
+        memoryview is in use), and other fields are returned as the list.
+
+        @param fieldname: field name.
+        @type fieldname: string
+        @return: memoryview or list of values
+        '''
+        if fieldname not in self.data:
+            raise ParallelArrayError('field not found: ' + str(fieldname))
+        if fieldname in self.typecodes:
+            return memoryview(self.data[fieldname])
+        return self.data[fieldname]
+
+    def _storage(self, fieldname, values=()):
+        '''
+        Private method to generate the storage for the values of a field -
+        an array for typed fields, or a list.
+        '''
+        if fieldname in self.typecodes:
+            return array(self.typecodes[fieldname], values)
+        return list(values)
+
+    def _missing(self, fieldname):
+        '''
+        Private method to get the value for missing data in a field - None
+        for list fields, NaN for floating point arrays, and 0 for other
+        arrays.
+        '''
+        if fieldname not in self.typecodes:
+            return None
+        if self.typecodes[fieldname] in ('f', 'd'):
+            return float('nan')
+        return 0
+
     def _datalength(self):
         '''
         Private method to get the length of data (number of elements) for
@@ -48,22 +124,27 @@ class ParallelArray(object):
         else:
             return 0
 
-    def addFields(self, fieldnames):
+    def addFields(self, fieldnames, typecode=None):
         '''
         Method to add one or more field names.
 
         @param fieldnames: field names to add.
         @type fieldnames: list or string
+        @param typecode: type code for the added fields (typed fields).
+        Default = None (list fields)
+        @type typecode: string
         '''
-        self.fields = self.data.keys()
         datalength = self._datalength()
-        if isinstance(fieldnames, types.StringType):
+        if isinstance(fieldnames, str):
             fieldnames = [fieldnames]
         for fname in fieldnames:
-            if fname in self.fields:
+            if fname in self.data:
                 pass
             else:
-                self.data[fname] = [None] * datalength
+                if typecode is not None:
+                    self.typecodes[fname] = typecode
+                self.data[fname] = self._storage(fname,
+                    [self._missing(fname)] * datalength)
                 self.fields.append(fname)
 
     def removeField(self, fieldname):
@@ -74,12 +155,14 @@ class ParallelArray(object):
         @type fieldname: string
         @return: list of data from the removed data field.
         '''
-        if not isinstance(fieldname, types.StringType):
+        if not isinstance(fieldname, str):
             raise ParallelArrayError('fieldnames must be a string')
         if fieldname in self.fields:
             self.fields.remove(fieldname)
             data = [x for x in self.data[fieldname]]
             del self.data[fieldname]
+            if fieldname in self.typecodes:
+                del self.typecodes[fieldname]
             return data
         else:
             return []
@@ -104,9 +187,9 @@ class ParallelArray(object):
         @type values: list
         '''
         record = {}
-        if not isinstance(fieldnames, types.ListType):
+        if not isinstance(fieldnames, list):
             raise ParallelArrayError('fieldnames must be a list')
-        if not isinstance(values, types.ListType):
+        if not isinstance(values, list):
             raise ParallelArrayError('values must be a string')
         if len(fieldnames) != len(values):
             raise ParallelArrayError('fieldnames and values must have \
@@ -131,14 +214,59 @@ class ParallelArray(object):
         @param record: data record to be added.
         @type record: dictionary
         '''
-        self.fields = self.data.keys()
+        self.extend([record])
+
+    def extend(self, records):
+        '''
+        Method to add many data records (dictionaries, as in
+        addDataDictionary) at once. Field names are gathered once for all
+        the records, and the values of each field are appended to the field
+        in a single operation. If any value cannot be stored in its field
+        (such as a string in a typed field), no record is added.
+
+        @param records: list of data records to be added.
+        @type records: list
+        '''
+        records = list(records)
+        fieldnames = list(self.fields)
+        known = set(self.data)
+        for record in records:
+            for k in record:
+                if k not in known:
+                    known.add(k)
+                    fieldnames.append(k)
+        columns = {}
+        for k in fieldnames:
+            missing = self._missing(k)
+            columns[k] = self._storage(k, [record.get(k, missing)
+                                           for record in records])
+        self._appendColumns(fieldnames, columns, len(records))
+
+    def _appendColumns(self, fieldnames, columns, count):
+        '''
+        Private method to append prepared values (from _storage, each of
+        count elements) to the fields, adding the fields not in the array.
+        The values are cast before any field is changed, and the appended
+        values are removed if a field cannot grow (BufferError), hence, the
+        fields always have the same number of elements.
+        '''
         datalength = self._datalength()
-        self.addFields(record.keys()) # in case there are new fields
-        for k in record:
-            self.data[k].append(record[k])
-        for nk in [k for k in self.fields
-                   if k not in record.keys()]:
-            self.data[nk].append(None)
+        extended = []
+        try:
+            for k in self.fields:
+                self.data[k].extend(columns[k])
+                extended.append(k)
+        except BufferError:
+            if count > 0:
+                for k in extended:
+                    del self.data[k][-count:]
+            raise
+        for k in fieldnames:
+            if k not in self.data:
+                self.data[k] = self._storage(k,
+                    [self._missing(k)] * datalength)
+                self.data[k].extend(columns[k])
+                self.fields.append(k)
 
     def changeFieldname(self, original_name, new_name):
         '''
@@ -150,8 +278,7 @@ class ParallelArray(object):
         @type new_name: string
         '''
         if original_name in self.data:
-            data = self.removeField(original_name)
-            self.data[new_name] = data
-        self.fields = self.data.keys()
-
-
+            self.data[new_name] = self.data.pop(original_name)
+            self.fields[self.fields.index(original_name)] = new_name
+            if original_name in self.typecodes:
+                self.typecodes[new_name] = self.typecodes.pop(original_name)
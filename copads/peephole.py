@@ -0,0 +1,244 @@
+'''
+Peephole Optimizer for Register Machine Programs
+Date created: 18th October 2026
+Licence: Python Software Foundation License version 2
+
+Optimizes compiled programs (register_machine.Program) of Loose Circular
+Brainfuck (LCBF), NucleotideBF (nBF) and Ragaraja by replacing sequences
+of instructions with macros, which are executed in a single step of the
+register machine:
+    1. Runs of increment, decrement, forward and backward operations are
+    folded into a single change of tape cells and tape position.
+    2. Loops of increment, decrement, forward and backward operations which
+    do not move the tape position and decrease the current cell by 1 in
+    each iteration - such as clear-cell loops ("[-]" in LCBF, "014011015"
+    in Ragaraja) and multiply-move loops ("[->++<]" in LCBF) - are executed
+    as multiplications.
+    3. Loops directly after such a loop are never entered as the current
+    cell is 0, and are skipped by the macro of the loop.
+
+The results (including the number of instructions executed, which is
+limited by max_instructions) are the same as those of the unoptimized
+program. Macros are only executed on tape cells of integers and a tape
+position within the tape; otherwise, the sequence of instructions is
+executed one by one. The results can be checked against the unoptimized
+program using verify.
+
+>>> import copads.register_machine as r
+>>> import copads.lc_bf as L
+>>> import copads.peephole as p
+>>> result = r.interpret('+++++[>++<-]', L.LCBF, optimizer=p.optimize)
+'''
+
+import random
+
+from . import register_machine as r
+from . import lc_bf
+from . import ragaraja
+
+# {<function>: (<tape move>, <change of cell value>)}
+_steps = {lc_bf.increment: (0, 1),
+          lc_bf.decrement: (0, -1),
+          lc_bf.forward: (1, 0),
+          lc_bf.backward: (-1, 0)}
+
+# {<loop start function>: (<loop start instruction>, <loop end
+# instruction>, <loop end function>, <characters skipped after loop end>,
+# <number of instructions to skip a loop>)}
+_loops = {lc_bf.cbf_start_loop: ('[', ']', lc_bf.cbf_end_loop, 1, 1),
+          ragaraja.loop_start: ('014', '015', ragaraja.loop_end, 0, 2)}
+
+class _Run(object):
+    '''
+    Macro for a run of increment, decrement, forward and backward
+    operations.
+    '''
+    def __init__(self, changes, move, count, last):
+        self.changes = changes
+        self.move = move
+        self.count = count
+        self.last = last
+
+    def __call__(self, array, apointer, size, budget):
+        if self.count > budget or not 0 <= apointer < size:
+            return None
+        cells = [((apointer + offset) % size, change)
+                 for (offset, change) in self.changes]
+        for (cell, change) in cells:
+            if cell >= len(array) or type(array[cell]) is not int:
+                return None
+        for (cell, change) in cells:
+            array[cell] = array[cell] + change
+        return ((apointer + self.move) % size, self.count, self.last)
+
+class _Loop(object):
+    '''
+    Macro for a clear-cell or multiply-move loop, and the loops which are
+    skipped after it.
+    '''
+    def __init__(self, changes, body, last, skipped):
+        self.changes = changes
+        self.body = body
+        self.last = last
+        self.skipped = skipped
+
+    def __call__(self, array, apointer, size, budget):
+        if not 0 <= apointer < size or apointer >= len(array):
+            return None
+        value = array[apointer]
+        if type(value) is not int or value < 1:
+            return None
+        cells = {}
+        for (offset, change) in self.changes:
+            cell = (apointer + offset) % size
+            cells[cell] = cells.get(cell, 0) + change
+        if cells.pop(apointer, 0) != -1:
+            return None
+        for cell in cells:
+            if cell >= len(array) or type(array[cell]) is not int:
+                return None
+        count = 1 + value * (self.body + 1)
+        if count > budget:
+            return None
+        for cell in cells:
+            array[cell] = array[cell] + cells[cell] * value
+        array[apointer] = 0
+        last = self.last
+        for (skipped_last, skipped_count) in self.skipped:
+            if count + skipped_count > budget:
+                break
+            count = count + skipped_count
+            last = skipped_last
+        return (apointer, count, last)
+
+def _handler(program, position):
+    '''
+    Private function to get the function / operation at a source position,
+    or None if the instruction is not a function / operation.
+    '''
+    if position >= len(program.source):
+        return None
+    opcode = program.opcodes[position]
+    if opcode < 0:
+        return None
+    return program.handlers[opcode]
+
+def _fold(program, start, end):
+    '''
+    Private function to fold the increment, decrement, forward and
+    backward operations from start (inclusive) to end (exclusive) source
+    positions into a list of (<tape offset>, <change of cell value>) and
+    the tape move; or None if there are other operations.
+    '''
+    changes = {}
+    move = 0
+    for position in range(start, end, program.function_size):
+        step = _steps.get(_handler(program, position))
+        if step is None:
+            return None
+        move = move + step[0]
+        if step[0] == 0:
+            changes[move] = changes.get(move, 0) + step[1]
+    return (sorted(changes.items()), move)
+
+def _loop(program, start):
+    '''
+    Private function to generate the macro of a clear-cell or multiply-move
+    loop starting at a source position, or None if the loop is not a
+    clear-cell or multiply-move loop.
+    '''
+    (open_token, close_token, end_function,
+        skip, skip_count) = _loops[_handler(program, start)]
+    function_size = program.function_size
+    table = r.bracket_table(program.source, open_token, close_token,
+                            function_size)
+    end = table.get(start, -1)
+    if end <= start or _handler(program, end) is not end_function:
+        return None
+    folded = _fold(program, start + function_size, end)
+    if folded is None or folded[1] != 0 or dict(folded[0]).get(0) != -1:
+        return None
+    skipped = []
+    position = end + skip + function_size
+    while _handler(program, position) is _handler(program, start) and \
+        table.get(position, -1) > position:
+        skipped.append((table[position], skip_count))
+        position = table[position] + function_size
+    body = (end - start) // function_size - 1
+    return _Loop(folded[0], body, end + skip, skipped)
+
+def optimize(program):
+    '''
+    Function to generate the macros of a compiled program, to be used as
+    the optimizer of register_machine.Program or register_machine.interpret.
+
+    @param program: Compiled program to optimize.
+    @type program: register_machine.Program object
+    @return: dictionary of {<source position>: <macro>}
+    '''
+    macros = {}
+    function_size = program.function_size
+    length = len(program.source)
+    position = 0
+    while position < length:
+        handler = _handler(program, position)
+        if handler in _loops:
+            macro = _loop(program, position)
+            if macro is not None:
+                macros[position] = macro
+        end = position
+        while end < length and _handler(program, end) in _steps:
+            end = end + function_size
+        if end - position > function_size:
+            (changes, move) = _fold(program, position, end)
+            macros[position] = _Run(changes, move,
+                                    (end - position) // function_size,
+                                    end - function_size)
+        position = max(end, position + function_size)
+    return macros
+
+def verify(source, functions, function_size=1, inputdata=[],
+           array=None, size=30, max_instructions=1000):
+    '''
+    Function to check that the optimized program gives the same results
+    as the unoptimized program (the reference interpreter). The program
+    is executed twice from the same state of the random number generator
+    and Ragaraja registers, and the results (tape, tape position, input
+    list, output list, source and source position, or the exception
+    raised) are compared.
+
+    @param source: Instructions to execute.
+    @type source: string
+    @param functions: Dictionary of functions / operations.
+    @param function_size: Length of each instruction. Default = 1
+    @type function_size: integer
+    @param inputdata: Any input data that the function may need.
+    @type inputdata: list
+    @param array: The tape. Default = None (tape of zeros)
+    @type array: list
+    @param size: Length of the tape. Default = 30
+    @type size: integer
+    @param max_instructions: The maximum number of instructions to execute.
+    Default = 1000
+    @type max_instructions: integer
+    @return: tuple of (<boolean, True if the results are the same>,
+    <results of the unoptimized program>, <results of the optimized
+    program>), where the results are the exception raised if execution
+    fails
+    '''
+    state = random.getstate()
+    register = [x for x in ragaraja.register]
+    results = []
+    for optimizer in (None, optimize):
+        random.setstate(state)
+        ragaraja.register[:] = register
+        tape = None
+        if array is not None:
+            tape = [x for x in array]
+        try:
+            results.append(r.interpret(source, functions, function_size,
+                                       [x for x in inputdata], tape, size,
+                                       max_instructions, optimizer))
+        except Exception as error:
+            results.append(error)
+    return (repr(results[0]) == repr(results[1]), results[0], results[1])
@@ -35,6 +35,15 @@ The interpreter environment consists of the following elements:
 When the program terminates, all 4 elements are returned, and the 
 interpreter terminates itself. 
 
+Instructions are grouped into handlers (such as mathematics and 
+register_IO). Handlers with many instructions look up the operation of 
+the instruction in a table of {<instruction>: <operation>}, where each 
+operation is a small function which changes the state of the interpreter 
+(see register_machine.State) for one instruction. When instructions are 
+activated (see activate_version), each activated instruction with an 
+operation is bound to a function executing the operation; hence, 
+executing an instruction is a single lookup in the ragaraja dictionary.
+
 @see: http://esolangs.org/wiki/Ragaraja
 '''
 import random
@@ -43,6 +52,7 @@ from .samplestatistics import SingleSample
 from .lc_bf import increment, decrement
 from .lc_bf import forward, backward
 from .lc_bf import call_out, accept_predefined
+from .register_machine import bracket_table, State
 
 register = [0]*99
 
@@ -61,16 +71,11 @@ def loop_start(array, apointer, inputdata, output, source, spointer):
     '''
     if array[apointer] > 0:
         return (array, apointer, inputdata, output, source, spointer)
+    table = bracket_table(source, '014', '015', 3)
+    if spointer in table:
+        return (array, apointer, inputdata, output, source, table[spointer] - 3)
     else:
-        count = 1
-        try:
-            while count > 0:
-                spointer = spointer + 3
-                if source[spointer:spointer+3] == '015': count = count - 1
-                if source[spointer:spointer+3] == '014': count = count + 1
-            return (array, apointer, inputdata, output, source, spointer - 3)
-        except IndexError:
-            return (array, apointer, inputdata, output, source, len(source) - 1)
+        return (array, apointer, inputdata, output, source, len(source) - 1)
 
 def loop_end(array, apointer, inputdata, output, source, spointer):
     '''
@@ -79,20 +84,140 @@ def loop_end(array, apointer, inputdata, output, source, spointer):
     In this case, the end loop operator (command 015) will be ignored and 
     execution continues. 
     '''
-    temp = spointer
     if array[apointer] < 1:
         return (array, apointer, inputdata, output, source, spointer)
-    else:
-        count = 1
-        try:
-            while count > 0:
-                spointer = spointer - 3
-                if source[spointer:spointer+3] == '015': count = count + 1
-                if source[spointer:spointer+3] == '014': count = count - 1
-        except IndexError:
-            spointer = temp
+    table = bracket_table(source, '014', '015', 3)
+    if spointer in table:
+        spointer = table[spointer]
     return (array, apointer, inputdata, output, source, spointer)
 
+def _loop_start(state):
+    '''
+    In-place form of loop_start (see register_machine.in_place).
+    '''
+    if state.array[state.apointer] > 0:
+        return
+    table = bracket_table(state.source, '014', '015', 3)
+    if state.spointer in table:
+        state.spointer = table[state.spointer] - 3
+    else:
+        state.spointer = len(state.source) - 1
+
+def _loop_end(state):
+    '''
+    In-place form of loop_end (see register_machine.in_place).
+    '''
+    if state.array[state.apointer] < 1:
+        return
+    table = bracket_table(state.source, '014', '015', 3)
+    if state.spointer in table:
+        state.spointer = table[state.spointer]
+
+loop_start.in_place = _loop_start
+loop_end.in_place = _loop_end
+
+def _operate(table, state):
+    '''
+    Private function to execute the instruction at the source position 
+    by its operation in a table of {<instruction>: <operation>}, where an 
+    operation takes the state of the interpreter (see 
+    register_machine.State) and changes it. Instructions which are not in 
+    the table are not executed.
+    '''
+    operation = table.get(state.source[state.spointer:state.spointer+3])
+    if operation is not None:
+        operation(state)
+
+def _cell(function):
+    '''
+    Private function to make the operation setting the current cell to 
+    function(<value of the current cell>).
+    '''
+    def operation(state):
+        state.array[state.apointer] = function(state.array[state.apointer])
+    return operation
+
+def _set(value):
+    '''
+    Private function to make the operation setting the current cell to 
+    a value.
+    '''
+    def operation(state):
+        state.array[state.apointer] = value
+    return operation
+
+def _following(function):
+    '''
+    Private function to make the operation setting the current cell to 
+    function(<value of the current cell>, <value of the next cell>), 
+    where the next cell of the last cell is the first cell.
+    '''
+    def operation(state):
+        array = state.array
+        apointer = state.apointer
+        if (apointer + 1) < len(array):
+            array[apointer] = function(array[apointer], array[apointer+1])
+        else:
+            array[apointer] = function(array[apointer], array[0])
+    return operation
+
+def _input(function, index):
+    '''
+    Private function to make the operation setting the current cell to 
+    function(<value of the current cell>, <value of the input list at 
+    index>), if the input list is not empty.
+    '''
+    def operation(state):
+        if len(state.inputdata) > 0:
+            state.array[state.apointer] = \
+                function(state.array[state.apointer], state.inputdata[index])
+    return operation
+
+def _summarize(function):
+    '''
+    Private function to make the operation setting the current cell to 
+    function(<tape>, <tape position>).
+    '''
+    def operation(state):
+        state.array[state.apointer] = function(state.array, state.apointer)
+    return operation
+
+def _tape(function):
+    '''
+    Private function to make the operation replacing the tape by 
+    function(<tape>, <tape position>).
+    '''
+    def operation(state):
+        state.array = function(state.array, state.apointer)
+    return operation
+
+def _move(function):
+    '''
+    Private function to make the operation moving the tape pointer to 
+    function(<tape>, <tape position>, <output list>).
+    '''
+    def operation(state):
+        state.apointer = function(state.array, state.apointer, state.output)
+    return operation
+
+def _skip(offset):
+    '''
+    Private function to make the operation moving the source pointer by 
+    an offset (in characters), if the source pointer does not point 
+    beyond the source after the move.
+    '''
+    def operation(state):
+        spointer = state.spointer + offset
+        if 0 <= spointer < len(state.source):
+            state.spointer = spointer
+    return operation
+
+def _mean(values):
+    '''
+    Private function to calculate the arithmetic mean of values.
+    '''
+    return sum(values) / float(len(values))
+
 def tape_move(array, apointer, inputdata, output, source, spointer):
     '''
     Moving tape pointer for more than one increment or decrement.
@@ -146,27 +271,46 @@ def tape_move(array, apointer, inputdata, output, source, spointer):
         the tape, it will move to the modulus of the integer value in the 
         current cell. 
     '''
-    cmd = source[spointer:spointer+3]
-    if cmd == '001': apointer = apointer + 5
-    if cmd == '002': apointer = apointer + 10
-    if cmd == '003': 
-        move = int(float(array[apointer]) * float(array[apointer]))
-        apointer = apointer + move
-    if cmd == '005': apointer = apointer - 5
-    if cmd == '006': apointer = apointer - 10
-    if cmd == '007': 
-        move = int(float(array[apointer]) * float(array[apointer]))
-        apointer = (apointer - move) % (len(array) - 1)
-    if cmd == '043': apointer = 0
-    if cmd == '044': apointer = len(array) - 1
-    if cmd == '045': apointer = int(output[-1]) % (len(array) - 1)
-    if cmd == '061': apointer = apointer + int(array[apointer])
-    if cmd == '062': apointer = apointer - int(array[apointer])
-    if cmd == '140': apointer = int((len(array) - 1) * 0.5)
-    if cmd == '141': apointer = int((len(array) - 1) * 0.25)
-    if cmd == '142': apointer = int((len(array) - 1) * 0.75)
-    if cmd == '143': apointer = int(array[apointer]) % (len(array) - 1)
-    return (array, apointer, inputdata, output, source, spointer)
+    state = State(array, apointer, inputdata, output, source, spointer)
+    _tape_move(state)
+    return state.results()
+
+def _tape_move(state):
+    '''
+    In-place form of tape_move (see register_machine.in_place).
+    '''
+    _operate(_tape_move_operations, state)
+
+_tape_move_operations = {
+    '001': _move(lambda array, apointer, output: apointer + 5),
+    '002': _move(lambda array, apointer, output: apointer + 10),
+    '003': _move(lambda array, apointer, output: 
+                 apointer + int(float(array[apointer]) * 
+                                float(array[apointer]))),
+    '005': _move(lambda array, apointer, output: apointer - 5),
+    '006': _move(lambda array, apointer, output: apointer - 10),
+    '007': _move(lambda array, apointer, output: 
+                 (apointer - int(float(array[apointer]) * 
+                                 float(array[apointer]))) % 
+                 (len(array) - 1)),
+    '043': _move(lambda array, apointer, output: 0),
+    '044': _move(lambda array, apointer, output: len(array) - 1),
+    '045': _move(lambda array, apointer, output: 
+                 int(output[-1]) % (len(array) - 1)),
+    '061': _move(lambda array, apointer, output: 
+                 apointer + int(array[apointer])),
+    '062': _move(lambda array, apointer, output: 
+                 apointer - int(array[apointer])),
+    '140': _move(lambda array, apointer, output: 
+                 int((len(array) - 1) * 0.5)),
+    '141': _move(lambda array, apointer, output: 
+                 int((len(array) - 1) * 0.25)),
+    '142': _move(lambda array, apointer, output: 
+                 int((len(array) - 1) * 0.75)),
+    '143': _move(lambda array, apointer, output: 
+                 int(array[apointer]) % (len(array) - 1)),
+    }
+tape_move.in_place = _tape_move
 
 def accumulations(array, apointer, inputdata, output, source, spointer):
     '''
@@ -180,14 +324,25 @@ def accumulations(array, apointer, inputdata, output, source, spointer):
         - 032: Double current tape cell value.
         - 033: Half current tape cell value. 
     '''
-    cmd = source[spointer:spointer+3]
-    if cmd == '009': array[apointer] = array[apointer] + 5
-    if cmd == '010': array[apointer] = array[apointer] + 10
-    if cmd == '012': array[apointer] = array[apointer] - 5
-    if cmd == '013': array[apointer] = array[apointer] - 10
-    if cmd == '032': array[apointer] = 2 * array[apointer]
-    if cmd == '033': array[apointer] = 0.5 * array[apointer]
-    return (array, apointer, inputdata, output, source, spointer)
+    state = State(array, apointer, inputdata, output, source, spointer)
+    _accumulations(state)
+    return state.results()
+
+def _accumulations(state):
+    '''
+    In-place form of accumulations (see register_machine.in_place).
+    '''
+    _operate(_accumulations_operations, state)
+
+_accumulations_operations = {
+    '009': _cell(lambda x: x + 5),
+    '010': _cell(lambda x: x + 10),
+    '012': _cell(lambda x: x - 5),
+    '013': _cell(lambda x: x - 10),
+    '032': _cell(lambda x: 2 * x),
+    '033': _cell(lambda x: 0.5 * x),
+    }
+accumulations.in_place = _accumulations
 
 def nBF_random_op(array, apointer, inputdata, output, source, spointer):
     '''
@@ -345,8 +500,12 @@ def tape_size(array, apointer, inputdata, output, source, spointer):
         As a result, the tape is 1 cell shorter. 
     '''
     cmd = source[spointer:spointer+3]
-    if cmd == '016': array = array + [0]
-    if cmd == '017': array = array + [0]*10
+    if cmd == '016':
+        array = array[:]
+        array.append(0)
+    if cmd == '017':
+        array = array[:]
+        array.extend([0]*10)
     if cmd == '018': array = array[:-1]
     if cmd == '019': array = array[:-10]
     if cmd == '034': array.insert(apointer + 1, 0)
@@ -388,26 +547,45 @@ def source_move(array, apointer, inputdata, output, source, spointer):
         source pointer. For example, if current cell is "5.6" or "5", the next 
         5 instructions will be skipped.
     '''
-    cmd = source[spointer:spointer+3]
-    if cmd == '023' and (spointer + 3) < len(source):
-        spointer = spointer + 3
-    if cmd == '024' and (spointer + 15) < len(source):
-        spointer = spointer + 15
-    if cmd == '025' and (spointer + 30) < len(source):
-        spointer = spointer + 30
-    if cmd == '026' and (spointer - 3) >= 0:
-        spointer = spointer - 3
-    if cmd == '027' and (spointer - 15) >= 0:
-        spointer = spointer - 15
-    if cmd == '028' and (spointer - 30) >= 0:
-        spointer = spointer - 30
-    if cmd == '082' and array[apointer] == 0 and \
-    (spointer + 3) <= len(source):
-        spointer = spointer + 3
-    if cmd == '083' and \
-    (spointer + (3 * abs(int(array[apointer])))) < len(source):
-        spointer = spointer + (3 * abs(int(array[apointer])))
-    return (array, apointer, inputdata, output, source, spointer)
+    state = State(array, apointer, inputdata, output, source, spointer)
+    _source_move(state)
+    return state.results()
+
+def _skip_zero(state):
+    '''
+    Private function for the operation of instruction 082 (see 
+    source_move).
+    '''
+    if state.array[state.apointer] == 0 and \
+    (state.spointer + 3) <= len(state.source):
+        state.spointer = state.spointer + 3
+
+def _skip_cell(state):
+    '''
+    Private function for the operation of instruction 083 (see 
+    source_move).
+    '''
+    offset = 3 * abs(int(state.array[state.apointer]))
+    if (state.spointer + offset) < len(state.source):
+        state.spointer = state.spointer + offset
+
+def _source_move(state):
+    '''
+    In-place form of source_move (see register_machine.in_place).
+    '''
+    _operate(_source_move_operations, state)
+
+_source_move_operations = {
+    '023': _skip(3),
+    '024': _skip(15),
+    '025': _skip(30),
+    '026': _skip(-3),
+    '027': _skip(-15),
+    '028': _skip(-30),
+    '082': _skip_zero,
+    '083': _skip_cell,
+    }
+source_move.in_place = _source_move
     
 def set_tape_value(array, apointer, inputdata, output, source, spointer):
     '''
@@ -438,29 +616,42 @@ def set_tape_value(array, apointer, inputdata, output, source, spointer):
         - 195: Set all the cell values in the cells before the current cell 
         to the tape position of current cell. 
     '''
-    cmd = source[spointer:spointer+3]
-    if cmd == '084': array[apointer] = 0
-    if cmd == '085': array[apointer] = -1
-    if cmd == '086': array[apointer] = 1
-    if cmd == '097': array[apointer] = math.pi
-    if cmd == '098': array[apointer] = math.e
-    if cmd == '187': 
-        array = array[0:apointer+1] + [0 for x in array[apointer+1:]]
-    if cmd == '188': 
-        array = [0 for x in array[:apointer]] + array[apointer:]
-    if cmd == '189': array = [0] * len(array)
-    if cmd == '190': array = [array[apointer]] * len(array)
-    if cmd == '191': array = [apointer] * len(array)
-    if cmd == '192': 
-        array = array[0:apointer+1] + [array[apointer] 
-                                       for x in array[apointer+1:]]
-    if cmd == '193': 
-        array = [array[apointer] for x in array[:apointer]] + array[apointer:]
-    if cmd == '194': 
-        array = array[0:apointer+1] + [apointer for x in array[apointer+1:]]
-    if cmd == '195': 
-        array = [apointer for x in array[:apointer]] + array[apointer:]
-    return (array, apointer, inputdata, output, source, spointer)
+    state = State(array, apointer, inputdata, output, source, spointer)
+    _set_tape_value(state)
+    return state.results()
+
+def _set_tape_value(state):
+    '''
+    In-place form of set_tape_value (see register_machine.in_place).
+    '''
+    _operate(_set_tape_value_operations, state)
+
+_set_tape_value_operations = {
+    '084': _set(0),
+    '085': _set(-1),
+    '086': _set(1),
+    '097': _set(math.pi),
+    '098': _set(math.e),
+    '187': _tape(lambda array, apointer: 
+                 array[0:apointer+1] + [0 for x in array[apointer+1:]]),
+    '188': _tape(lambda array, apointer: 
+                 [0 for x in array[:apointer]] + array[apointer:]),
+    '189': _tape(lambda array, apointer: [0] * len(array)),
+    '190': _tape(lambda array, apointer: [array[apointer]] * len(array)),
+    '191': _tape(lambda array, apointer: [apointer] * len(array)),
+    '192': _tape(lambda array, apointer: 
+                 array[0:apointer+1] + [array[apointer] 
+                                        for x in array[apointer+1:]]),
+    '193': _tape(lambda array, apointer: 
+                 [array[apointer] for x in array[:apointer]] + 
+                 array[apointer:]),
+    '194': _tape(lambda array, apointer: 
+                 array[0:apointer+1] + [apointer 
+                                        for x in array[apointer+1:]]),
+    '195': _tape(lambda array, apointer: 
+                 [apointer for x in array[:apointer]] + array[apointer:]),
+    }
+set_tape_value.in_place = _set_tape_value
     
 def mathematics(array, apointer, inputdata, output, source, spointer):
     '''
@@ -631,141 +822,121 @@ def mathematics(array, apointer, inputdata, output, source, spointer):
         - 198: Set the value of the current cell to the harmonic mean of 
         the values in the tape. 
     '''
-    cmd = source[spointer:spointer+3]
-    if cmd == '065':
-        if (apointer + 1) < len(array):
-            array[apointer] = array[apointer] + array[apointer+1]
-        else:
-            array[apointer] = array[apointer] + array[0]
-    if cmd == '066' and len(inputdata) > 0:
-        array[apointer] = array[apointer] + inputdata[0]
-    if cmd == '067' and len(inputdata) > 0:
-        array[apointer] = array[apointer] + inputdata[-1]
-    if cmd == '068':
-        if (apointer + 1) < len(array):
-            array[apointer] = array[apointer+1] - array[apointer]
-        else:
-            array[apointer] = array[0] - array[apointer]
-    if cmd == '069' and len(inputdata) > 0:
-        array[apointer] = inputdata[0] - array[apointer]
-    if cmd == '070' and len(inputdata) > 0:
-        array[apointer] = inputdata[-1] - array[apointer]
-    if cmd == '071': 
-        if (apointer + 1) < len(array):
-            array[apointer] = array[apointer+1] * array[apointer]
-        else:
-            array[apointer] = array[0] * array[apointer]
-    if cmd == '072' and len(inputdata) > 0:
-        array[apointer] = inputdata[0] * array[apointer]
-    if cmd == '073' and len(inputdata) > 0:
-        array[apointer] = inputdata[-1] * array[apointer]
-    if cmd == '074':
-        if (apointer + 1) < len(array):
-            array[apointer] = float(array[apointer+1]) / array[apointer]
-        else:
-            array[apointer] = array[0] / array[apointer]
-    if cmd == '075' and len(inputdata) > 0:
-        array[apointer] = float(inputdata[0]) / array[apointer]
-    if cmd == '076' and len(inputdata) > 0:
-        array[apointer] = float(inputdata[-1]) / array[apointer]
-    if cmd == '077':
-        if (apointer + 1) < len(array):
-            array[apointer] = array[apointer+1] % array[apointer]
-        else:
-            array[apointer] = array[0] % array[apointer]
-    if cmd == '078' and len(inputdata) > 0:
-        array[apointer] = inputdata[0] % array[apointer]
-    if cmd == '079' and len(inputdata) > 0:
-        array[apointer] = inputdata[-1] % array[apointer]
-    if cmd == '080': array[apointer] = int(array[apointer])
-    if cmd == '087': array[apointer] = -1 * array[apointer]
-    if cmd == '088': array[apointer] = math.sin(array[apointer])
-    if cmd == '089': array[apointer] = math.cos(array[apointer])
-    if cmd == '090': array[apointer] = math.tan(array[apointer])
-    if cmd == '091': array[apointer] = math.asin(array[apointer])
-    if cmd == '092': array[apointer] = math.acos(array[apointer])
-    if cmd == '093': array[apointer] = math.atan(array[apointer])
-    if cmd == '094': array[apointer] = 1 / array[apointer]
-    if cmd == '095': array[apointer] = math.sqrt(array[apointer])
-    if cmd == '096': array[apointer] = math.log(array[apointer], math.e)
-    if cmd == '099': array[apointer] = math.sinh(array[apointer])
-    if cmd == '100': array[apointer] = math.cosh(array[apointer])
-    if cmd == '101': array[apointer] = math.tanh(array[apointer])
-    if cmd == '102': array[apointer] = math.asinh(array[apointer])
-    if cmd == '103': array[apointer] = math.acosh(array[apointer])
-    if cmd == '104': array[apointer] = math.atanh(array[apointer])
-    if cmd == '105': array[apointer] = math.degrees(array[apointer])
-    if cmd == '106': array[apointer] = math.radians(array[apointer])
-    if cmd == '107': array[apointer] = array[apointer] ** math.e
-    if cmd == '108': array[apointer] = math.e ** array[apointer]
-    if cmd == '109': array[apointer] = 10 ** array[apointer]
-    if cmd == '110': 
-        if (apointer + 1) < len(array):
-            array[apointer] = array[apointer] ** array[apointer+1]
-        else:
-            array[apointer] = array[apointer] ** array[0]
-    if cmd == '111':
-        if (apointer + 1) < len(array):
-            array[apointer] = array[apointer] ** (1 / array[apointer+1])
-        else:
-            array[apointer] = array[apointer] ** (1 / array[0])
-    if cmd == '112': array[apointer] = math.erf(array[apointer])
-    if cmd == '113': array[apointer] = math.erfc(array[apointer])
-    if cmd == '114' and array[apointer] >= 0:
-        array[apointer] = math.factorial(int(array[apointer]))
-    if cmd == '115': array[apointer] = math.factorial(abs(int(array[apointer])))
-    if cmd == '116':
-        if (apointer + 1) < len(array):
-            array[apointer] = math.hypot(array[apointer], array[apointer+1])
-        else:
-            array[apointer] = math.hypot(array[apointer], array[0])    
-    if cmd == '117':
-        if (apointer + 1) < len(array):
-            array[apointer] = math.log(array[apointer], array[apointer+1])
-        else:
-            array[apointer] = math.log(array[apointer], array[0])
-    if cmd == '144': array[apointer] = 0.1 * (array[apointer])
-    if cmd == '145': array[apointer] = 10 * (array[apointer])
-    if cmd == '146': array[apointer] = sum(array[apointer+1:])
-    if cmd == '147': array[apointer] = sum(array[apointer:])
-    if cmd == '148': array[apointer] = sum(array[0:apointer])
-    if cmd == '149': array[apointer] = sum(array[0:apointer+1])
-    if cmd == '150': array[apointer] = sum(array)
-    if cmd == '151':
-        temp = array[apointer+1:]
-        array[apointer] = sum(temp) / float(len(temp))
-    if cmd == '152':
-        temp = array[apointer:]
-        array[apointer] = sum(temp) / float(len(temp))
-    if cmd == '153':
-        temp = array[0:apointer]
-        array[apointer] = sum(temp) / float(len(temp))
-    if cmd == '154':
-        temp = array[0:apointer+1]
-        array[apointer] = sum(temp) / float(len(temp))
-    if cmd == '155': array = [0.5 * x for x in array]
-    if cmd == '156': array = [2 * x for x in array]
-    if cmd == '157': array = [0.1 * x for x in array]
-    if cmd == '158': array = [10 * x for x in array]
-    if cmd == '159': array = [0.01 * x for x in array]
-    if cmd == '160': array = [100 * x for x in array]
-    if cmd == '165': array = [-1 * x for x in array]
-    if cmd == '166': 
-        array = array[0:apointer+1] + [x * x for x in array[apointer+1:]]
-    if cmd == '167': 
-        array = [x * x for x in array[:apointer]] + array[apointer:]
-    if cmd == '168': array = [x * x for x in array]
-    if cmd == '169': array = [math.sqrt(x) for x in array]
-    if cmd == '170': 
-        array = array[0:apointer+1] + [math.sqrt(x) for x in array[apointer+1:]]
-    if cmd == '171': 
-        array = [math.sqrt(x) for x in array[:apointer]] + array[apointer:]
-    if cmd == '196': 
-        variance = SingleSample(array).variance()
-        array[apointer] = math.sqrt(variance)
-    if cmd == '197': array[apointer] = SingleSample(array).geometricMean()
-    if cmd == '198': array[apointer] = SingleSample(array).harmonicMean()
-    return (array, apointer, inputdata, output, source, spointer)
+    state = State(array, apointer, inputdata, output, source, spointer)
+    _mathematics(state)
+    return state.results()
+
+def _divide_following(state):
+    '''
+    Private function for the operation of instruction 074 (see 
+    mathematics).
+    '''
+    array = state.array
+    apointer = state.apointer
+    if (apointer + 1) < len(array):
+        array[apointer] = float(array[apointer+1]) / array[apointer]
+    else:
+        array[apointer] = array[0] / array[apointer]
+
+def _factorial(state):
+    '''
+    Private function for the operation of instruction 114 (see 
+    mathematics).
+    '''
+    if state.array[state.apointer] >= 0:
+        state.array[state.apointer] = \
+            math.factorial(int(state.array[state.apointer]))
+
+def _mathematics(state):
+    '''
+    In-place form of mathematics (see register_machine.in_place).
+    '''
+    _operate(_mathematics_operations, state)
+
+_mathematics_operations = {
+    '065': _following(lambda x, y: x + y),
+    '066': _input(lambda x, y: x + y, 0),
+    '067': _input(lambda x, y: x + y, -1),
+    '068': _following(lambda x, y: y - x),
+    '069': _input(lambda x, y: y - x, 0),
+    '070': _input(lambda x, y: y - x, -1),
+    '071': _following(lambda x, y: y * x),
+    '072': _input(lambda x, y: y * x, 0),
+    '073': _input(lambda x, y: y * x, -1),
+    '074': _divide_following,
+    '075': _input(lambda x, y: float(y) / x, 0),
+    '076': _input(lambda x, y: float(y) / x, -1),
+    '077': _following(lambda x, y: y % x),
+    '078': _input(lambda x, y: y % x, 0),
+    '079': _input(lambda x, y: y % x, -1),
+    '080': _cell(int),
+    '087': _cell(lambda x: -1 * x),
+    '088': _cell(math.sin),
+    '089': _cell(math.cos),
+    '090': _cell(math.tan),
+    '091': _cell(math.asin),
+    '092': _cell(math.acos),
+    '093': _cell(math.atan),
+    '094': _cell(lambda x: 1 / x),
+    '095': _cell(math.sqrt),
+    '096': _cell(lambda x: math.log(x, math.e)),
+    '099': _cell(math.sinh),
+    '100': _cell(math.cosh),
+    '101': _cell(math.tanh),
+    '102': _cell(math.asinh),
+    '103': _cell(math.acosh),
+    '104': _cell(math.atanh),
+    '105': _cell(math.degrees),
+    '106': _cell(math.radians),
+    '107': _cell(lambda x: x ** math.e),
+    '108': _cell(lambda x: math.e ** x),
+    '109': _cell(lambda x: 10 ** x),
+    '110': _following(lambda x, y: x ** y),
+    '111': _following(lambda x, y: x ** (1 / y)),
+    '112': _cell(math.erf),
+    '113': _cell(math.erfc),
+    '114': _factorial,
+    '115': _cell(lambda x: math.factorial(abs(int(x)))),
+    '116': _following(math.hypot),
+    '117': _following(math.log),
+    '144': _cell(lambda x: 0.1 * x),
+    '145': _cell(lambda x: 10 * x),
+    '146': _summarize(lambda array, apointer: sum(array[apointer+1:])),
+    '147': _summarize(lambda array, apointer: sum(array[apointer:])),
+    '148': _summarize(lambda array, apointer: sum(array[0:apointer])),
+    '149': _summarize(lambda array, apointer: sum(array[0:apointer+1])),
+    '150': _summarize(lambda array, apointer: sum(array)),
+    '151': _summarize(lambda array, apointer: _mean(array[apointer+1:])),
+    '152': _summarize(lambda array, apointer: _mean(array[apointer:])),
+    '153': _summarize(lambda array, apointer: _mean(array[0:apointer])),
+    '154': _summarize(lambda array, apointer: _mean(array[0:apointer+1])),
+    '155': _tape(lambda array, apointer: [0.5 * x for x in array]),
+    '156': _tape(lambda array, apointer: [2 * x for x in array]),
+    '157': _tape(lambda array, apointer: [0.1 * x for x in array]),
+    '158': _tape(lambda array, apointer: [10 * x for x in array]),
+    '159': _tape(lambda array, apointer: [0.01 * x for x in array]),
+    '160': _tape(lambda array, apointer: [100 * x for x in array]),
+    '165': _tape(lambda array, apointer: [-1 * x for x in array]),
+    '166': _tape(lambda array, apointer: 
+                 array[0:apointer+1] + [x * x for x in array[apointer+1:]]),
+    '167': _tape(lambda array, apointer: 
+                 [x * x for x in array[:apointer]] + array[apointer:]),
+    '168': _tape(lambda array, apointer: [x * x for x in array]),
+    '169': _tape(lambda array, apointer: [math.sqrt(x) for x in array]),
+    '170': _tape(lambda array, apointer: 
+                 array[0:apointer+1] + [math.sqrt(x) 
+                                        for x in array[apointer+1:]]),
+    '171': _tape(lambda array, apointer: 
+                 [math.sqrt(x) for x in array[:apointer]] + 
+                 array[apointer:]),
+    '196': _summarize(lambda array, apointer: 
+                      math.sqrt(SingleSample(array).variance())),
+    '197': _summarize(lambda array, apointer: 
+                      SingleSample(array).geometricMean()),
+    '198': _summarize(lambda array, apointer: 
+                      SingleSample(array).harmonicMean()),
+    }
+mathematics.in_place = _mathematics
     
 def output_IO(array, apointer, inputdata, output, source, spointer):
     '''
@@ -1303,305 +1474,47 @@ def register_IO(array, apointer, inputdata, output, source, spointer):
         - 598: Clear register #98 (set to 0)
         - 599: Clear register #99 (set to 0)
     '''
-    cmd = source[spointer:spointer+3]
-    if cmd == '201': register[0] = array[apointer]
-    if cmd == '202': register[1] = array[apointer]
-    if cmd == '203': register[2] = array[apointer]
-    if cmd == '204': register[3] = array[apointer]
-    if cmd == '205': register[4] = array[apointer]
-    if cmd == '206': register[5] = array[apointer]
-    if cmd == '207': register[6] = array[apointer]
-    if cmd == '208': register[7] = array[apointer]
-    if cmd == '209': register[8] = array[apointer]
-    if cmd == '210': register[9] = array[apointer]
-    if cmd == '211': register[10] = array[apointer]
-    if cmd == '212': register[11] = array[apointer]
-    if cmd == '213': register[12] = array[apointer]
-    if cmd == '214': register[13] = array[apointer]
-    if cmd == '215': register[14] = array[apointer]
-    if cmd == '216': register[15] = array[apointer]
-    if cmd == '217': register[16] = array[apointer]
-    if cmd == '218': register[17] = array[apointer]
-    if cmd == '219': register[18] = array[apointer]
-    if cmd == '220': register[19] = array[apointer]
-    if cmd == '221': register[20] = array[apointer]
-    if cmd == '222': register[21] = array[apointer]
-    if cmd == '223': register[22] = array[apointer]
-    if cmd == '224': register[23] = array[apointer]
-    if cmd == '225': register[24] = array[apointer]
-    if cmd == '226': register[25] = array[apointer]
-    if cmd == '227': register[26] = array[apointer]
-    if cmd == '228': register[27] = array[apointer]
-    if cmd == '229': register[28] = array[apointer]
-    if cmd == '230': register[29] = array[apointer]
-    if cmd == '231': register[30] = array[apointer]
-    if cmd == '232': register[31] = array[apointer]
-    if cmd == '233': register[32] = array[apointer]
-    if cmd == '234': register[33] = array[apointer]
-    if cmd == '235': register[34] = array[apointer]
-    if cmd == '236': register[35] = array[apointer]
-    if cmd == '237': register[36] = array[apointer]
-    if cmd == '238': register[37] = array[apointer]
-    if cmd == '239': register[38] = array[apointer]
-    if cmd == '240': register[39] = array[apointer]
-    if cmd == '241': register[40] = array[apointer]
-    if cmd == '242': register[41] = array[apointer]
-    if cmd == '243': register[42] = array[apointer]
-    if cmd == '244': register[43] = array[apointer]
-    if cmd == '245': register[44] = array[apointer]
-    if cmd == '246': register[45] = array[apointer]
-    if cmd == '247': register[46] = array[apointer]
-    if cmd == '248': register[47] = array[apointer]
-    if cmd == '249': register[48] = array[apointer]
-    if cmd == '250': register[49] = array[apointer]
-    if cmd == '251': register[50] = array[apointer]
-    if cmd == '252': register[51] = array[apointer]
-    if cmd == '253': register[52] = array[apointer]
-    if cmd == '254': register[53] = array[apointer]
-    if cmd == '255': register[54] = array[apointer]
-    if cmd == '256': register[55] = array[apointer]
-    if cmd == '257': register[56] = array[apointer]
-    if cmd == '258': register[57] = array[apointer]
-    if cmd == '259': register[58] = array[apointer]
-    if cmd == '260': register[59] = array[apointer]
-    if cmd == '261': register[60] = array[apointer]
-    if cmd == '262': register[61] = array[apointer]
-    if cmd == '263': register[62] = array[apointer]
-    if cmd == '264': register[63] = array[apointer]
-    if cmd == '265': register[64] = array[apointer]
-    if cmd == '266': register[65] = array[apointer]
-    if cmd == '267': register[66] = array[apointer]
-    if cmd == '268': register[67] = array[apointer]
-    if cmd == '269': register[68] = array[apointer]
-    if cmd == '270': register[69] = array[apointer]
-    if cmd == '271': register[70] = array[apointer]
-    if cmd == '272': register[71] = array[apointer]
-    if cmd == '273': register[72] = array[apointer]
-    if cmd == '274': register[73] = array[apointer]
-    if cmd == '275': register[74] = array[apointer]
-    if cmd == '276': register[75] = array[apointer]
-    if cmd == '277': register[76] = array[apointer]
-    if cmd == '278': register[77] = array[apointer]
-    if cmd == '279': register[78] = array[apointer]
-    if cmd == '280': register[79] = array[apointer]
-    if cmd == '281': register[80] = array[apointer]
-    if cmd == '282': register[81] = array[apointer]
-    if cmd == '283': register[82] = array[apointer]
-    if cmd == '284': register[83] = array[apointer]
-    if cmd == '285': register[84] = array[apointer]
-    if cmd == '286': register[85] = array[apointer]
-    if cmd == '287': register[86] = array[apointer]
-    if cmd == '288': register[87] = array[apointer]
-    if cmd == '289': register[88] = array[apointer]
-    if cmd == '290': register[89] = array[apointer]
-    if cmd == '291': register[90] = array[apointer]
-    if cmd == '292': register[91] = array[apointer]
-    if cmd == '293': register[92] = array[apointer]
-    if cmd == '294': register[93] = array[apointer]
-    if cmd == '295': register[94] = array[apointer]
-    if cmd == '296': register[95] = array[apointer]
-    if cmd == '297': register[96] = array[apointer]
-    if cmd == '298': register[97] = array[apointer]
-    if cmd == '299': register[98] = array[apointer]
-    if cmd == '301': array[apointer] = register[0]
-    if cmd == '302': array[apointer] = register[1]
-    if cmd == '303': array[apointer] = register[2]
-    if cmd == '304': array[apointer] = register[3]
-    if cmd == '305': array[apointer] = register[4]
-    if cmd == '306': array[apointer] = register[5]
-    if cmd == '307': array[apointer] = register[6]
-    if cmd == '308': array[apointer] = register[7]
-    if cmd == '309': array[apointer] = register[8]
-    if cmd == '310': array[apointer] = register[9]
-    if cmd == '311': array[apointer] = register[10]
-    if cmd == '312': array[apointer] = register[11]
-    if cmd == '313': array[apointer] = register[12]
-    if cmd == '314': array[apointer] = register[13]
-    if cmd == '315': array[apointer] = register[14]
-    if cmd == '316': array[apointer] = register[15]
-    if cmd == '317': array[apointer] = register[16]
-    if cmd == '318': array[apointer] = register[17]
-    if cmd == '319': array[apointer] = register[18]
-    if cmd == '320': array[apointer] = register[19]
-    if cmd == '321': array[apointer] = register[20]
-    if cmd == '322': array[apointer] = register[21]
-    if cmd == '323': array[apointer] = register[22]
-    if cmd == '324': array[apointer] = register[23]
-    if cmd == '325': array[apointer] = register[24]
-    if cmd == '326': array[apointer] = register[25]
-    if cmd == '327': array[apointer] = register[26]
-    if cmd == '328': array[apointer] = register[27]
-    if cmd == '329': array[apointer] = register[28]
-    if cmd == '330': array[apointer] = register[29]
-    if cmd == '331': array[apointer] = register[30]
-    if cmd == '332': array[apointer] = register[31]
-    if cmd == '333': array[apointer] = register[32]
-    if cmd == '334': array[apointer] = register[33]
-    if cmd == '335': array[apointer] = register[34]
-    if cmd == '336': array[apointer] = register[35]
-    if cmd == '337': array[apointer] = register[36]
-    if cmd == '338': array[apointer] = register[37]
-    if cmd == '339': array[apointer] = register[38]
-    if cmd == '340': array[apointer] = register[39]
-    if cmd == '341': array[apointer] = register[40]
-    if cmd == '342': array[apointer] = register[41]
-    if cmd == '343': array[apointer] = register[42]
-    if cmd == '344': array[apointer] = register[43]
-    if cmd == '345': array[apointer] = register[44]
-    if cmd == '346': array[apointer] = register[45]
-    if cmd == '347': array[apointer] = register[46]
-    if cmd == '348': array[apointer] = register[47]
-    if cmd == '349': array[apointer] = register[48]
-    if cmd == '350': array[apointer] = register[49]
-    if cmd == '351': array[apointer] = register[50]
-    if cmd == '352': array[apointer] = register[51]
-    if cmd == '353': array[apointer] = register[52]
-    if cmd == '354': array[apointer] = register[53]
-    if cmd == '355': array[apointer] = register[54]
-    if cmd == '356': array[apointer] = register[55]
-    if cmd == '357': array[apointer] = register[56]
-    if cmd == '358': array[apointer] = register[57]
-    if cmd == '359': array[apointer] = register[58]
-    if cmd == '360': array[apointer] = register[59]
-    if cmd == '361': array[apointer] = register[60]
-    if cmd == '362': array[apointer] = register[61]
-    if cmd == '363': array[apointer] = register[62]
-    if cmd == '364': array[apointer] = register[63]
-    if cmd == '365': array[apointer] = register[64]
-    if cmd == '366': array[apointer] = register[65]
-    if cmd == '367': array[apointer] = register[66]
-    if cmd == '368': array[apointer] = register[67]
-    if cmd == '369': array[apointer] = register[68]
-    if cmd == '370': array[apointer] = register[69]
-    if cmd == '371': array[apointer] = register[70]
-    if cmd == '372': array[apointer] = register[71]
-    if cmd == '373': array[apointer] = register[72]
-    if cmd == '374': array[apointer] = register[73]
-    if cmd == '375': array[apointer] = register[74]
-    if cmd == '376': array[apointer] = register[75]
-    if cmd == '377': array[apointer] = register[76]
-    if cmd == '378': array[apointer] = register[77]
-    if cmd == '379': array[apointer] = register[78]
-    if cmd == '380': array[apointer] = register[79]
-    if cmd == '381': array[apointer] = register[80]
-    if cmd == '382': array[apointer] = register[81]
-    if cmd == '383': array[apointer] = register[82]
-    if cmd == '384': array[apointer] = register[83]
-    if cmd == '385': array[apointer] = register[84]
-    if cmd == '386': array[apointer] = register[85]
-    if cmd == '387': array[apointer] = register[86]
-    if cmd == '388': array[apointer] = register[87]
-    if cmd == '389': array[apointer] = register[88]
-    if cmd == '390': array[apointer] = register[89]
-    if cmd == '391': array[apointer] = register[90]
-    if cmd == '392': array[apointer] = register[91]
-    if cmd == '393': array[apointer] = register[92]
-    if cmd == '394': array[apointer] = register[93]
-    if cmd == '395': array[apointer] = register[94]
-    if cmd == '396': array[apointer] = register[95]
-    if cmd == '397': array[apointer] = register[96]
-    if cmd == '398': array[apointer] = register[97]
-    if cmd == '399': array[apointer] = register[98]
-    if cmd == '501': register[0] = 0
-    if cmd == '502': register[1] = 0
-    if cmd == '503': register[2] = 0
-    if cmd == '504': register[3] = 0
-    if cmd == '505': register[4] = 0
-    if cmd == '506': register[5] = 0
-    if cmd == '507': register[6] = 0
-    if cmd == '508': register[7] = 0
-    if cmd == '509': register[8] = 0
-    if cmd == '510': register[9] = 0
-    if cmd == '511': register[10] = 0
-    if cmd == '512': register[11] = 0
-    if cmd == '513': register[12] = 0
-    if cmd == '514': register[13] = 0
-    if cmd == '515': register[14] = 0
-    if cmd == '516': register[15] = 0
-    if cmd == '517': register[16] = 0
-    if cmd == '518': register[17] = 0
-    if cmd == '519': register[18] = 0
-    if cmd == '520': register[19] = 0
-    if cmd == '521': register[20] = 0
-    if cmd == '522': register[21] = 0
-    if cmd == '523': register[22] = 0
-    if cmd == '524': register[23] = 0
-    if cmd == '525': register[24] = 0
-    if cmd == '526': register[25] = 0
-    if cmd == '527': register[26] = 0
-    if cmd == '528': register[27] = 0
-    if cmd == '529': register[28] = 0
-    if cmd == '530': register[29] = 0
-    if cmd == '531': register[30] = 0
-    if cmd == '532': register[31] = 0
-    if cmd == '533': register[32] = 0
-    if cmd == '534': register[33] = 0
-    if cmd == '535': register[34] = 0
-    if cmd == '536': register[35] = 0
-    if cmd == '537': register[36] = 0
-    if cmd == '538': register[37] = 0
-    if cmd == '539': register[38] = 0
-    if cmd == '540': register[39] = 0
-    if cmd == '541': register[40] = 0
-    if cmd == '542': register[41] = 0
-    if cmd == '543': register[42] = 0
-    if cmd == '544': register[43] = 0
-    if cmd == '545': register[44] = 0
-    if cmd == '546': register[45] = 0
-    if cmd == '547': register[46] = 0
-    if cmd == '548': register[47] = 0
-    if cmd == '549': register[48] = 0
-    if cmd == '550': register[49] = 0
-    if cmd == '551': register[50] = 0
-    if cmd == '552': register[51] = 0
-    if cmd == '553': register[52] = 0
-    if cmd == '554': register[53] = 0
-    if cmd == '555': register[54] = 0
-    if cmd == '556': register[55] = 0
-    if cmd == '557': register[56] = 0
-    if cmd == '558': register[57] = 0
-    if cmd == '559': register[58] = 0
-    if cmd == '560': register[59] = 0
-    if cmd == '561': register[60] = 0
-    if cmd == '562': register[61] = 0
-    if cmd == '563': register[62] = 0
-    if cmd == '564': register[63] = 0
-    if cmd == '565': register[64] = 0
-    if cmd == '566': register[65] = 0
-    if cmd == '567': register[66] = 0
-    if cmd == '568': register[67] = 0
-    if cmd == '569': register[68] = 0
-    if cmd == '570': register[69] = 0
-    if cmd == '571': register[70] = 0
-    if cmd == '572': register[71] = 0
-    if cmd == '573': register[72] = 0
-    if cmd == '574': register[73] = 0
-    if cmd == '575': register[74] = 0
-    if cmd == '576': register[75] = 0
-    if cmd == '577': register[76] = 0
-    if cmd == '578': register[77] = 0
-    if cmd == '579': register[78] = 0
-    if cmd == '580': register[79] = 0
-    if cmd == '581': register[80] = 0
-    if cmd == '582': register[81] = 0
-    if cmd == '583': register[82] = 0
-    if cmd == '584': register[83] = 0
-    if cmd == '585': register[84] = 0
-    if cmd == '586': register[85] = 0
-    if cmd == '587': register[86] = 0
-    if cmd == '588': register[87] = 0
-    if cmd == '589': register[88] = 0
-    if cmd == '590': register[89] = 0
-    if cmd == '591': register[90] = 0
-    if cmd == '592': register[91] = 0
-    if cmd == '593': register[92] = 0
-    if cmd == '594': register[93] = 0
-    if cmd == '595': register[94] = 0
-    if cmd == '596': register[95] = 0
-    if cmd == '597': register[96] = 0
-    if cmd == '598': register[97] = 0
-    if cmd == '599': register[98] = 0
-    return (array, apointer, inputdata, output, source, spointer)
+    state = State(array, apointer, inputdata, output, source, spointer)
+    _register_IO(state)
+    return state.results()
+
+def _store(index):
+    '''
+    Private function to make the operation writing the value of the 
+    current cell into a register.
+    '''
+    def operation(state):
+        register[index] = state.array[state.apointer]
+    return operation
+
+def _load(index):
+    '''
+    Private function to make the operation writing the value of a 
+    register into the current cell.
+    '''
+    def operation(state):
+        state.array[state.apointer] = register[index]
+    return operation
+
+def _clear(index):
+    '''
+    Private function to make the operation setting a register to "0".
+    '''
+    def operation(state):
+        register[index] = 0
+    return operation
+
+def _register_IO(state):
+    '''
+    In-place form of register_IO (see register_machine.in_place).
+    '''
+    _operate(_register_IO_operations, state)
+
+_register_IO_operations = dict(
+    [(instruction_padding(201 + x), _store(x)) for x in range(99)] + 
+    [(instruction_padding(301 + x), _load(x)) for x in range(99)] + 
+    [(instruction_padding(501 + x), _clear(x)) for x in range(99)])
+register_IO.in_place = _register_IO
 
 def jump_identifier(array, apointer, inputdata, output, source, spointer):
     '''
@@ -2243,58 +2156,138 @@ tested_ragaraja_instructions = [
 nBF_instructions = ['000', '004', '008', '011', '020', '050', '051', '052', 
                     '053', '054', '055', '056', '057', '058', '059', '060']
 
+# Instructions whose results do not depend only on the source, input list 
+# and tape: the NucleotideBF random operations (050 to 060), which use 
+# random numbers; the register operations (201 to 299, 301 to 399 and 501 
+# to 599), which use the registers kept between executions; and flipping 
+# the source (048), which changes the source.
+nondeterministic_instructions = ['048'] + \
+    [instruction_padding(x) for x in range(50, 61)] + \
+    [instruction_padding(x) for x in range(201, 300)] + \
+    [instruction_padding(x) for x in range(301, 400)] + \
+    [instruction_padding(x) for x in range(501, 600)]
+
 def source_filter(source, sfilter=ragaraja_v1):
     '''
     Checks a Ragaraja source code string and removes any instructions are
-    not found in the filter
+    not found in the filter. A list of source code strings (such as the 
+    genomes of a population) can be given to filter all of them at once, 
+    where the filter is prepared once and each distinct source code string 
+    is filtered once.
     
-    @param source: Ragaraja source code string
-    @type source: string
+    @param source: Ragaraja source code string, or list of Ragaraja 
+    source code strings
+    @type source: string or list
     @param sfilter: list of instructions allowed.
     Default = ragaraja_v1. Other defined list are
     nBF_instructions (NucleotideBF) and tested_ragaraja_instructions.
-    @return: Ragaraja source code string
+    @return: Ragaraja source code string, or list of Ragaraja source code 
+    strings if a list is given
     
     @since: version 0.4
     '''
-    filtered_source = []
-    spointer = 0
-    while spointer < len(source):
-        if source[spointer:spointer+3] in sfilter:
-            filtered_source = filtered_source + [source[spointer:spointer+3]]
-        spointer = spointer + 3
-    return ''.join(filtered_source)
+    sfilter = frozenset(sfilter)
+    if isinstance(source, str):
+        return ''.join([source[spointer:spointer+3]
+                        for spointer in range(0, len(source), 3)
+                        if source[spointer:spointer+3] in sfilter])
+    filtered = {}
+    for x in source:
+        if x not in filtered:
+            filtered[x] = source_filter(x, sfilter)
+    return [filtered[x] for x in source]
+
+_nBF_codons = {'G': '000', 'C': '004', 'A': '008', 'T': '011', '.': '020',
+               'R': '050', 'Y': '051', 'S': '052', 'W': '053', 'K': '054',
+               'M': '055', 'B': '056', 'D': '057', 'H': '058', 'V': '059',
+               'N': '060'}
+
+# Translation tables (for bytes.translate) of each character to the first, 
+# second and third character of its Ragaraja instruction ("..." for 
+# characters which are not NucleotideBF source code)
+_nBF_tables = [bytes([ord(_nBF_codons.get(chr(x), '...')[position])
+                      for x in range(256)])
+               for position in range(3)]
 
 def nBF_to_Ragaraja(source):
     '''
-    Converts NucleotideBF (nBF) source code to Ragaraja source code
+    Converts NucleotideBF (nBF) source code to Ragaraja source code. The 
+    source code is translated in bulk - the first, second and third 
+    characters of the Ragaraja instructions are translated from the source 
+    code using translation tables, and interleaved. A list of nBF source 
+    codes (such as the genomes of a population) can be given to convert 
+    all of them at once.
     
-    @param source: NucleotideBF (nBF) source code
-    @type source: string
-    @return: Ragaraja source code string
+    @param source: NucleotideBF (nBF) source code, or list of nBF source 
+    codes
+    @type source: string or list
+    @return: Ragaraja source code string, or list of Ragaraja source code 
+    strings if a list is given
     
     @since: version 0.4
     '''
-    converted = []
-    for x in source:
-        if x == 'G': converted.append('000')
-        elif x == 'C': converted.append('004')
-        elif x == 'A': converted.append('008')
-        elif x == 'T': converted.append('011')
-        elif x == '.': converted.append('020')
-        elif x == 'R': converted.append('050')
-        elif x == 'Y': converted.append('051')
-        elif x == 'S': converted.append('052')
-        elif x == 'W': converted.append('053')
-        elif x == 'K': converted.append('054')
-        elif x == 'M': converted.append('055')
-        elif x == 'B': converted.append('056')
-        elif x == 'D': converted.append('057')
-        elif x == 'H': converted.append('058')
-        elif x == 'V': converted.append('059')
-        elif x == 'N': converted.append('060')
-        else: converted.append('...')
-    return ''.join(converted)
+    if not isinstance(source, str):
+        return [nBF_to_Ragaraja(x) for x in source]
+    try:
+        characters = source.encode('ascii')
+    except UnicodeEncodeError:
+        return ''.join([_nBF_codons.get(x, '...') for x in source])
+    converted = bytearray(3 * len(characters))
+    for position in range(3):
+        converted[position::3] = \
+            characters.translate(_nBF_tables[position])
+    return converted.decode('ascii')
+
+# {<handler>: <table of operations>} of the handlers which execute their 
+# instructions by operations (see _operate).
+_operations = {tape_move: _tape_move_operations,
+               accumulations: _accumulations_operations,
+               source_move: _source_move_operations,
+               set_tape_value: _set_tape_value_operations,
+               mathematics: _mathematics_operations,
+               register_IO: _register_IO_operations}
+
+_specialized = {}
+
+def _instruction(handler, operation):
+    '''
+    Private function to make the function of an instruction from its 
+    operation, which gives the same results as the handler of the 
+    instruction; the operation is the in-place form of the function (see 
+    register_machine.in_place).
+    '''
+    def instruction(array, apointer, inputdata, output, source, spointer):
+        state = State(array, apointer, inputdata, output, source, spointer)
+        operation(state)
+        return state.results()
+    instruction.__name__ = handler.__name__
+    instruction.__doc__ = handler.__doc__
+    instruction.in_place = operation
+    return instruction
+
+def _specialize(function, instruction):
+    '''
+    Private function to specialize a handler for an instruction, where 
+    the specialized function executes the operation of the instruction 
+    from the table of operations of the handler (see _operations) without 
+    looking up the instruction in the table. Handlers without a table of 
+    operations, or without an operation for the instruction, are not 
+    specialized.
+
+    @param function: Handler of the instruction.
+    @param instruction: Instruction to specialize the handler for.
+    @type instruction: string
+    @return: specialized function, or the handler if it is not specialized
+    '''
+    key = (function, instruction)
+    if key not in _specialized:
+        operations = _operations.get(function, {})
+        if instruction in operations:
+            _specialized[key] = _instruction(function,
+                                             operations[instruction])
+        else:
+            _specialized[key] = function
+    return _specialized[key]
 
 def activate_version(version=1, instructions=None):
     '''
@@ -2353,6 +2346,9 @@ def activate_version(version=1, instructions=None):
     instructions in string) to be activated. This will only be activated 
     when version = 0.
     
+    Each activated instruction is bound to a function specialized from 
+    its handler for the instruction (see module documentation).
+    
     @since: version 0.4
     '''
     if version == 0.1: instructions = nBF_instructions
@@ -2362,4 +2358,6 @@ def activate_version(version=1, instructions=None):
     for key in list(ragaraja.keys()):
         if key not in instructions:
             ragaraja[key] = not_used
+        else:
+            ragaraja[key] = _specialize(ragaraja[key], key)
     return instructions
@@ -6,19 +6,695 @@ The machine consists of the following elements:
     1. Array/Tape: A circular tape for operations to occur
     2. Source: The program
     3. Input List: A list of data given to the machine at initialization.
-    4. Output List: A list of output from the execution. This may also be 
-    used as a secondary tape. 
+    4. Output List: A list of output from the execution. This may also be
+    used as a secondary tape.
 
-When the program terminates, all 4 elements are returned, and the 
-machine terminates itself. 
+When the program terminates, all 4 elements are returned, and the
+machine terminates itself.
+
+Before execution, the source is compiled (see Program) into an array of
+opcodes - one opcode for each source position, which is the position of
+the function / operation in a list of functions - so that the execution
+loop does not need to slice and look up each instruction in the dictionary
+of functions. Loop operations can look up the matching loop operation from
+bracket tables (see bracket_table), which are computed once for each
+source instead of scanning the source on each iteration. During execution,
+the state of the machine is kept in a State object, which is changed in
+place by the in-place form of functions / operations (see in_place)
+without creating a tuple of results for each instruction; and the tape may
+be a typed tape (see tape). Loops which are executed repeatedly are traced
+into generated functions (see Program.trace). A batch of programs (such as
+the genomes of a population) can be executed using interpret_batch, which
+compiles each distinct source once. The executions can be profiled (see
+Profile) for the number of executions of each instruction, the time spent
+in each function / operation, and the loops with the most iterations.
 '''
 
+import time
+from array import array as _array
+
+_bracket_tables = {}
+
+def bracket_table(source, open_token, close_token, function_size=1):
+    '''
+    Function to generate a bracket table of matching loop operations,
+    which is a dictionary of {<position of loop start>: <position of
+    matching loop end>} and {<position of loop end>: <position of matching
+    loop start>}, where loops may be nested. Loop operations without a
+    matching loop operation are not in the table.
+
+    Positions are matched within each offset of source positions (modulo
+    function_size), as in stepping through the source by function_size.
+    Bracket tables are cached for each source; hence, loop operations can
+    look up the bracket table on every iteration.
+
+    @param source: Instructions to match.
+    @type source: string
+    @param open_token: Instruction to start loop.
+    @type open_token: string
+    @param close_token: Instruction to end loop.
+    @type close_token: string
+    @param function_size: Length of each instruction. Default = 1
+    @type function_size: integer
+    @return: dictionary of matching positions.
+    '''
+    key = (source, open_token, close_token, function_size)
+    try:
+        return _bracket_tables[key]
+    except KeyError:
+        pass
+    table = {}
+    for offset in range(function_size):
+        stack = []
+        for position in range(offset, len(source), function_size):
+            cmd = source[position:position+function_size]
+            if cmd == open_token:
+                stack.append(position)
+            elif cmd == close_token and len(stack) > 0:
+                start = stack.pop()
+                table[start] = position
+                table[position] = start
+    if len(_bracket_tables) > 1000:
+        _bracket_tables.clear()
+    _bracket_tables[key] = table
+    return table
+
+class Profile(object):
+    '''
+    Instruction-level profile of one or more executions, recording:
+        1. The number of executions of each instruction (Profile.counts),
+        as a dictionary of {<instruction>: <count>}.
+        2. The number of calls and cumulative time of each function /
+        operation (Profile.calls and Profile.times), as dictionaries of
+        {<function name>: <count or time in seconds>}. Macros (see
+        Program) are recorded as the function name of "macro".
+        3. The number of backward jumps of the source pointer
+        (Profile.loops), as a dictionary of {(<source>, <source position
+        jumped to>, <source position jumped from>): <count>}, which are
+        the iterations of loops in each source.
+
+    A profile is given to register_machine.interpret (or Program), and the
+    results are reported using Profile.report.
+    '''
+    def __init__(self):
+        '''
+        Constructor method.
+        '''
+        self.counts = {}
+        self.calls = {}
+        self.times = {}
+        self.loops = {}
+
+    def _record(self, name, elapsed):
+        '''
+        Private method to record a call of a function / operation.
+        '''
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.times[name] = self.times.get(name, 0.0) + elapsed
+
+    def wrap(self, instruction, function):
+        '''
+        Method to wrap a function / operation to record its executions.
+
+        @param instruction: Instruction of the function / operation.
+        @type instruction: string
+        @param function: Function / operation to wrap.
+        @return: wrapped function / operation.
+        '''
+        name = function.__name__
+        counts = self.counts
+        loops = self.loops
+        def profiled(array, apointer, inputdata, output, source, spointer):
+            start = time.perf_counter()
+            result = function(array, apointer, inputdata, output, source,
+                              spointer)
+            self._record(name, time.perf_counter() - start)
+            counts[instruction] = counts.get(instruction, 0) + 1
+            if result[5] < spointer:
+                loop = (source, result[5], spointer)
+                loops[loop] = loops.get(loop, 0) + 1
+            return result
+        return profiled
+
+    def wrap_macro(self, macro):
+        '''
+        Method to wrap a macro (see Program) to record its executions.
+
+        @param macro: Macro to wrap.
+        @return: wrapped macro.
+        '''
+        def profiled(array, apointer, size, budget):
+            start = time.perf_counter()
+            result = macro(array, apointer, size, budget)
+            if result is not None:
+                self._record('macro', time.perf_counter() - start)
+            return result
+        return profiled
+
+    def hot_loops(self, top=10):
+        '''
+        Method to get the loops with the most iterations.
+
+        @param top: Number of loops to get. Default = 10
+        @type top: integer
+        @return: list of (<source position of loop start>, <source
+        position of loop end>, <number of iterations>, <instructions of
+        loop>), in descending number of iterations.
+        '''
+        loops = sorted(self.loops.items(), key=lambda x: -x[1])[:top]
+        return [(start, end, count, source[start:end])
+                for ((source, start, end), count) in loops]
+
+    def report(self, filepath=None, top=10):
+        '''
+        Method to generate a report of the profile, consisting of the
+        number of executions of each instruction, the number of calls and
+        cumulative time of each function / operation, and the loops with
+        the most iterations; each in descending order.
+
+        @param filepath: Path of file to write the report to. Default =
+        None (report is not written)
+        @type filepath: string
+        @param top: Number of loops to report. Default = 10
+        @type top: integer
+        @return: report as a tab-delimited string.
+        '''
+        lines = ['Instruction\tCount']
+        for (instruction, count) in sorted(self.counts.items(),
+                                           key=lambda x: (-x[1], x[0])):
+            lines.append('\t'.join([instruction, str(count)]))
+        lines.extend(['', 'Function\tCalls\tTime (seconds)'])
+        for (name, elapsed) in sorted(self.times.items(),
+                                      key=lambda x: (-x[1], x[0])):
+            lines.append('\t'.join([name, str(self.calls[name]),
+                                    '%.6f' % elapsed]))
+        lines.extend(['', 'Loop start\tLoop end\tIterations\tLoop'])
+        for (start, end, count, loop) in self.hot_loops(top):
+            lines.append('\t'.join([str(start), str(end), str(count), loop]))
+        report = '\n'.join(lines) + '\n'
+        if filepath is not None:
+            f = open(filepath, 'w')
+            f.write(report)
+            f.close()
+        return report
+
+class State(object):
+    '''
+    State of the register machine during execution - the tape
+    (State.array), tape position (State.apointer), input list
+    (State.inputdata), output list (State.output), source (State.source)
+    and source position (State.spointer) - which is mutated in place by
+    the in-place form of functions / operations (see in_place).
+    '''
+    __slots__ = ('array', 'apointer', 'inputdata', 'output', 'source',
+                 'spointer')
+
+    def __init__(self, array, apointer=0, inputdata=None, output=None,
+                 source='', spointer=0):
+        '''
+        Constructor method.
+
+        @param array: The tape.
+        @param apointer: Tape position. Default = 0
+        @type apointer: integer
+        @param inputdata: Input list. Default = None (empty input list)
+        @type inputdata: list
+        @param output: Output list. Default = None (empty output list)
+        @type output: list
+        @param source: Instructions. Default = ''
+        @type source: string
+        @param spointer: Source position. Default = 0
+        @type spointer: integer
+        '''
+        if inputdata is None:
+            inputdata = []
+        if output is None:
+            output = []
+        self.array = array
+        self.apointer = apointer
+        self.inputdata = inputdata
+        self.output = output
+        self.source = source
+        self.spointer = spointer
+
+    def results(self):
+        '''
+        Method to get the state as the results of a function / operation.
+
+        @return: (array, apointer, inputdata, output, source, spointer)
+        '''
+        return (self.array, self.apointer, self.inputdata, self.output,
+                self.source, self.spointer)
+
+def in_place(function):
+    '''
+    Function to get the in-place form of a function / operation, which
+    takes the state of the register machine (see State) and mutates it,
+    instead of taking the tape, tape position, input list, output list,
+    source and source position and returning them as a tuple. Executing
+    the in-place form does not create a tuple of results for each
+    instruction.
+
+    A function / operation gives its in-place form as its "in_place"
+    attribute, which must change the state as the function / operation
+    changes the results; functions / operations without the attribute
+    have no in-place form and are called with the tuple of results.
+
+    @param function: Function / operation.
+    @return: in-place form of the function / operation, or None if there
+    is no in-place form
+    '''
+    return getattr(function, 'in_place', None)
+
+class Program(object):
+    '''
+    Compiled source for the register machine. The source is decoded into
+    an array of opcodes (Program.opcodes), one for each source position,
+    where the opcode is the position of the function / operation of the
+    instruction starting at that source position in Program.handlers; -1
+    if the instruction is not a function / operation. Only instructions
+    found in the source are decoded, and source positions which are not a
+    multiple of function_size are decoded only when executed.
+
+    An optimizer (such as peephole.optimize) may replace sequences of
+    instructions by macros (Program.macros), which is a dictionary of
+    {<source position>: <macro>}. A macro is a callable which takes the
+    tape, tape position, size of the tape, and the maximum number of
+    instructions to execute; and returns a tuple of (<tape position>,
+    <number of instructions executed>, <source position of the last
+    instruction executed>) after executing the sequence, or None if the
+    sequence cannot be executed as a macro.
+
+    The functions / operations and macros are called through
+    Program.dispatch and Program.macros, which are wrapped to record their
+    execution if the program is compiled with a profile (see Profile).
+    Functions / operations with an in-place form (see in_place) are called
+    in their in-place form (Program.in_place, which is None for functions /
+    operations without an in-place form, or if the program is profiled).
+
+    Loops which are executed repeatedly (hot loops) are traced (see
+    Program.trace), where the instructions of the loop are executed by a
+    generated function (Program.traces, which is a dictionary of {(<source
+    position of the first instruction>, <source position of the last
+    instruction>): <trace>}) instead of the execution loop.
+    '''
+    def __init__(self, source, functions, function_size=1, optimizer=None,
+                 profile=None):
+        '''
+        Constructor method.
+
+        @param source: Instructions to compile.
+        @type source: string
+        @param functions: Dictionary of functions / operations.
+        @param function_size: Length of each instruction. Default = 1
+        @type function_size: integer
+        @param optimizer: Function to generate the macros of a program.
+        Default = None (no optimization)
+        @param profile: Profile to record the execution of the program.
+        Default = None (no profiling)
+        @type profile: register_machine.Profile object
+        '''
+        self.source = source
+        self.functions = functions
+        self.function_size = function_size
+        self.optimizer = optimizer
+        self.profile = profile
+        self.tokens = {}
+        self.handlers = []
+        self.dispatch = []
+        self.in_place = []
+        self.opcodes = _array('i', [-2]) * len(source)
+        tokens = self.tokens
+        for position in range(0, len(source), function_size):
+            cmd = source[position:position+function_size]
+            if cmd in tokens:
+                self.opcodes[position] = tokens[cmd]
+            else:
+                self.opcodes[position] = self._opcode(cmd)
+        self.macros = {}
+        if optimizer is not None:
+            self.macros = optimizer(self)
+        if profile is not None:
+            for position in self.macros:
+                self.macros[position] = \
+                    profile.wrap_macro(self.macros[position])
+        self.loops = {}
+        self.traces = {}
+
+    def _opcode(self, cmd):
+        '''
+        Private method to get the opcode of an instruction, adding the
+        function / operation of the instruction to Program.handlers if
+        the instruction is not decoded before.
+        '''
+        try:
+            return self.tokens[cmd]
+        except KeyError:
+            pass
+        if cmd in self.functions:
+            self.tokens[cmd] = len(self.handlers)
+            self.handlers.append(self.functions[cmd])
+            if self.profile is None:
+                self.dispatch.append(self.functions[cmd])
+                self.in_place.append(in_place(self.functions[cmd]))
+            else:
+                self.dispatch.append(self.profile.wrap(cmd,
+                                                       self.functions[cmd]))
+                self.in_place.append(None)
+        else:
+            self.tokens[cmd] = -1
+        return self.tokens[cmd]
+
+    def decode(self, spointer):
+        '''
+        Method to decode the instruction at a source position.
+
+        @param spointer: Source position.
+        @type spointer: integer
+        @return: opcode, or -1 if the instruction is not a function /
+        operation.
+        '''
+        if 0 <= spointer < len(self.source) and \
+            self.opcodes[spointer] != -2:
+            return self.opcodes[spointer]
+        opcode = self._opcode(self.source[spointer:spointer +
+                                          self.function_size])
+        if 0 <= spointer < len(self.source):
+            self.opcodes[spointer] = opcode
+        return opcode
+
+    def trace(self, start, end):
+        '''
+        Method to get the trace of a loop, which is executed from the
+        start source position to the end source position (inclusive)
+        before jumping back to the start source position. The trace is
+        generated (see _trace) when the loop is hot - after jumping back
+        to the start source position from the end source position for a
+        number of times (register_machine.trace_threshold); and is None if
+        the loop is not hot or the loop cannot be traced.
+
+        @param start: Source position of the first instruction of the loop.
+        @type start: integer
+        @param end: Source position of the last instruction of the loop,
+        which jumps back to the first instruction.
+        @type end: integer
+        @return: trace, or None
+        '''
+        loop = (start, end)
+        if loop in self.traces:
+            return self.traces[loop]
+        self.loops[loop] = self.loops.get(loop, 0) + 1
+        if self.loops[loop] < trace_threshold:
+            return None
+        self.traces[loop] = _trace(self, start, end)
+        return self.traces[loop]
+
+def prepare(source, functions, function_size=1):
+    '''
+    Function to prepare the source for execution, by padding the source
+    to a multiple of function_size. If padded, only characters which are
+    functions / operations are kept.
+
+    @param source: Instructions to prepare.
+    @type source: string
+    @param functions: Dictionary of functions / operations.
+    @param function_size: Length of each instruction. Default = 1
+    @type function_size: integer
+    @return: prepared source
+    '''
+    if len(source) % function_size != 0:
+        source = source + '!'*(function_size - \
+                               len(source) % function_size)
+        tokens = list(functions.keys())
+        source = ''.join([x for x in source if x in tokens])
+    return source
+
+def tape(size=30, typecode='d'):
+    '''
+    Function to generate a typed tape of zeros, which is an array of the
+    type code (array.array) instead of a list. A typed tape stores its
+    cells contiguously and can only hold values of its type; hence, values
+    on a tape of type code 'd' (double) are floating point numbers. Typed
+    tapes can be used with functions / operations which change the tape in
+    place (such as those of LCBF and NucleotideBF, and the tape size
+    instructions of Ragaraja), where the tape grows in place.
+
+    @param size: Length of the tape. Default = 30
+    @type size: integer
+    @param typecode: Type code of the tape. Default = 'd' (double)
+    @type typecode: string
+    @return: typed tape (array.array)
+    '''
+    return _array(typecode, [0]) * size
+
+# Number of times a loop jumps back before it is traced
+trace_threshold = 8
+
+# Maximum number of instructions in a traced loop
+trace_limit = 256
+
+_trace_factories = {}
+
+def _unknown(source, spointer, function_size):
+    '''
+    Private function to report an instruction which is not a function /
+    operation.
+    '''
+    cmd = source[spointer:spointer+function_size]
+    print(' '.join(['Unknown function: ', cmd,
+                    'at source position', str(spointer)]))
+
+def _exit(state, size, function_size, count):
+    '''
+    Private function to complete the execution of an instruction when
+    leaving a trace (as in the execution loop), by keeping the tape
+    position within the tape and moving to the next instruction; returning
+    the number of instructions executed by the trace.
+    '''
+    if state.apointer > size - 1:
+        state.apointer = state.apointer - size
+    if state.apointer < 0:
+        state.apointer = size + state.apointer
+    state.spointer = state.spointer + function_size
+    return count
+
+def _trace_factory(kinds):
+    '''
+    Private function to generate (or get from cache) the factory of traces
+    for loops of a sequence of kinds of functions / operations, where
+    "i" is a function / operation called in its in-place form and "t" is
+    a function / operation returning a tuple. The source code of the
+    factory is generated and compiled once for each sequence of kinds.
+    '''
+    if kinds in _trace_factories:
+        return _trace_factories[kinds]
+    length = len(kinds)
+    lines = ['def factory(start, function_size, handlers):']
+    for index in range(length):
+        lines.append('    h%d = handlers[%d]' % (index, index))
+        lines.append('    p%d = start + %d * function_size' % (index, index))
+    lines.extend(['    back = start - function_size',
+                  '    def trace(state, size, budget):',
+                  '        source = state.source',
+                  '        count = 0',
+                  '        while budget - count >= %d:' % length])
+    for index in range(length):
+        if index < length - 1:
+            (jump, following) = ('p%d' % index, 'p%d' % (index + 1))
+        else:
+            (jump, following) = ('back', 'start')
+        lines.append('            try:')
+        if kinds[index] == 'i':
+            lines.append('                h%d(state)' % index)
+        else:
+            lines.extend([
+                '                (state.array, state.apointer,',
+                '                    state.inputdata, state.output,',
+                '                    state.source, state.spointer) = \\',
+                '                    h%d(state.array, state.apointer,' % index,
+                '                        state.inputdata, state.output,',
+                '                        source, p%d)' % index])
+        lines.extend([
+            '            except KeyError:',
+            '                _unknown(source, p%d, function_size)' % index,
+            '                return _exit(state, size, function_size,',
+            '                             count + %d)' % (index + 1),
+            '            if state.spointer != %s or \\' % jump,
+            '                state.source is not source:',
+            '                return _exit(state, size, function_size,',
+            '                             count + %d)' % (index + 1),
+            '            if state.apointer > size - 1:',
+            '                state.apointer = state.apointer - size',
+            '            if state.apointer < 0:',
+            '                state.apointer = size + state.apointer',
+            '            state.spointer = %s' % following])
+    lines.extend(['            count = count + %d' % length,
+                  '        return count',
+                  '    return trace'])
+    namespace = {}
+    exec(compile('\n'.join(lines) + '\n', '<trace %s>' % kinds, 'exec'),
+         {'_exit': _exit, '_unknown': _unknown}, namespace)
+    if len(_trace_factories) > 1000:
+        _trace_factories.clear()
+    _trace_factories[kinds] = namespace['factory']
+    return namespace['factory']
+
+def _trace(program, start, end):
+    '''
+    Private function to generate the trace of a loop of a program from the
+    start source position to the end source position (inclusive); or None
+    if the loop cannot be traced - the loop has more than trace_limit
+    instructions, or has instructions which are not functions /
+    operations or are replaced by macros.
+
+    A trace is a function which takes the state of the register machine
+    (see State), the size of the tape, and the number of instructions that
+    can be executed; and executes the instructions of the loop as the
+    execution loop does, as many times as the instructions can be
+    executed. The trace is guarded to leave the loop (at the next
+    instruction) when an instruction does not continue the loop - such as
+    at the end of the loop, or when an instruction jumps or changes the
+    source; after which the execution loop continues. The trace returns
+    the number of instructions executed.
+    '''
+    function_size = program.function_size
+    if start < 0 or end >= len(program.source) or \
+        (end - start) % function_size != 0 or \
+        (end - start) // function_size >= trace_limit:
+        return None
+    kinds = []
+    handlers = []
+    for position in range(start, end + 1, function_size):
+        opcode = program.decode(position)
+        if opcode < 0 or position in program.macros:
+            return None
+        if program.in_place[opcode] is not None:
+            kinds.append('i')
+            handlers.append(program.in_place[opcode])
+        else:
+            kinds.append('t')
+            handlers.append(program.dispatch[opcode])
+    return _trace_factory(''.join(kinds))(start, function_size, handlers)
+
+def _execute(program, inputdata, array, size, max_instructions):
+    '''
+    Private function for the execution loop, which returns the number of
+    instructions executed in addition to the results of execute.
+    '''
+    if array == None:
+        array = [0] * size
+    if len(array) > size:
+        array = array[0:size]
+    source = program.source
+    state = State(array, 0, inputdata, list(), source, 0)
+    function_size = program.function_size
+    opcodes = program.opcodes
+    handlers = program.dispatch
+    in_place_handlers = program.in_place
+    macros = program.macros
+    programs = {source: program}
+    instruction_count = 0
+    while state.spointer < len(source):
+        spointer = state.spointer
+        if macros and spointer in macros:
+            fused = macros[spointer](state.array, state.apointer, size,
+                                     max_instructions + 1 - instruction_count)
+            if fused is not None:
+                (state.apointer, count, spointer) = fused
+                instruction_count = instruction_count + count
+                state.spointer = spointer + function_size
+                if instruction_count > max_instructions:
+                    break
+                continue
+        instruction_count = instruction_count + 1
+        if 0 <= spointer and opcodes[spointer] >= 0:
+            opcode = opcodes[spointer]
+        else:
+            opcode = program.decode(spointer)
+        try:
+            if opcode < 0:
+                raise KeyError(spointer)
+            handler = in_place_handlers[opcode]
+            if handler is not None:
+                handler(state)
+            else:
+                (state.array, state.apointer, state.inputdata, state.output,
+                    state.source, state.spointer) = \
+                    handlers[opcode](state.array, state.apointer,
+                                     state.inputdata, state.output, source,
+                                     spointer)
+            if state.source is not source:
+                source = state.source
+                if source not in programs:
+                    programs[source] = Program(source, program.functions,
+                                               function_size,
+                                               program.optimizer,
+                                               program.profile)
+                program = programs[source]
+                opcodes = program.opcodes
+                handlers = program.dispatch
+                in_place_handlers = program.in_place
+                macros = program.macros
+        except KeyError:
+            _unknown(source, spointer, function_size)
+        if state.apointer > size - 1:
+            state.apointer = state.apointer - size
+        if state.apointer < 0:
+            state.apointer = size + state.apointer
+        state.spointer = state.spointer + function_size
+        if instruction_count > max_instructions:
+            break
+        if state.spointer <= spointer:
+            trace = program.trace(state.spointer, spointer)
+            if trace is not None:
+                instruction_count = instruction_count + \
+                    trace(state, size, max_instructions - instruction_count)
+                if state.source is not source:
+                    source = state.source
+                    if source not in programs:
+                        programs[source] = Program(source, program.functions,
+                                                   function_size,
+                                                   program.optimizer,
+                                                   program.profile)
+                    program = programs[source]
+                    opcodes = program.opcodes
+                    handlers = program.dispatch
+                    in_place_handlers = program.in_place
+                    macros = program.macros
+    return state.results() + (instruction_count,)
+
+def execute(program, inputdata=[], array=None, size=30,
+            max_instructions=1000):
+    '''
+    Execution loop over a compiled program (see Program). If a function /
+    operation changes the source, the changed source is compiled (with the
+    optimizer of the program) and execution continues over the changed
+    source.
+
+    @param program: Compiled program to execute.
+    @type program: register_machine.Program object
+    @param inputdata: Any input data that the function may need.
+    @type inputdata: list
+    @param array: The endless tape in a Turing machine which is implemented
+    as a circular list, making it virtually limitless.
+    @type array: list or array.array (see tape)
+    @param size: Length of the type (array). Default = 30
+    @type size: integer
+    @param max_instructions: The maximum number of instructions to execute.
+    Default = 1000
+    @type max_instructions: integer
+    @return: (array, apointer, inputdata, output, source, spointer)
+    '''
+    return _execute(program, inputdata, array, size, max_instructions)[:6]
+
 def interpret(source, functions,
              function_size=1, inputdata=[],
-             array=None, size=30, max_instructions=1000):
+             array=None, size=30, max_instructions=1000, optimizer=None,
+             profile=None):
     '''
-    Interpreter loop.
-    
+    Interpreter loop. The source is prepared (see prepare), compiled (see
+    Program) and executed (see execute).
+
     @param source: Instructions to execute.
     @type source: string
     @param functions: Dictionary of functions / operations.
@@ -28,44 +704,85 @@ def interpret(source, functions,
     @type inputdata: list
     @param array: The endless tape in a Turing machine which is implemented
     as a circular list, making it virtually limitless.
-    @type array: list
+    @type array: list or array.array (see tape)
     @param size: Length of the type (array). Default = 30
     @type size: integer
-    @param max_instructions: The maximum number of instructions to execute. 
+    @param max_instructions: The maximum number of instructions to execute.
     Default = 1000
     @type max_instructions: integer
+    @param optimizer: Function to generate the macros of a program (such
+    as peephole.optimize). Default = None (no optimization)
+    @param profile: Profile to record the execution (see Profile), which
+    can be shared by many executions. Default = None (no profiling)
+    @type profile: register_machine.Profile object
     '''
-    spointer = 0
-    apointer = 0
-    output = list()
-    if array == None:
-        array = [0] * size
-    if len(array) > size:
-        array = array[0:size]
-    if len(source) % function_size != 0:
-        source = source + '!'*(function_size - \
-                               len(source) % function_size)
-	tokens = list(functions.keys())
-	source = ''.join([x for x in source if x in tokens])
-    instruction_count = 0
-    while spointer < len(source):
-        instruction_count = instruction_count + 1
-        
+    source = prepare(source, functions, function_size)
+    program = Program(source, functions, function_size, optimizer, profile)
+    return execute(program, inputdata, array, size, max_instructions)
+
+def interpret_batch(sources, functions, function_size=1, inputdata=None,
+                    arrays=None, size=30, max_instructions=1000,
+                    optimizer=None, exceptions=(), profile=None):
+    '''
+    Interpreter loop for a batch of programs (such as the genomes of a
+    population), where each program is executed on its own input list and
+    tape. Each distinct source is prepared and compiled once for the
+    batch; hence, programs of the same source (such as the genomes of
+    clonal organisms) share the compiled program.
+
+    The programs are executed one after another, and not in lockstep over
+    a 2-D tape (programs x cells) with vectorized operations, as NumPy is
+    not a dependency of this package. Executing the programs in lockstep
+    in Python adds a dispatch for each instruction of each program without
+    vectorizing the operations. In addition, the programs may jump, change
+    their source or resize their tape independently, so the lanes would
+    diverge after a few instructions.
+
+    @param sources: Instructions to execute for each program.
+    @type sources: list
+    @param functions: Dictionary of functions / operations.
+    @param function_size: Length of each instruction. Default = 1
+    @type function_size: integer
+    @param inputdata: Input list for each program. Default = None (empty
+    input list for each program)
+    @type inputdata: list
+    @param arrays: Tape for each program. Default = None (new tape for each
+    program)
+    @type arrays: list
+    @param size: Length of the type (array). Default = 30
+    @type size: integer
+    @param max_instructions: The maximum number of instructions to execute
+    for each program. Default = 1000
+    @type max_instructions: integer
+    @param optimizer: Function to generate the macros of a program (such
+    as peephole.optimize). Default = None (no optimization)
+    @param exceptions: Tuple of exception classes which stop the execution
+    of a program without stopping the batch. Default = () (exceptions are
+    raised)
+    @type exceptions: tuple
+    @param profile: Profile to record the executions (see Profile).
+    Default = None (no profiling)
+    @type profile: register_machine.Profile object
+    @return: list of (array, apointer, inputdata, output, source,
+    spointer, instruction count) for each program, or the exception
+    raised by the program if the exception is in exceptions.
+    '''
+    if inputdata is None:
+        inputdata = [[] for source in sources]
+    if arrays is None:
+        arrays = [None] * len(sources)
+    programs = {}
+    results = []
+    for index in range(len(sources)):
+        source = sources[index]
+        if source not in programs:
+            programs[source] = Program(prepare(source, functions,
+                                               function_size),
+                                       functions, function_size, optimizer,
+                                       profile)
         try:
-            cmd = source[spointer:spointer+function_size]
-            #print instruction_count, cmd
-            (array, apointer, inputdata, output,
-                source, spointer) = functions[cmd](array, apointer,
-                                                   inputdata, output,
-                                                   source, spointer)
-        except KeyError:
-            print(' '.join(['Unknown function: ', cmd,
-                            'at source position', str(spointer)]))
-        if apointer > size - 1:
-            apointer = apointer - size
-        if apointer < 0:
-            apointer = size + apointer
-        spointer = spointer + function_size
-        if instruction_count > max_instructions:
-            return (array, apointer, inputdata, output, source, spointer)
-    return (array, apointer, inputdata, output, source, spointer)
+            results.append(_execute(programs[source], inputdata[index],
+                                    arrays[index], size, max_instructions))
+        except exceptions as error:
+            results.append(error)
+    return results
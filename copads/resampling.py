@@ -0,0 +1,327 @@
+'''
+Resampling Methods - Bootstrap and Permutation Tests.
+Date created: 18th October 2026
+Licence: Python Software Foundation License version 2
+
+Resampling is carried out in batches of replicates. Each batch draws its
+random numbers from its own Mersenne Twister (copads.randomize) stream,
+which is seeded from a master stream; hence, the results depend only on the
+seed, and not on the number of processes used. Batches can be executed in
+a pool of worker processes, and resampling can be stopped early when the
+width of the confidence interval (bootstrap) or of the p-value (permutation
+test) converges.
+
+Statistic to estimate can be
+    - any function that takes a list of data and returns a number, or
+    - name of a statistic in SingleSample.summary (such as 'aMean',
+    'median', 'variance'), or
+    - for permutation tests, any function that takes 2 lists of data and
+    returns a number or a 5-element result list from copads.hypothesis
+    (where the calculated statistic is the 3rd element).
+
+Note that functions must be defined at module level (not lambda functions)
+in order to be used with more than one process.
+
+References
+    - Efron, B. and Tibshirani, R.J. 1993. An Introduction to the
+    Bootstrap. Chapman & Hall/CRC.
+    - Good, P. 2005. Permutation, Parametric and Bootstrap Tests of
+    Hypotheses, 3rd edition. Springer.
+'''
+import math
+import multiprocessing
+from functools import partial
+
+from .copadsexceptions import FunctionParameterValueError
+from .randomize import MersenneTwister
+from .samplestatistics import SingleSample
+from .samplestatistics import select
+
+
+def sampleStatistic(name, data):
+    '''
+    Calculates a statistic in SingleSample.summary from a list of data.
+
+    @param name: name of statistic (such as 'aMean', 'median', 'variance')
+    @param data: a 1-dimensional list of numerical data
+    @return: value of statistic
+    '''
+    return SingleSample(data).summary[name]
+
+def meanDifference(data1, data2):
+    '''
+    Calculates the difference in arithmetic means of 2 samples (default
+    statistic for permutation tests).
+    '''
+    return (sum(data1) / float(len(data1))) - (sum(data2) / float(len(data2)))
+
+def statisticValue(result):
+    '''
+    Returns the numerical value of a statistic function result, which is
+    the calculated statistic (3rd element) if the result is a 5-element
+    list from copads.hypothesis.
+    '''
+    if isinstance(result, (list, tuple)):
+        return result[2]
+    return result
+
+def resampleIndices(rng, n, size=None):
+    '''
+    Draws a list of indices with replacement.
+
+    @param rng: random number generator from copads.randomize
+    @param n: number of data elements to draw indices from (0 to n-1)
+    @param size: number of indices to draw. Default = n
+    @return: list of indices
+    '''
+    if size is None: size = n
+    randrange = rng.randrange
+    return [randrange(0, n) for i in range(size)]
+
+def permuteIndices(rng, n):
+    '''
+    Generates a random permutation of indices (0 to n-1) by Fisher-Yates
+    shuffle.
+
+    @param rng: random number generator from copads.randomize
+    @param n: number of indices
+    @return: list of indices
+    '''
+    indices = list(range(n))
+    randrange = rng.randrange
+    for i in range(n - 1, 0, -1):
+        j = randrange(0, i + 1)
+        indices[i], indices[j] = indices[j], indices[i]
+    return indices
+
+def bootstrapBatch(data, statistic, replicates, seed):
+    '''
+    Generates a batch of bootstrap replicates of a statistic.
+
+    @param data: a 1-dimensional list of data
+    @param statistic: function to calculate the statistic from a list
+    @param replicates: number of replicates in the batch
+    @param seed: seed for the random number stream of the batch
+    @return: list of replicated values of the statistic
+    '''
+    rng = MersenneTwister(seed)
+    n = len(data)
+    results = []
+    for r in range(replicates):
+        indices = resampleIndices(rng, n)
+        results.append(statisticValue(statistic([data[i]
+                                                 for i in indices])))
+    return results
+
+def permutationBatch(data1, data2, statistic, observed, replicates, seed):
+    '''
+    Generates a batch of permutations and counts the number of permuted
+    statistics which are as extreme as the observed statistic.
+
+    @param data1: a 1-dimensional list of data (sample #1)
+    @param data2: a 1-dimensional list of data (sample #2)
+    @param statistic: function to calculate the statistic from 2 lists
+    @param observed: observed value of the statistic
+    @param replicates: number of permutations in the batch
+    @param seed: seed for the random number stream of the batch
+    @return: tuple of (number of permuted statistics >= observed, number
+    of permuted statistics <= observed, absolute number of permuted
+    statistics >= absolute observed)
+    '''
+    rng = MersenneTwister(seed)
+    pooled = list(data1) + list(data2)
+    n1 = len(data1)
+    (upper, lower, both) = (0, 0, 0)
+    for r in range(replicates):
+        indices = permuteIndices(rng, len(pooled))
+        value = statisticValue(statistic([pooled[i] for i in indices[:n1]],
+                                         [pooled[i] for i in indices[n1:]]))
+        if value >= observed: upper = upper + 1
+        if value <= observed: lower = lower + 1
+        if abs(value) >= abs(observed): both = both + 1
+    return (upper, lower, both)
+
+def percentile(values, p):
+    '''
+    Returns the p-th percentile (0 <= p <= 1) of a list of values by
+    selection, interpolating between closest ranks.
+    '''
+    position = p * (len(values) - 1)
+    lower = int(math.floor(position))
+    value = select(values, lower)
+    if position > lower:
+        value = value + (position - lower) * \
+                (select(values, lower + 1) - value)
+    return value
+
+def _run(function, argsets, processes):
+    '''
+    Executes a function over a list of argument tuples, either serially or
+    in a pool of worker processes, and returns the results in order.
+    '''
+    if processes is None or processes <= 1 or len(argsets) == 1:
+        return [function(*args) for args in argsets]
+    pool = multiprocessing.Pool(processes)
+    try:
+        results = [pool.apply_async(function, args) for args in argsets]
+        return [result.get() for result in results]
+    finally:
+        pool.close()
+        pool.join()
+
+def _batchSizes(total, batch_size, count):
+    '''
+    Splits the remaining number of replicates into batches.
+    '''
+    sizes = []
+    while total > 0 and len(sizes) < count:
+        sizes.append(min(batch_size, total))
+        total = total - sizes[-1]
+    return sizes
+
+def bootstrap(data, statistic='aMean', replicates=1000, confidence=0.95,
+              seed=None, processes=1, batch_size=100, tolerance=None):
+    '''
+    Estimates the sampling distribution of a statistic by bootstrapping
+    (resampling with replacement), and calculates its standard error and
+    percentile confidence interval.
+
+    @param data: a 1-dimensional list of data
+    @param statistic: function to calculate the statistic from a list of
+    data, or name of statistic in SingleSample.summary. Default = 'aMean'
+    @param replicates: maximum number of bootstrap replicates.
+    Default = 1000
+    @type replicates: integer
+    @param confidence: confidence level of 2-tailed confidence interval.
+    Default = 0.95
+    @type confidence: float
+    @param seed: seed for the master random number stream (optional)
+    @type seed: integer
+    @param processes: number of worker processes. Default = 1 (no worker
+    process)
+    @type processes: integer
+    @param batch_size: number of replicates per batch. Default = 100
+    @type batch_size: integer
+    @param tolerance: if given, resampling stops when the width of the
+    confidence interval changes by less than tolerance (relative to the
+    width) after a batch. Batches are evaluated in order, hence, the
+    result does not depend on the number of processes
+    @type tolerance: float
+    @return: dictionary of 'statistic' (observed value), 'replicates'
+    (list of bootstrapped values), 'mean', 'bias', 'stderr', 'lower' and
+    'upper' (confidence limits)
+    @raise FunctionParameterValueError: if data is empty, or replicates or
+    batch_size is less than 1
+    '''
+    if len(data) == 0:
+        raise FunctionParameterValueError('data must not be empty')
+    if replicates < 1:
+        raise FunctionParameterValueError('replicates must be at least 1')
+    if batch_size < 1:
+        raise FunctionParameterValueError('batch_size must be at least 1')
+    if isinstance(statistic, str):
+        statistic = partial(sampleStatistic, statistic)
+    data = list(data)
+    master = MersenneTwister(seed)
+    processes = max(1, processes or 1)
+    values = []
+    width = None
+    converged = False
+    while not converged and len(values) < replicates:
+        sizes = _batchSizes(replicates - len(values), batch_size, processes)
+        argsets = [(data, statistic, size, master.randint())
+                   for size in sizes]
+        for batch in _run(bootstrapBatch, argsets, processes):
+            values.extend(batch)
+            if tolerance is None: continue
+            lower = percentile(values, (1.0 - confidence) / 2.0)
+            upper = percentile(values, 1.0 - ((1.0 - confidence) / 2.0))
+            if width is not None and \
+                abs((upper - lower) - width) <= tolerance * abs(upper - lower):
+                converged = True
+                break
+            width = upper - lower
+    lower = percentile(values, (1.0 - confidence) / 2.0)
+    upper = percentile(values, 1.0 - ((1.0 - confidence) / 2.0))
+    observed = statisticValue(statistic(data))
+    mean = sum(values) / float(len(values))
+    if len(values) > 1:
+        stderr = math.sqrt(sum([(x - mean) ** 2 for x in values]) /
+                           float(len(values) - 1))
+    else:
+        stderr = 0.0
+    return {'statistic': observed,
+            'replicates': values,
+            'mean': mean,
+            'bias': mean - observed,
+            'stderr': stderr,
+            'lower': lower,
+            'upper': upper}
+
+def permutationTest(data1, data2, statistic=meanDifference,
+                    permutations=1000, alternative='two-sided',
+                    seed=None, processes=1, batch_size=100,
+                    tolerance=None):
+    '''
+    Performs a 2-sample permutation (randomization) test, by comparing the
+    observed statistic to the statistics calculated from random
+    re-assignments of the pooled data into 2 samples of the original
+    sizes.
+
+    @param data1: a 1-dimensional list of data (sample #1)
+    @param data2: a 1-dimensional list of data (sample #2)
+    @param statistic: function to calculate the statistic from 2 lists of
+    data. Default = difference in arithmetic means
+    @param permutations: maximum number of permutations. Default = 1000
+    @type permutations: integer
+    @param alternative: alternative hypothesis; 'two-sided', 'greater'
+    (statistic of sample #1 is greater) or 'less'. Default = 'two-sided'
+    @param seed: seed for the master random number stream (optional)
+    @type seed: integer
+    @param processes: number of worker processes. Default = 1 (no worker
+    process)
+    @type processes: integer
+    @param batch_size: number of permutations per batch. Default = 100
+    @type batch_size: integer
+    @param tolerance: if given, permutations stop when the width of the
+    95% confidence interval of p-value falls below tolerance after a
+    batch. Batches are evaluated in order, hence, the result does not
+    depend on the number of processes
+    @type tolerance: float
+    @return: dictionary of 'statistic' (observed value), 'pvalue' and
+    'permutations' (number of permutations done)
+    @raise FunctionParameterValueError: if alternative is not allowed, or
+    permutations or batch_size is less than 1
+    '''
+    if alternative not in ('two-sided', 'greater', 'less'):
+        raise FunctionParameterValueError('alternative must be two-sided, \
+greater or less')
+    if permutations < 1:
+        raise FunctionParameterValueError('permutations must be at least 1')
+    if batch_size < 1:
+        raise FunctionParameterValueError('batch_size must be at least 1')
+    data1 = list(data1)
+    data2 = list(data2)
+    observed = statisticValue(statistic(data1, data2))
+    master = MersenneTwister(seed)
+    processes = max(1, processes or 1)
+    (count, extreme) = (0, 0)
+    converged = False
+    while not converged and count < permutations:
+        sizes = _batchSizes(permutations - count, batch_size, processes)
+        argsets = [(data1, data2, statistic, observed, size,
+                    master.randint()) for size in sizes]
+        results = _run(permutationBatch, argsets, processes)
+        for (size, (upper, lower, both)) in zip(sizes, results):
+            count = count + size
+            if alternative == 'greater': extreme = extreme + upper
+            elif alternative == 'less': extreme = extreme + lower
+            else: extreme = extreme + both
+            pvalue = (extreme + 1) / float(count + 1)
+            if tolerance is not None and 2 * 1.96 * \
+                math.sqrt(pvalue * (1.0 - pvalue) / count) < tolerance:
+                converged = True
+                break
+    return {'statistic': observed,
+            'pvalue': pvalue,
+            'permutations': count}
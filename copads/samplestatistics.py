@@ -15,31 +15,718 @@ input):
     - skew
     - kurtosis
 
+StreamingSummary uses the single-pass update and pairwise combination 
+formulae for arbitrary-order central moments from Pebay, P. 2008. Formulas 
+for Robust, One-Pass Parallel Computation of Covariances and 
+Arbitrary-Order Statistical Moments. Sandia Report SAND2008-6212.
+
+QuantileSketch is an implementation of the KLL sketch from Karnin, Z., 
+Lang, K. and Liberty, E. 2016. Optimal Quantile Approximation in Streams. 
+In Proceedings of the 57th Annual IEEE Symposium on Foundations of Computer 
+Science, 71-78.
+
 Copyright (c) Maurice H.T. Ling <mauriceling@acm.org>
 '''
 
 import math
+import random
 from .statisticsdistribution import Distribution
 from .copadsexceptions import FunctionParameterTypeError
 from .copadsexceptions import FunctionParameterValueError
 from .matrix import Matrix
 from . import nrpy
 
+def select(data, k):
+    '''
+    Returns the k-th smallest value (k = 0 for minimum) of the data 
+    without sorting or changing the data, using introspective selection 
+    (introselect). Quickselect with median-of-3 pivots is used, which 
+    falls back to sorting the remaining partition when partitioning does 
+    not shrink fast enough, hence the worst case is O(n log n) while the 
+    expected case is O(n).
+
+    @param data: a 1-dimensional list of numerical data
+    @param k: rank of the value to select (0 to len(data)-1)
+    @return: k-th smallest value
+
+    @since: version 0.5.1
+    '''
+    if k < 0 or k >= len(data):
+        raise FunctionParameterValueError('k must be between 0 and %s' % 
+                                          str(len(data) - 1))
+    depth = 2 * int(math.log(len(data), 2) + 1)
+    while len(data) > 16:
+        if depth == 0:
+            return sorted(data)[k]
+        depth = depth - 1
+        pivot = sorted([data[0], data[len(data) // 2], data[-1]])[1]
+        lower = [x for x in data if x < pivot]
+        if k < len(lower):
+            data = lower
+            continue
+        equal = len(data) - len(lower) - \
+                len([x for x in data if x > pivot])
+        if k < len(lower) + equal:
+            return pivot
+        k = k - len(lower) - equal
+        data = [x for x in data if x > pivot]
+    return sorted(data)[k]
+
+def median(data):
+    '''
+    Returns the median of the data using selection (see select function) 
+    instead of sorting; hence, the data is not changed.
+
+    @param data: a 1-dimensional list of numerical data
+    @return: value of median
+
+    @since: version 0.5.1
+    '''
+    n = len(data)
+    upper = select(data, n // 2)
+    if n % 2 == 1:
+        return upper
+    lower = [x for x in data if x < upper]
+    if len(lower) < n // 2:
+        return upper
+    return 0.5 * (max(lower) + upper)
+
+
+class QuantileSketch(object):
+    '''
+    Mergeable streaming quantile sketch (KLL sketch) to estimate median, 
+    quantiles and ranks of a stream of data using bounded memory. Data 
+    values are kept in a hierarchy of compactors where each value in 
+    compactor h represents 2^h values of the data stream. When a compactor 
+    is full, it is sorted and every other value (starting from a random 
+    offset) is promoted to the next compactor.
+    '''
+    def __init__(self, k=200, seed=None):
+        '''
+        Constructor method.
+
+        @param k: size of the largest compactor; controls the accuracy 
+        (rank error decreases with k) and memory usage. Default = 200.
+        @type k: integer
+        @param seed: seed for the random number generator used in 
+        compaction (optional)
+        '''
+        self.k = k
+        self.count = 0
+        self.size = 0
+        self.maxSize = 0
+        self.minimum = None
+        self.maximum = None
+        self.compactors = []
+        self.random = random.Random(seed)
+        self.grow()
+
+    def capacity(self, height):
+        '''
+        Returns the capacity of compactor at the given height.
+        '''
+        depth = len(self.compactors) - height - 1
+        return int(math.ceil(self.k * ((2.0 / 3.0) ** depth))) + 1
+
+    def grow(self):
+        '''
+        Adds a new top-level compactor.
+        '''
+        self.compactors.append([])
+        self.maxSize = sum([self.capacity(height) 
+                            for height in range(len(self.compactors))])
+
+    def compact(self, height):
+        '''
+        Sorts compactor at the given height and promotes every other 
+        value into the next compactor. The last value is retained if the 
+        compactor has an odd number of values.
+        '''
+        if height + 1 >= len(self.compactors):
+            self.grow()
+        compactor = self.compactors[height]
+        compactor.sort()
+        retained = []
+        if len(compactor) % 2 == 1:
+            retained = [compactor.pop()]
+        offset = self.random.randint(0, 1)
+        self.compactors[height + 1].extend(compactor[offset::2])
+        self.compactors[height] = retained
+
+    def compress(self):
+        '''
+        Compacts full compactors, starting from the lowest, until the 
+        total number of retained values is below maximum size.
+        '''
+        for height in range(len(self.compactors)):
+            if len(self.compactors[height]) >= self.capacity(height):
+                self.compact(height)
+                self.size = sum([len(c) for c in self.compactors])
+                if self.size < self.maxSize:
+                    break
+
+    def add(self, value):
+        '''
+        Adds one data value into the sketch.
+
+        @param value: numerical value
+        '''
+        self.compactors[0].append(value)
+        self.count = self.count + 1
+        self.size = self.size + 1
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        if self.size >= self.maxSize:
+            self.compress()
+
+    def update(self, data):
+        '''
+        Adds a stream of data values into the sketch.
+
+        @param data: iterable of numerical values
+        @return: this sketch (to allow chaining)
+        '''
+        for value in data:
+            self.add(value)
+        return self
+
+    def merge(self, other):
+        '''
+        Combines another sketch into this sketch.
+
+        @param other: QuantileSketch object
+        @return: this sketch (to allow chaining)
+        '''
+        if other.count == 0:
+            return self
+        while len(self.compactors) < len(other.compactors):
+            self.grow()
+        for height in range(len(other.compactors)):
+            self.compactors[height].extend(other.compactors[height])
+        self.count = self.count + other.count
+        if self.minimum is None or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if self.maximum is None or other.maximum > self.maximum:
+            self.maximum = other.maximum
+        self.size = sum([len(c) for c in self.compactors])
+        while self.size >= self.maxSize:
+            self.compress()
+        return self
+
+    def weightedValues(self):
+        '''
+        Returns a sorted list of (value, weight) tuples of the retained 
+        values.
+        '''
+        weighted = []
+        for height in range(len(self.compactors)):
+            weight = 2 ** height
+            weighted.extend([(value, weight) 
+                             for value in self.compactors[height]])
+        weighted.sort()
+        return weighted
+
+    def rank(self, value):
+        '''
+        Returns the estimated number of data values which are less than or 
+        equal to the given value.
+        '''
+        total = 0
+        for height in range(len(self.compactors)):
+            weight = 2 ** height
+            total = total + weight * len([x for x in self.compactors[height]
+                                          if x <= value])
+        return total
+
+    def cdf(self, value):
+        '''
+        Returns the estimated fraction of data values which are less than 
+        or equal to the given value.
+        '''
+        if self.count == 0: return 0.0
+        weight = sum([(2 ** height) * len(self.compactors[height]) 
+                      for height in range(len(self.compactors))])
+        return self.rank(value) / float(weight)
+
+    def quantile(self, q):
+        '''
+        Returns the estimated q-th quantile of the data.
+
+        @param q: quantile (0 <= q <= 1); for example, 0.5 for median
+        @return: estimated value of q-th quantile, or None if the sketch 
+        is empty
+        '''
+        if q < 0 or q > 1:
+            raise FunctionParameterValueError('q must be between 0 and 1')
+        if self.count == 0: return None
+        if q == 0: return self.minimum
+        if q == 1: return self.maximum
+        weighted = self.weightedValues()
+        target = q * sum([weight for (value, weight) in weighted])
+        cumulative = 0
+        for (value, weight) in weighted:
+            cumulative = cumulative + weight
+            if cumulative >= target:
+                return value
+        return self.maximum
+
+    def quantiles(self, qs):
+        '''
+        Returns a list of estimated quantiles.
+
+        @param qs: list of quantiles (each 0 <= q <= 1)
+        '''
+        return [self.quantile(q) for q in qs]
+
+
+class StreamingSummary(object):
+    '''
+    Single-pass (online) accumulator of summary statistics. Each data 
+    value is visited only once, hence data can be streamed from a file or 
+    generator which is larger than the available memory. Partial 
+    accumulators (from chunks of data or different processes) can be 
+    combined using merge method.
+
+    Mean and the 2nd to 4th central moments are accumulated by 
+    Welford/Pebay updates, geometric mean by the sum of logarithms, and 
+    harmonic mean by the sum of reciprocals. Median and other quantiles 
+    are only available when a quantile sketch (such as QuantileSketch, or 
+    any object with add, merge and quantile methods) is given.
+    '''
+    def __init__(self, data=None, sketch=None):
+        '''
+        Constructor method.
+
+        @param data: iterable of numerical values to accumulate (optional)
+        @param sketch: quantile sketch object to estimate median and 
+        quantiles (optional)
+        '''
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.M2 = 0.0
+        self.M3 = 0.0
+        self.M4 = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.log_sum = 0.0
+        self.log_valid = True
+        self.zero_count = 0
+        self.reciprocal_sum = 0.0
+        self.sketch = sketch
+        if data is not None:
+            self.update(data)
+
+    def add(self, value):
+        '''
+        Adds one data value into the accumulator.
+
+        @param value: numerical value
+        '''
+        value = float(value)
+        n1 = self.count
+        self.count = n = n1 + 1
+        self.total = self.total + value
+        delta = value - self.mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n1
+        self.mean = self.mean + delta_n
+        self.M4 = self.M4 + (term1 * delta_n2 * (n * n - 3 * n + 3)) + \
+                  (6 * delta_n2 * self.M2) - (4 * delta_n * self.M3)
+        self.M3 = self.M3 + (term1 * delta_n * (n - 2)) - \
+                  (3 * delta_n * self.M2)
+        self.M2 = self.M2 + term1
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        if value > 0:
+            self.log_sum = self.log_sum + math.log(value)
+            self.reciprocal_sum = self.reciprocal_sum + (1.0 / value)
+        elif value == 0:
+            self.zero_count = self.zero_count + 1
+            self.reciprocal_sum = self.reciprocal_sum + (1.0 / 0.001)
+        else:
+            self.log_valid = False
+            self.reciprocal_sum = self.reciprocal_sum + (1.0 / value)
+        if self.sketch is not None:
+            self.sketch.add(value)
+
+    def update(self, data):
+        '''
+        Adds a stream of data values into the accumulator.
+
+        @param data: iterable of numerical values
+        @return: this accumulator (to allow chaining)
+        '''
+        for value in data:
+            self.add(value)
+        return self
+
+    def merge(self, other):
+        '''
+        Combines another accumulator into this accumulator, such that the 
+        result is the same as if all data values had been added into this 
+        accumulator.
+
+        @param other: StreamingSummary object
+        @return: this accumulator (to allow chaining)
+        '''
+        if other.count == 0:
+            return self
+        self.total = self.total + other.total
+        if self.count == 0:
+            self.count = other.count
+            self.mean = other.mean
+            self.M2 = other.M2
+            self.M3 = other.M3
+            self.M4 = other.M4
+        else:
+            na = float(self.count)
+            nb = float(other.count)
+            n = na + nb
+            delta = other.mean - self.mean
+            delta2 = delta * delta
+            M2 = self.M2 + other.M2 + (delta2 * na * nb / n)
+            M3 = self.M3 + other.M3 + \
+                 (delta2 * delta * na * nb * (na - nb) / (n * n)) + \
+                 (3.0 * delta * ((na * other.M2) - (nb * self.M2)) / n)
+            M4 = self.M4 + other.M4 + \
+                 (delta2 * delta2 * na * nb * 
+                  ((na * na) - (na * nb) + (nb * nb)) / (n * n * n)) + \
+                 (6.0 * delta2 * 
+                  ((na * na * other.M2) + (nb * nb * self.M2)) / (n * n)) + \
+                 (4.0 * delta * ((na * other.M3) - (nb * self.M3)) / n)
+            self.count = self.count + other.count
+            self.mean = self.mean + (delta * nb / n)
+            self.M2 = M2
+            self.M3 = M3
+            self.M4 = M4
+        if self.minimum is None or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if self.maximum is None or other.maximum > self.maximum:
+            self.maximum = other.maximum
+        self.log_sum = self.log_sum + other.log_sum
+        self.log_valid = self.log_valid and other.log_valid
+        self.zero_count = self.zero_count + other.zero_count
+        self.reciprocal_sum = self.reciprocal_sum + other.reciprocal_sum
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        return self
+
+    def moment(self, moment=1):
+        '''
+        Returns the nth (1 to 4) moment about the mean.
+        '''
+        if moment == 1 or self.count == 0:
+            return 0.0
+        if moment == 2: return self.M2 / self.count
+        if moment == 3: return self.M3 / self.count
+        if moment == 4: return self.M4 / self.count
+        raise FunctionParameterValueError('Only moments 1 to 4 are tracked')
+
+    def arithmeticMean(self):
+        '''
+        Returns the arithmetic mean of the accumulated data.
+        '''
+        return self.mean
+
+    def geometricMean(self):
+        '''
+        Returns the geometric mean of the accumulated data, or NaN if any 
+        data value is negative.
+        '''
+        if not self.log_valid: return float('nan')
+        if self.zero_count > 0: return 0.0
+        return math.exp(self.log_sum / self.count)
+
+    def harmonicMean(self):
+        '''
+        Returns the harmonic mean of the accumulated data. As in 
+        SingleSample.harmonicMean, zeros are taken as 0.001.
+        '''
+        return self.count / (0.000001 + self.reciprocal_sum)
+
+    def variance(self):
+        '''
+        Returns the (sample) variance of the accumulated data.
+        '''
+        if self.count < 2: return float('nan')
+        return self.M2 / float(self.count - 1)
+
+    def skew(self):
+        '''
+        Returns the skewness of the accumulated data, as defined in 
+        SingleSample.skew.
+        '''
+        return self.moment(3) / math.pow(self.moment(2), 1.5)
+
+    def kurtosis(self):
+        '''
+        Returns the kurtosis of the accumulated data, as defined in 
+        SingleSample.kurtosis.
+        '''
+        return self.moment(4) / math.pow(self.moment(2), 2.0)
+
+    def range(self):
+        '''
+        Returns the range of the accumulated data (maximum - minimum).
+        '''
+        return self.maximum - self.minimum
+
+    def quantile(self, q):
+        '''
+        Returns the q-th quantile (0 <= q <= 1) as estimated by the quantile 
+        sketch, or None if no quantile sketch is used.
+        '''
+        if self.sketch is None: return None
+        return self.sketch.quantile(q)
+
+    def summary(self):
+        '''
+        Returns a dictionary of summary statistics, using the same keys as 
+        SingleSample.summary. Median is None if no quantile sketch is used.
+        '''
+        result = {}
+        result['gMean'] = self.geometricMean()
+        result['hMean'] = self.harmonicMean()
+        result['aMean'] = self.arithmeticMean()
+        result['skew'] = self.skew()
+        result['kurtosis'] = self.kurtosis()
+        result['variance'] = self.variance()
+        result['stdev'] = result['variance'] ** 0.5
+        result['variation'] = 100.0 * result['stdev'] / result['aMean']
+        result['range'] = self.range()
+        result['median'] = self.quantile(0.5)
+        return result
+
+
+class LazySummary(dict):
+    '''
+    Dictionary of summary statistics for SingleSample, where each 
+    statistic is only calculated when it is first looked up, and is then 
+    kept until the sample data is changed. Looking up a statistic by get 
+    method or membership test calculates it as well, and listing the 
+    statistics (keys, values, items, iteration, length or comparison) 
+    calculates all of them; hence, the dictionary has the same contents 
+    as if all statistics had been calculated beforehand.
+    '''
+    statistics = ('gMean', 'hMean', 'aMean', 'skew', 'kurtosis', 
+                  'variance', 'stdev', 'variation', 'range', 'median')
+
+    def __init__(self, sample):
+        dict.__init__(self)
+        self.sample = sample
+
+    def __missing__(self, key):
+        return self.sample.calculate(key)
+
+    def calculateAll(self):
+        '''
+        Calculates all statistics which have not been calculated.
+        '''
+        for key in self.statistics:
+            self[key]
+
+    def get(self, key, default=None):
+        if key in self.statistics:
+            return self[key]
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        return key in self.statistics or dict.__contains__(self, key)
+
+    def keys(self):
+        self.calculateAll()
+        return dict.keys(self)
+
+    def values(self):
+        self.calculateAll()
+        return dict.values(self)
+
+    def items(self):
+        self.calculateAll()
+        return dict.items(self)
+
+    def copy(self):
+        self.calculateAll()
+        return dict(dict.items(self))
+
+    def __iter__(self):
+        self.calculateAll()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self.calculateAll()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self.calculateAll()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self.calculateAll()
+        return dict.__ne__(self, other)
+
+    def __repr__(self):
+        self.calculateAll()
+        return dict.__repr__(self)
+
+
+class SampleData(list):
+    '''
+    List of data values of SingleSample, which clears the cached 
+    statistics of the sample whenever the list is changed in-place.
+    '''
+    def __init__(self, data=(), sample=None):
+        list.__init__(self, data)
+        self.sample = sample
+
+    def changed(self):
+        if self.sample is not None:
+            self.sample.invalidate()
+
+    def __setitem__(self, index, value):
+        list.__setitem__(self, index, value)
+        self.changed()
+
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self.changed()
+
+    def __iadd__(self, data):
+        list.extend(self, data)
+        self.changed()
+        return self
+
+    def __imul__(self, n):
+        list.__imul__(self, n)
+        self.changed()
+        return self
+
+    def append(self, value):
+        list.append(self, value)
+        self.changed()
+
+    def extend(self, data):
+        list.extend(self, data)
+        self.changed()
+
+    def insert(self, index, value):
+        list.insert(self, index, value)
+        self.changed()
+
+    def pop(self, index=-1):
+        value = list.pop(self, index)
+        self.changed()
+        return value
+
+    def remove(self, value):
+        list.remove(self, value)
+        self.changed()
+
+    def clear(self):
+        del self[:]
+
+
 class SingleSample(object):
     '''
-    Class to hold a single sample, and provides calculations on the sample
+    Class to hold a single sample, and provides calculations on the sample.
+
+    Statistics are calculated lazily - only when asked for, either by 
+    method call or by lookup in summary dictionary - and are cached. 
+    Statistics that are based on central moments (variance, standard 
+    deviation, skew, kurtosis, variation) as well as geometric mean, 
+    harmonic mean and range are calculated together in a single pass over 
+    the data, at first use of any one of them. The data is kept as a 
+    SampleData list; assigning new data to the sample, or changing the 
+    data list in-place, clears the cache.
     '''
-    data = None
     rowcount = 0
     name = None
-    summary = {}
     
     def __init__(self, data, name='Sample 1'):
-        self.data = data
-        self.rowcount = len(self.data)
         self.name = name
-        self.fullSummary()
-        
+        self.summary = LazySummary(self)
+        self.accumulator = None
+        self.data = data
+
+    def getData(self):
+        return self._data
+
+    def setData(self, data):
+        self._data = SampleData(data, self)
+        self.invalidate()
+
+    data = property(getData, setData)
+
+    def invalidate(self):
+        '''
+        Clears all cached statistics. This is called whenever the data 
+        list is changed.
+
+        @since: version 0.5.1
+        '''
+        self.rowcount = len(self._data)
+        self.summary.clear()
+        self.accumulator = None
+
+    def calculate(self, key):
+        '''
+        Calculates and caches a summary statistic.
+
+        @param key: name of statistic, which is one of 'aMean', 'gMean', 
+        'hMean', 'skew', 'kurtosis', 'variance', 'stdev', 'variation', 
+        'range', or 'median'
+        @return: value of the statistic
+        @since: version 0.5.1
+        '''
+        if key == 'aMean':
+            self.summary[key] = sum(self.data) / float(self.rowcount)
+        elif key == 'median':
+            self.summary[key] = median(self.data)
+        elif key in ('gMean', 'hMean', 'skew', 'kurtosis', 'variance', 
+                     'stdev', 'variation', 'range'):
+            statistics = self.moments().summary()
+            del statistics['median']
+            del statistics['aMean']
+            self.summary.update(statistics)
+        else:
+            raise KeyError(key)
+        return self.summary[key]
+
+    def moments(self):
+        '''
+        Returns the single-pass accumulator (StreamingSummary) of the 
+        data, which is calculated once and cached.
+
+        @since: version 0.5.1
+        '''
+        if self.accumulator is None:
+            self.accumulator = StreamingSummary(self.data)
+        return self.accumulator
+
+    def quantile(self, q):
+        '''
+        Returns the q-th quantile (0 <= q <= 1) of the data, by linear 
+        interpolation between the closest ranks. Values are found by 
+        selection (see select function) without sorting the data.
+
+        @since: version 0.5.1
+        '''
+        if q < 0 or q > 1:
+            raise FunctionParameterValueError('q must be between 0 and 1')
+        position = q * (self.rowcount - 1)
+        lower = int(math.floor(position))
+        value = select(self.data, lower)
+        if position > lower:
+            upper = select(self.data, lower + 1)
+            value = value + (position - lower) * (upper - value)
+        return value
+
     def geometricMean(self):
         '''
         Calculates the geometric mean of the data
@@ -47,10 +734,7 @@ class SingleSample(object):
         @status: Tested method
         @since: version 0.1
         '''
-        mult = 1.0
-        one_over_n = 1.0 / len(self.data)
-        for item in self.data: mult = mult * math.pow(item, one_over_n)
-        return mult
+        return self.summary['gMean']
     
     def harmonicMean(self):
         '''
@@ -59,11 +743,7 @@ class SingleSample(object):
         @status: Tested method
         @since: version 0.1
         '''
-        sum = 0.000001
-        for item in self.data:
-            if item != 0: sum = sum + 1.0/item
-            else: sum = sum + 1.0/0.001
-        return len(self.data) / sum
+        return self.summary['hMean']
     
     def arithmeticMean(self):
         '''
@@ -72,7 +752,7 @@ class SingleSample(object):
         @status: Tested method
         @since: version 0.1
         '''
-        return sum(self.data) / float(len(self.data))
+        return self.summary['aMean']
     
     def moment(self, moment=1):
         '''
@@ -80,6 +760,8 @@ class SingleSample(object):
         '''
         if moment == 1:
             return 0.0
+        elif moment in (2, 3, 4):
+            return self.moments().moment(moment)
         else:
             mn = self.arithmeticMean()
             n = len(self.data)
@@ -97,7 +779,7 @@ class SingleSample(object):
         @status: Tested method
         @since: version 0.1
         '''
-        return self.moment(3) / math.pow(self.moment(2), 1.5)
+        return self.summary['skew']
 
     def kurtosis(self):
         '''
@@ -108,7 +790,7 @@ class SingleSample(object):
         @status: Tested method
         @since: version 0.1
         '''
-        return self.moment(4) / math.pow(self.moment(2), 2.0)
+        return self.summary['kurtosis']
     
     def variation(self):
         '''
@@ -119,7 +801,7 @@ class SingleSample(object):
         @status: Tested method
         @since: version 0.1
         '''
-        return 100.0 * self.summary['stdev'] / self.summary['aMean']
+        return self.summary['variation']
 
     def range(self):
         '''
@@ -128,8 +810,7 @@ class SingleSample(object):
         @status: Tested method
         @since: version 0.1
         '''
-        self.data.sort()
-        return float(self.data[-1]) - float(self.data[0])
+        return self.summary['range']
 
     def variance(self):
         '''
@@ -138,26 +819,19 @@ class SingleSample(object):
         @status: Tested method
         @since: version 0.1
         '''
-        sum = 0.0
-        mean = self.arithmeticMean()
-        for item in self.data:
-            sum = sum + (float(item) - float(mean)) ** 2
-        return sum / float(len(self.data) - 1)
+        return self.summary['variance']
     
     def __str__(self):
-        return str(self.summary)
+        self.fullSummary()
+        return str(dict(self.summary))
         
     def fullSummary(self):
-        self.summary['gMean'] = self.geometricMean()
-        self.summary['hMean'] = self.harmonicMean()
-        self.summary['aMean'] = self.arithmeticMean()
-        self.summary['skew'] = self.skew()
-        self.summary['kurtosis'] = self.kurtosis()
-        self.summary['variance'] = self.variance()
-        self.summary['stdev'] = self.summary['variance'] ** 0.5
-        self.summary['variation'] = self.variation()
-        self.summary['range'] = self.range()
-        self.summary['median'] = nrpy.mdian1(self.data)
+        '''
+        Calculates all summary statistics - in a single pass over the data 
+        (using StreamingSummary), except median.
+        '''
+        for key in ('aMean', 'variance', 'median'):
+            self.summary[key]
     
     
 class SampleDistribution(Distribution):
@@ -167,7 +841,9 @@ class SampleDistribution(Distribution):
         
 class TwoSample(object):
     '''
-    Class to hold a two samples, and provides calculations on the samples
+    Class to hold a two samples, and provides calculations on the samples.
+    As each sample is a SingleSample, statistics of each sample are only 
+    calculated when needed.
     '''
     sample = {}
     sample_name = []
@@ -175,6 +851,7 @@ class TwoSample(object):
         if name1 == '': name1 = 'Sample 1'
         if name2 == '': name2 = 'Sample 2'
         self.sample_name = [name1, name2]
+        self.sample = {}
         self.sample[name1] = SingleSample(list(data1), name1)
         self.sample[name2] = SingleSample(list(data2), name2)
 
@@ -199,9 +876,8 @@ class TwoSample(object):
         if X.rowcount == Y.rowcount: slen = X.rowcount
         elif X.rowcount > Y.rowcount: slen = Y.rowcount
         else: slen = X.rowcount
-        xy = SingleSample([X.data[i] * Y.data[i] for i in range(slen)], 
-                          'temporary')
-        mean_xy = xy.arithmeticMean()
+        mean_xy = sum([x * y for (x, y) in zip(X.data, Y.data)]) / \
+                  float(slen)
         mean_x = X.arithmeticMean()
         mean_y = Y.arithmeticMean()
         return mean_xy - (mean_x * mean_y)
@@ -271,11 +947,13 @@ class TwoSample(object):
         if X.rowcount == Y.rowcount: slen = X.rowcount
         elif X.rowcount > Y.rowcount: slen = Y.rowcount
         else: slen = X.rowcount
-        sum_x = sum([X.data[i] for i in range(slen)])
-        sum_x2 = sum([X.data[i] ** 2 for i in range(slen)])
-        sum_y = sum([Y.data[i] for i in range(slen)])
-        sum_y2 = sum([Y.data[i] ** 2 for i in range(slen)])
-        sum_xy = sum([X.data[i] * Y.data[i] for i in range(slen)])
+        sum_x = sum_x2 = sum_y = sum_y2 = sum_xy = 0
+        for (x, y) in zip(X.data, Y.data):
+            sum_x = sum_x + x
+            sum_x2 = sum_x2 + x * x
+            sum_y = sum_y + y
+            sum_y2 = sum_y2 + y * y
+            sum_xy = sum_xy + x * y
         numerator = (slen * sum_xy) - (sum_x * sum_y)
         denominator_x = (slen * sum_x2) - (sum_x * sum_x)
         denominator_y = (slen * sum_y2) - (sum_y * sum_y)
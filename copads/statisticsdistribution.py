@@ -100,6 +100,8 @@ class Distribution:
     Square, F, Gamma, Geometric, Poisson, Student's t, and Uniform. The Python
     Papers Source Codes 1:4
     """
+    # number of parameters estimated by fit() - used to calculate AIC
+    fitted_parameters = 0
 
     def __init__(self, **parameters):
         """
@@ -162,6 +164,55 @@ class Distribution:
         """
         raise NotImplementedError
 
+    def fit(cls, data):
+        """
+        Estimates the parameters of the distribution from data by maximum
+        likelihood, and returns the fitted distribution.
+        """
+        raise NotImplementedError
+    fit = classmethod(fit)
+
+    def logLikelihood(self, data):
+        """
+        Gives the log-likelihood of the data under the distribution, which is
+        the sum of the logarithm of PDF of each data value. Distributions may
+        override this with a closed-form expression in terms of sufficient
+        statistics.
+
+        @param data: a 1-dimensional list of numerical data
+        @return: log-likelihood, or -infinity if any data value is
+        impossible under the distribution
+        """
+        try:
+            return math.fsum([math.log(self.PDF(x)) for x in data])
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return float('-inf')
+
+    def goodnessOfFit(self, data):
+        """
+        Calculates goodness-of-fit statistics of the data to the
+        distribution. Kolmogorov-Smirnov and Anderson-Darling statistics are
+        calculated together in one pass over the sorted data.
+
+        @param data: a 1-dimensional list of numerical data
+        @return: dictionary of 'KS' (Kolmogorov-Smirnov D statistic), 'AD'
+        (Anderson-Darling A-squared statistic), 'logLikelihood' and 'AIC'
+        (Akaike information criterion)
+        """
+        n = len(data)
+        ks = 0.0
+        ad = []
+        for (i, x) in enumerate(sorted(data)):
+            cdf = min(max(self.CDF(x), 1.0e-300), 1.0 - 1.0e-16)
+            ks = max(ks, ((i + 1.0) / n) - cdf, cdf - (float(i) / n))
+            ad.append(((2 * i) + 1) * math.log(cdf) +
+                      ((2 * (n - i)) - 1) * math.log(1.0 - cdf))
+        loglikelihood = self.logLikelihood(data)
+        return {'KS': ks,
+                'AD': -n - (math.fsum(ad) / n),
+                'logLikelihood': loglikelihood,
+                'AIC': (2 * self.fitted_parameters) - (2 * loglikelihood)}
+
 # ----------------------------------------------------------
 # Tested Distributions
 # ----------------------------------------------------------
@@ -364,6 +415,7 @@ class CauchyDistribution(Distribution):
     @status: Tested method
     @since: version 0.4
     """
+    fitted_parameters = 2
 
     def __init__(self, location=0.0, scale=1.0):
         """
@@ -434,6 +486,40 @@ class CauchyDistribution(Distribution):
             seed = self.loaction + (self.scale * math.tan(PI * (seed - 0.5)))
             yield seed
 
+    def fit(cls, data):
+        """
+        Estimates location and scale from data by maximum likelihood, using
+        downhill simplex minimization of negative log-likelihood (starting
+        from median and half of interquartile range).
+
+        @param data: a 1-dimensional list of numerical data
+        @return: fitted CauchyDistribution
+
+        @since: version 0.5.1
+        """
+        sdata = sorted(data)
+        n = len(sdata)
+        location = sdata[n // 2]
+        scale = max((sdata[(3 * n) // 4] - sdata[n // 4]) / 2.0, 1.0e-6)
+        def negativeLL(p):
+            return -cls(p[0], math.exp(p[1])).logLikelihood(sdata)
+        (p, value) = nrpy.amoeba(negativeLL, [location, math.log(scale)],
+                                 [scale, 0.5])
+        return cls(p[0], math.exp(p[1]))
+    fit = classmethod(fit)
+
+    def logLikelihood(self, data):
+        """
+        Gives the log-likelihood of the data under the distribution.
+
+        @since: version 0.5.1
+        """
+        location = self.location
+        scale = float(self.scale)
+        return -(len(data) * math.log(PI * scale)) - \
+            math.fsum([math.log(1.0 + ((x - location) / scale) ** 2)
+                       for x in data])
+
 
 class CosineDistribution(Distribution):
     """
@@ -548,6 +634,7 @@ class ExponentialDistribution(Distribution):
     @status: Tested method
     @since: version 0.4
     """
+    fitted_parameters = 2
 
     def __init__(self, location=0.0, scale=1.0):
         """
@@ -629,6 +716,35 @@ class ExponentialDistribution(Distribution):
         """Gives a random number based on the distribution."""
         return random.expovariate(1/self.location)
 
+    def fit(cls, data):
+        """
+        Estimates location and scale from data by maximum likelihood
+        (closed-form) - location is the minimum and scale is the mean
+        distance from the minimum.
+
+        @param data: a 1-dimensional list of numerical data
+        @return: fitted ExponentialDistribution
+
+        @since: version 0.5.1
+        """
+        location = min(data)
+        scale = (math.fsum(data) / len(data)) - location
+        return cls(location, scale)
+    fit = classmethod(fit)
+
+    def logLikelihood(self, data):
+        """
+        Gives the log-likelihood of the data under the distribution,
+        calculated from sufficient statistics (minimum and sum of data).
+
+        @since: version 0.5.1
+        """
+        if min(data) < self.location or self.scale <= 0:
+            return float('-inf')
+        n = len(data)
+        return -(n * math.log(self.scale)) - \
+            ((math.fsum(data) - (n * self.location)) / self.scale)
+
 
 class FDistribution(Distribution):
     """
@@ -703,6 +819,7 @@ class GammaDistribution(Distribution):
     @status: Tested method
     @since: version 0.2
     """
+    fitted_parameters = 2
 
     def __init__(self, location, scale, shape):
         """
@@ -765,6 +882,53 @@ class GammaDistribution(Distribution):
         """Gives the quantile of the mode of the sample."""
         return nrpy.gammp(self.shape, self.shape - 1)
 
+    def fit(cls, data, location=0.0):
+        """
+        Estimates scale and shape from data by maximum likelihood, with a
+        fixed location. As the log-likelihood depends only on the sum of
+        data and sum of logarithm of data, these are calculated once and
+        the shape is found by downhill simplex minimization of the profile
+        negative log-likelihood (where scale = mean / shape).
+
+        @param data: a 1-dimensional list of numerical data
+        @param location: fixed location; default = 0.0
+        @return: fitted GammaDistribution
+
+        @since: version 0.5.1
+        """
+        n = len(data)
+        mean = (math.fsum(data) / n) - location
+        logmean = math.fsum([math.log(x - location) for x in data]) / n
+        def negativeLL(p):
+            shape = math.exp(p[0])
+            return n * (nrpy.gammln(shape) + shape * math.log(mean / shape)
+                        - (shape - 1) * logmean + shape)
+        # approximate maximum likelihood estimate of shape (Minka, 2002)
+        t = math.log(mean) - logmean
+        shape = (3 - t + math.sqrt(((t - 3) ** 2) + (24 * t))) / (12 * t)
+        (p, value) = nrpy.amoeba(negativeLL, [math.log(shape)], [0.1])
+        shape = math.exp(p[0])
+        return GammaDistribution(location, mean / shape, shape)
+    fit = classmethod(fit)
+
+    def logLikelihood(self, data):
+        """
+        Gives the log-likelihood of the data under the distribution,
+        calculated from sufficient statistics (sum of data and sum of
+        logarithm of data).
+
+        @since: version 0.5.1
+        """
+        try:
+            sumlog = math.fsum([math.log(x - self.location) for x in data])
+        except ValueError:
+            return float('-inf')
+        n = len(data)
+        total = math.fsum(data) - (n * self.location)
+        return ((self.shape - 1) * sumlog) - (total / self.scale) - \
+            (n * self.shape * math.log(self.scale)) - \
+            (n * nrpy.gammln(self.shape))
+
 
 def ErlangDistribution(location, scale, shape):
     """
@@ -807,6 +971,7 @@ class ChiSquareDistribution(GammaDistribution):
     @status: Tested method
     @since: version 0.2
     """
+    fitted_parameters = 1
 
     def __init__(self, df=2):
         """
@@ -816,6 +981,27 @@ class ChiSquareDistribution(GammaDistribution):
         @param df: degrees of freedom"""
         GammaDistribution.__init__(self, 0, 2, float(df) / 2.0)
 
+    def fit(cls, data):
+        """
+        Estimates degrees of freedom from data by maximum likelihood, using
+        downhill simplex minimization of negative log-likelihood.
+
+        @param data: a 1-dimensional list of numerical data
+        @return: fitted ChiSquareDistribution
+
+        @since: version 0.5.1
+        """
+        n = len(data)
+        total = math.fsum(data)
+        sumlog = math.fsum([math.log(x) for x in data])
+        def negativeLL(p):
+            shape = math.exp(p[0]) / 2.0
+            return -(((shape - 1) * sumlog) - (total / 2.0) -
+                     (n * shape * math.log(2.0)) - (n * nrpy.gammln(shape)))
+        (p, value) = nrpy.amoeba(negativeLL, [math.log(total / n)], [0.1])
+        return cls(math.exp(p[0]))
+    fit = classmethod(fit)
+
 
 class GeometricDistribution(Distribution):
     """
@@ -829,6 +1015,7 @@ class GeometricDistribution(Distribution):
     @status: Tested method
     @since: version 0.2
     """
+    fitted_parameters = 1
 
     def __init__(self, success=0.5):
         """
@@ -884,6 +1071,35 @@ class GeometricDistribution(Distribution):
         """Gives the variance of the sample."""
         return (1 - self.prob) / (self.prob ** 2)
 
+    def fit(cls, data):
+        """
+        Estimates probability of success from data (number of trials to
+        first success) by maximum likelihood (closed-form).
+
+        @param data: a 1-dimensional list of integers (each at least 1)
+        @return: fitted GeometricDistribution
+
+        @since: version 0.5.1
+        """
+        return cls(len(data) / math.fsum(data))
+    fit = classmethod(fit)
+
+    def logLikelihood(self, data):
+        """
+        Gives the log-likelihood of the data under the distribution,
+        calculated from sufficient statistics (sum of data).
+
+        @since: version 0.5.1
+        """
+        if min(data) < 1:
+            return float('-inf')
+        n = len(data)
+        if self.prob == 1:
+            if max(data) > 1: return float('-inf')
+            return 0.0
+        return (n * math.log(self.prob)) + \
+            ((math.fsum(data) - n) * math.log(1 - self.prob))
+
 
 class HypergeometricDistribution(Distribution):
     """
@@ -1083,9 +1299,18 @@ class NormalDistribution(Distribution):
     @status: Tested method
     @since: version 0.1
     """
-    def __init__(self):
-        self.mean = 0.0
-        self.stdev = 1.0
+    fitted_parameters = 2
+
+    def __init__(self, mean=0.0, stdev=1.0):
+        """
+        Constructor method. The parameters are used to construct the
+        probability distribution.
+
+        @param mean: mean of the distribution; default = 0.0
+        @param stdev: standard deviation of the distribution; default = 1.0
+        """
+        self.mean = float(mean)
+        self.stdev = float(stdev)
 
     def CDF(self, x):
         """
@@ -1093,7 +1318,7 @@ class NormalDistribution(Distribution):
         probability (area under the probability curve) from -infinity or 0 to
         a give x-value on the x-axis where y-axis is the probability.
         """
-        return 1.0 - 0.5 * nrpy.erfcc(x/SQRT2)
+        return 1.0 - 0.5 * nrpy.erfcc((x - self.mean) / (self.stdev * SQRT2))
 
     def PDF(self, x):
         """
@@ -1105,7 +1330,7 @@ class NormalDistribution(Distribution):
         @param x: probability at x
         """
         return (1/(math.sqrt(PI2) * self.stdev)) * \
-            math.exp(-(x ** 2/(2 * self.stdev**2)))
+            math.exp(-((x - self.mean) ** 2/(2 * self.stdev**2)))
 
     def inverseCDF(self, probability, start = -10.0,
                    end = 10.0, error = 10e-8):
@@ -1160,6 +1385,35 @@ class NormalDistribution(Distribution):
         """Gives a random number based on the distribution."""
         return random.gauss(self.mean, self.stdev)
 
+    def fit(cls, data):
+        """
+        Estimates mean and standard deviation from data by maximum
+        likelihood (closed-form).
+
+        @param data: a 1-dimensional list of numerical data
+        @return: fitted NormalDistribution
+
+        @since: version 0.5.1
+        """
+        n = float(len(data))
+        mean = math.fsum(data) / n
+        stdev = math.sqrt(math.fsum([(x - mean) ** 2 for x in data]) / n)
+        return cls(mean, stdev)
+    fit = classmethod(fit)
+
+    def logLikelihood(self, data):
+        """
+        Gives the log-likelihood of the data under the distribution,
+        calculated from sufficient statistics (sum of data and sum of squared
+        deviations from the mean).
+
+        @since: version 0.5.1
+        """
+        n = len(data)
+        ss = math.fsum([(x - self.mean) ** 2 for x in data])
+        return -(0.5 * n * math.log(PI2 * self.stdev * self.stdev)) - \
+            (ss / (2.0 * self.stdev * self.stdev))
+
 
 class PoissonDistribution(Distribution):
     """
@@ -1173,6 +1427,7 @@ class PoissonDistribution(Distribution):
     @status: Tested method
     @since: version 0.2
     """
+    fitted_parameters = 1
 
     def __init__(self, expectation=0.001):
         """
@@ -1225,6 +1480,32 @@ class PoissonDistribution(Distribution):
         """Gives the variance of the sample."""
         return self._mean
 
+    def fit(cls, data):
+        """
+        Estimates expectation from data by maximum likelihood (closed-form),
+        which is the mean of data.
+
+        @param data: a 1-dimensional list of non-negative integers
+        @return: fitted PoissonDistribution
+
+        @since: version 0.5.1
+        """
+        return cls(math.fsum(data) / len(data))
+    fit = classmethod(fit)
+
+    def logLikelihood(self, data):
+        """
+        Gives the log-likelihood of the data under the distribution,
+        calculated from sufficient statistics (sum of data).
+
+        @since: version 0.5.1
+        """
+        if min(data) < 0:
+            return float('-inf')
+        return (math.fsum(data) * math.log(self._mean)) - \
+            (len(data) * self._mean) - \
+            math.fsum([math.lgamma(x + 1) for x in data])
+
 
 class SemicircularDistribution(Distribution):
     """
@@ -1592,6 +1873,7 @@ class UniformDistribution(Distribution):
     @status: Tested method
     @since: version 0.2
     """
+    fitted_parameters = 2
 
     def __init__(self, location, scale):
         """
@@ -1669,6 +1951,32 @@ class UniformDistribution(Distribution):
         """Gives a random number based on the distribution."""
         return random.uniform(lower, upper)
 
+    def fit(cls, data):
+        """
+        Estimates location (lower bound) and scale (upper bound) from data
+        by maximum likelihood (closed-form), which are the minimum and
+        maximum of data.
+
+        @param data: a 1-dimensional list of numerical data
+        @return: fitted UniformDistribution
+
+        @since: version 0.5.1
+        """
+        return cls(min(data), max(data))
+    fit = classmethod(fit)
+
+    def logLikelihood(self, data):
+        """
+        Gives the log-likelihood of the data under the distribution,
+        calculated from sufficient statistics (minimum and maximum).
+
+        @since: version 0.5.1
+        """
+        if min(data) < self.location or max(data) > self.scale or \
+            self.scale <= self.location:
+            return float('-inf')
+        return -len(data) * math.log(self.scale - self.location)
+
 
 class WeiBullDistribution(Distribution):
     """
@@ -1682,6 +1990,8 @@ class WeiBullDistribution(Distribution):
     @status: Tested method
     @since: version 0.4
     """
+    fitted_parameters = 2
+
     def __init__(self, location=1.0, scale=1.0):
         """Constructor method. The parameters are used to construct the
         probability distribution.
@@ -1754,6 +2064,51 @@ class WeiBullDistribution(Distribution):
         """Gives a random number based on the distribution."""
         return random.weibullvariate(self.scale, self.shape)
 
+    def fit(cls, data):
+        """
+        Estimates location (scale parameter, S{lambda}) and scale (shape
+        parameter, k) from data by maximum likelihood, using downhill simplex
+        minimization of the profile negative log-likelihood over shape,
+        where S{lambda} has a closed-form for a given shape.
+
+        @param data: a 1-dimensional list of positive numerical data
+        @return: fitted WeiBullDistribution
+
+        @since: version 0.5.1
+        """
+        n = len(data)
+        logdata = [math.log(x) for x in data]
+        sumlog = math.fsum(logdata)
+        def scaleParameter(k):
+            return (math.fsum([math.exp(k * x) for x in logdata]) / n) ** \
+                (1.0 / k)
+        def negativeLL(p):
+            k = math.exp(p[0])
+            try:
+                lamb = scaleParameter(k)
+            except OverflowError:
+                return float('inf')
+            return -((n * math.log(k)) - (n * k * math.log(lamb)) +
+                     ((k - 1) * sumlog) - n)
+        (p, value) = nrpy.amoeba(negativeLL, [0.0], [0.5])
+        k = math.exp(p[0])
+        return cls(scaleParameter(k), k)
+    fit = classmethod(fit)
+
+    def logLikelihood(self, data):
+        """
+        Gives the log-likelihood of the data under the distribution.
+
+        @since: version 0.5.1
+        """
+        if min(data) <= 0:
+            return float('-inf')
+        lamb = float(self.location)
+        k = float(self.scale)
+        return (len(data) * (math.log(k) - (k * math.log(lamb)))) + \
+            ((k - 1) * math.fsum([math.log(x) for x in data])) - \
+            math.fsum([(x / lamb) ** k for x in data])
+
 
 def FrechetDistribution(**parameters):
     """
@@ -1761,6 +2116,40 @@ def FrechetDistribution(**parameters):
     return WeibullDistribution(**parameters)
 
 
+def fitDistributions(data, candidates=None, criterion='AIC'):
+    """
+    Fits a list of candidate distributions to data by maximum likelihood,
+    and ranks the fitted distributions by goodness-of-fit.
+
+    @param data: a 1-dimensional list of numerical data
+    @param candidates: list of distribution classes with fit method.
+    Default = all tested continuous distributions with fit method (Cauchy,
+    Exponential, Gamma, Normal, Uniform and Weibull)
+    @param criterion: goodness-of-fit statistic to rank by ('AIC', 'KS' or
+    'AD'); smaller is better. Default = 'AIC'
+    @return: list of (fitted distribution, goodness-of-fit dictionary)
+    tuples, in ascending order of criterion. Candidates which cannot be
+    fitted to the data are left out.
+
+    @since: version 0.5.1
+    """
+    if candidates is None:
+        candidates = [CauchyDistribution, ExponentialDistribution,
+                      GammaDistribution, NormalDistribution,
+                      UniformDistribution, WeiBullDistribution]
+    results = []
+    for candidate in candidates:
+        try:
+            distribution = candidate.fit(data)
+            results.append((distribution,
+                            distribution.goodnessOfFit(data)))
+        except (ValueError, ZeroDivisionError, OverflowError,
+                NotImplementedError):
+            pass
+    results.sort(key=lambda result: result[1][criterion])
+    return results
+
+
 # ----------------------------------------------------------
 # Untested Distributions
 # ----------------------------------------------------------
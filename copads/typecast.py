@@ -13,22 +13,65 @@ The type cast functions can be mapped as::
       "dataframe.Series" -> "dataframe.Dataframe" [color="green" label="tc_Series_Dataframe"];
       "dataframe.Series" -> "Dictionary" [color="green" label="tc_Series_Dictionary"];
       "dataframe.Series" -> "List" [color="green" label="tc_Series_List"];
-      "dataframe.Series" -> "matrix.Vector";
+      "dataframe.Series" -> "matrix.Vector" [color="green" label="tc_Series_Vector"];
       "dataframe.Dataframe" -> "dataframe.Series" [color="green" label="tc_Dataframe_Series"];
+      "dataframe.Dataframe" -> "matrix.Vector" [color="green" label="tc_Dataframe_Vector"];
       "dataframe.Dataframe" -> "dataframe.MultiDataframe";
       "dataframe.MultiDataframe" -> "dataframe.Dataframe";
-      "matrix.Vector" -> "List";
-      "matrix.Vector" -> "Dictionary";
-      "List" -> "Dictionary";
+      "matrix.Vector" -> "dataframe.Series" [color="green" label="tc_Vector_Series"];
+      "matrix.Vector" -> "List" [color="green" label="tc_Vector_List"];
+      "matrix.Vector" -> "Dictionary" [color="green" label="tc_Vector_Dictionary"];
+      "List" -> "Dictionary" [color="green" label="tc_List_Dictionary"];
     }
+
+Conversions between dataframe.Series, dataframe.Dataframe and
+matrix.Vector objects copy the data values by default. With share=True,
+the list or array of data values (such as a float column of a data frame)
+is shared between the source and the converted objects where possible
+(copy-on-write: the values are copied before their first change by either
+object), and a CopyWarning is issued where the data values have to be
+copied.
 '''
 
+import warnings
+from array import array
+
 from .dataframe import Series
 from .dataframe import Dataframe
 from .dataframe import MultiDataframe
 from .matrix import Vector
 
 
+class CopyWarning(UserWarning):
+    '''
+    Warning issued when a conversion is asked to share the data values of
+    the source object, but the data values have to be copied.
+    '''
+    pass
+
+def _shareVector(values):
+    '''
+    Private function to generate a matrix.Vector object sharing a list of
+    floats or an array of floats (array('d'), such as the float columns of
+    a data frame); otherwise (such as the integer columns of a data frame,
+    which are converted into floats), the values are copied into a list
+    and a CopyWarning is issued.
+
+    @param values: values for the vector.
+    @type values: list or array.array
+    @return: matrix.Vector object
+    '''
+    if (type(values) is list and all([type(x) is float for x in values])) \
+        or (isinstance(values, array) and values.typecode == 'd'):
+        vector = Vector.__new__(Vector)
+        vector.values = values
+        vector.shared = True
+        return vector
+    warnings.warn('Values are not floats and are copied',
+                  CopyWarning, stacklevel=3)
+    return Vector(values)
+
+
 def tc_Series_Dataframe(source_object):
     '''
     Function to convert from dataframe.Series object to dataframe.Dataframe
@@ -40,7 +83,7 @@ def tc_Series_Dataframe(source_object):
     '''
     return source_object.toDataframe()
 
-def tc_Dataframe_Series(source_object, series_name):
+def tc_Dataframe_Series(source_object, series_name, share=False):
     '''
     Function to convert from dataframe.Dataframe object to dataframe.Series
     object.
@@ -49,9 +92,43 @@ def tc_Dataframe_Series(source_object, series_name):
     @type source_object: dataframe.Series object
     @param series_name: name of series to extract
     @type series_name: string
+    @param share: boolean flag to share the data values with the source
+    object (see Dataframe.toSeries). Default = False
+    @type share: boolean
     @return: dataframe.Series object
     '''
-    return source_object.toSeries(series_name)
+    series = source_object.toSeries(series_name, share)
+    if share and not series.shared and len(series.data) > 0:
+        warnings.warn('Series ' + str(series_name) + ' is copied',
+                      CopyWarning, stacklevel=2)
+    return series
+
+def tc_Dataframe_Vector(source_object, series_name, share=False):
+    '''
+    Function to convert a series within a dataframe.Dataframe object to a
+    matrix.Vector object, in the order of labels of the data frame.
+
+    @param source_object: object to be type casted / converted.
+    @type source_object: dataframe.Dataframe object
+    @param series_name: name of series to extract
+    @type series_name: string
+    @param share: boolean flag to share the data values with the source
+    object, which is only possible if the column is a list of floats or a
+    float column (array('d')). Default = False
+    @type share: boolean
+    @return: matrix.Vector object
+    '''
+    series_name = str(series_name)
+    if share and series_name in source_object.series_names:
+        index = source_object.series_names.index(series_name)
+        vector = _shareVector(source_object.columns[index])
+        if vector.shared:
+            source_object.shared.append(source_object.columns[index])
+        return vector
+    if share:
+        warnings.warn('Series ' + series_name + ' is copied',
+                      CopyWarning, stacklevel=2)
+    return Vector(source_object.toSeries(series_name).data)
 
 def tc_Dataframe_MultiDataframe(source_object):
     '''
@@ -95,7 +172,7 @@ def tc_Series_List(source_object, item='data'):
     if item == 'label':
         return source_object.label
 
-def tc_Series_Vector(source_object, item='data'):
+def tc_Series_Vector(source_object, item='data', share=False):
     '''
     Function to convert from dataframe.Series object to a matrix.Vector
     object.
@@ -105,8 +182,17 @@ def tc_Series_Vector(source_object, item='data'):
     @param item: item type to be converted into a list. Allowable items are
     'data' and 'label'. Default = data.
     @type item: string
+    @param share: boolean flag to share the data values with the source
+    object, which is only possible if the column is a list of floats.
+    Default = False
+    @type share: boolean
     @return: matrix.Vector object.
     '''
+    if item == 'data' and share:
+        vector = _shareVector(source_object.data)
+        if vector.shared:
+            source_object.shared = True
+        return vector
     if item == 'data':
         return Vector(source_object.data)
     if item == 'label':
@@ -133,6 +219,8 @@ def tc_Vector_List(source_object):
     @type source_object: matrix.Vector object
     @return: list.
     '''
+    if type(source_object.values) is not list:
+        return list(source_object.values)
     return source_object.values
 
 def tc_Vector_Dictionary(source_object):
@@ -149,17 +237,29 @@ def tc_Vector_Dictionary(source_object):
         data[index] = values[index]
     return data
 
-def tc_Vector_Series(source_object):
+def tc_Vector_Series(source_object, share=False):
     '''
     Function to convert from matrix.Vector object to a dataframe.Series
-    object.
+    object, where the labels are the indices of the values.
 
     @param source_object: object to be type casted / converted.
     @type source_object: matrix.Vector object
+    @param share: boolean flag to share the values with the source object.
+    Default = False
+    @type share: boolean
     @return: dataframe.Series object.
     '''
     series = Series()
-    series.addData(source_object.values)
+    if not share or type(source_object.values) is not list:
+        if share:
+            warnings.warn('Values are not a list and are copied',
+                          CopyWarning, stacklevel=2)
+        series.addData(list(source_object.values))
+        return series
+    series.data = source_object.values
+    series.label = list(range(len(source_object.values)))
+    series.shared = True
+    source_object.shared = True
     return series
 
 def tc_List_Dictionary(source_object):
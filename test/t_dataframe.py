@@ -1,6 +1,8 @@
 import unittest
+import copy
 import os
 import sys
+import tempfile
 
 sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
 import dataframe as d
@@ -111,6 +113,29 @@ class testSeries(unittest.TestCase):
         self.assertEqual(s.getLabels(11), ['B'])
         self.assertEqual(s.getLabels(50), [None])
         self.assertEqual(s.getLabels(18), ['I', 'K'])
+    def testIndex(self):
+        s = d.Series('new_series')
+        s.addData([10, 11, 12, 11], ['A', 'B', 'C', 'D'])
+        self.assertEqual(s.label_index, {'A': [0], 'B': [1], 
+                                         'C': [2], 'D': [3]})
+        self.assertEqual(s.getLabels(11), ['B', 'D'])
+        s.changeDatum(11, 'A')
+        s.changeLabel('Z', 'C')
+        self.assertEqual(s.getLabels(11), ['A', 'B', 'D'])
+        self.assertEqual(s.getDatum('Z'), 12)
+        self.assertEqual(s.getDatum('C'), None)
+        s.addData([12], ['E'])
+        self.assertEqual(s.value_index[12], [2, 4])
+        
+        
+    def testCast4(self):
+        s = d.Series('new_series')
+        s.addData(['1', '2', 'x', '4'], ['A', 'B', 'C', 'D'])
+        self.assertEqual(s.cast('int', None), ['C'])
+        self.assertEqual(s.data, [1, 2, None, 4])
+        self.assertEqual(s.cast('float', None), ['C'])
+        self.assertEqual(s.data, [1.0, 2.0, None, 4.0])
+        self.assertRaises(d.FunctionParameterValueError, s.cast, 'date', 0)
         
         
 class testDataframe(unittest.TestCase):
@@ -1068,7 +1093,244 @@ class testDataframe(unittest.TestCase):
                                     'H':[17, 27, 37, 47], 
                                     'I':[18, 28, 38, 48], 
                                     'J':[19, 29, 39, 49]})
-        
+    def testColumns(self):
+        df = d.Dataframe('frame1')
+        dataset = {'seriesA': [10, 11, 12],
+                   'seriesB': [2.0, 2.1, 2.2],
+                   'seriesC': ['x', 'y', 'z']}
+        df.addData(dataset, ['A', 'B', 'C'])
+        self.assertEqual(df.columns[0].typecode, 'q')
+        self.assertEqual(df.columns[1].typecode, 'd')
+        self.assertEqual(df.columns[2], ['x', 'y', 'z'])
+        self.assertEqual(df.label_index, {'A': 0, 'B': 1, 'C': 2})
+        df.changeDatum('NA', 'seriesA', 'B')
+        self.assertEqual(df.columns[0], [10, 'NA', 12])
+        self.assertEqual(df.cast('int', 0, 'seriesA'), {'seriesA': ['B']})
+        self.assertEqual(list(df.columns[0]), [10, 0, 12])
+        self.assertEqual(df.columns[0].typecode, 'q')
+        s = d.Series('seriesD')
+        s.addData([40, 41], ['B', 'D'])
+        df.addSeries(s)
+        self.assertEqual(df.data, {'A': [10, 2.0, 'x', None],
+                                   'B': [0, 2.1, 'y', 40],
+                                   'C': [12, 2.2, 'z', None],
+                                   'D': [None, None, None, 41]})
+        df.removeLabel('B')
+        self.assertEqual(df.label_index, {'A': 0, 'C': 1, 'D': 2})
+        self.assertEqual(df.getDatum('seriesD', 'D'), 41)
+    def testDataView(self):
+        df = d.Dataframe('frame1')
+        df.data = {'A': [10, 20], 'B': [11, 21]}
+        df.series_names = ['seriesA', 'seriesB']
+        df.label = ['A', 'B']
+        self.assertEqual(list(df.columns[1]), [20, 21])
+        df.data['C'] = [12, 22]
+        self.assertEqual(df.getDatum('seriesB', 'C'), 22)
+        del df.data['A']
+        self.assertEqual(df.data, {'B': [11, 21], 'C': [12, 22]})
+    def testRowWriteThrough(self):
+        df = d.Dataframe('frame1')
+        df.addData({'seriesA': [10, 11], 'seriesB': [1.5, 2.5]}, ['A', 'B'])
+        df.data['A'][1] = 9.5
+        self.assertEqual(df.getDatum('seriesB', 'A'), 9.5)
+        df.data['B'][:] = ['x', 'y']
+        self.assertEqual(df.data['B'], ['x', 'y'])
+        self.assertEqual(df.getLabels('y'), ['B'])
+        df.changeDatum(12, 'seriesA', 'B')
+        self.assertEqual(df.data['B'][0], 12)
+        self.assertRaises(ValueError, df.data['A'].__setitem__,
+                          slice(None), [1])
+        self.assertRaises(KeyError, df.data.__getitem__, 'C')
+    def testLabelOrder(self):
+        df = d.Dataframe('frame1')
+        df.addData({'seriesA': [10, 11, 12]}, ['B', 'C', 'A'])
+        self.assertTrue(df.label is df.row_labels)
+        df.label.sort()
+        self.assertEqual(df.row_labels, ['A', 'B', 'C'])
+        self.assertEqual(list(df.columns[0]), [12, 10, 11])
+        self.assertEqual(df.label_index, {'A': 0, 'B': 1, 'C': 2})
+        df.label = ['C', 'A', 'B']
+        self.assertEqual(df.toSeries('seriesA').data, [11, 12, 10])
+        df.addData({'seriesA': [13]}, ['D'])
+        self.assertEqual(df.label, ['C', 'A', 'B', 'D'])
+        self.assertRaises(d.FunctionParameterValueError, setattr, df,
+                          'label', ['C', 'A'])
+        self.assertRaises(TypeError, df.label.append, 'E')
+        self.assertRaises(TypeError, df.label.pop)
+        self.assertRaises(TypeError, df.label.__setitem__, 0, 'E')
+        self.assertEqual(df.label_index, {'C': 0, 'A': 1, 'B': 2, 'D': 3})
+        ndf = copy.deepcopy(df)
+        self.assertEqual(ndf.label, ['C', 'A', 'B', 'D'])
+        ndf.label.reverse()
+        self.assertEqual(ndf.label_index, {'D': 0, 'B': 1, 'A': 2, 'C': 3})
+        self.assertEqual(list(ndf.columns[0]), [None, 10, 12, 11])
+        self.assertEqual(list(df.columns[0]), [11, 12, 10, None])
+
+
+    def testValueIndex(self):
+        df = d.Dataframe('frame1')
+        dataset = {'seriesA': [10, 11, 12],
+                   'seriesB': [20, 10, 22]}
+        df.addData(dataset, ['A', 'B', 'C'])
+        self.assertEqual(sorted(df.getSeriesLabels(10)), 
+                         [('seriesA', 'A'), ('seriesB', 'B')])
+        self.assertEqual(df.value_index[10], set([('A', 'seriesA'), 
+                                                  ('B', 'seriesB')]))
+        df.changeDatum(10, 'seriesA', 'C')
+        df.changeLabel('X', 'A')
+        self.assertEqual(df.getLabels(10), ['X', 'B', 'C'])
+        df.removeSeries('seriesB')
+        df.removeLabel('X')
+        self.assertEqual(df.getLabels(10), ['C'])
+        self.assertEqual(df.getSeries(22), [None])
+
+
+    def testSelect(self):
+        df = d.Dataframe('frame1')
+        dataset = {'seriesA': [10, 11, 12, 13, 14],
+                   'seriesB': ['x', 'y', 'x', 'y', 'x']}
+        df.addData(dataset, ['A', 'B', 'C', 'D', 'E'])
+        p = d.Predicate('seriesA', '>', 10) & d.Predicate('seriesB', '=', 'x')
+        selection = df.select(p)
+        self.assertEqual(selection.labels(), ['C', 'E'])
+        self.assertEqual(selection.column('seriesA'), [12, 14])
+        p = d.Predicate('seriesA', '<=', 10) | d.Predicate('seriesA', '=', 13)
+        ndf = df.select(p).toDataframe('newframe')
+        self.assertEqual(ndf.data, {'A': [10, 'x'], 'D': [13, 'y']})
+        self.assertEqual(len(df.select(d.Predicate('seriesC', '=', 1))), 0)
+        self.assertRaises(d.FunctionParameterValueError, 
+                          d.Predicate, 'seriesA', '~', 1)
+
+
+    def testCSV(self):
+        (handle, filepath) = tempfile.mkstemp(suffix='.csv')
+        os.close(handle)
+        f = open(filepath, 'w')
+        f.write(',seriesA,seriesB,seriesC\n')
+        f.write('A,10,1.5,"x, y"\n')
+        f.write('B,11,2.5,z\n')
+        f.write('C,12,,w\n')
+        f.close()
+        df = d.Dataframe('frame1')
+        df.addCSV(filepath, types='infer', chunk_size=2)
+        self.assertEqual(df.series_names, ['seriesA', 'seriesB', 'seriesC'])
+        self.assertEqual(df.label, ['A', 'B', 'C'])
+        self.assertEqual(df.data, {'A': [10, 1.5, 'x, y'],
+                                   'B': [11, 2.5, 'z'],
+                                   'C': [12, None, 'w']})
+        self.assertEqual(df.columns[0].typecode, 'q')
+        df.writeCSV(filepath)
+        ndf = d.Dataframe('frame2')
+        ndf.addCSV(filepath, types={'seriesA': 'int'})
+        self.assertEqual(ndf.data, {'A': [10, '1.5', 'x, y'],
+                                    'B': [11, '2.5', 'z'],
+                                    'C': [12, '', 'w']})
+        s = d.Series('seriesD')
+        s.addData([1, 2], ['B', 'D'])
+        ndf = s.toDataframe()
+        ndf.addCSV(filepath, types=['int', 'float', 'str'], fill_in=0)
+        self.assertEqual(ndf.data, {'B': [1, 11, 2.5, 'z'],
+                                    'D': [2, 0, 0, 0],
+                                    'A': [0, 10, 1.5, 'x, y'],
+                                    'C': [0, 12, 0, 'w']})
+        os.remove(filepath)
+    def testCSVWiden(self):
+        (handle, filepath) = tempfile.mkstemp(suffix='.csv')
+        os.close(handle)
+        f = open(filepath, 'w')
+        f.write(',seriesA,seriesB\n')
+        for row in [('A', '1', '1'), ('B', '2', ''), ('C', '3', '3'),
+                    ('D', '2.5', '4'), ('E', '', 'x'), ('F', '6', '6')]:
+            f.write(','.join(row) + '\n')
+        f.close()
+        df = d.Dataframe('frame1')
+        df.addCSV(filepath, types='infer', chunk_size=3)
+        self.assertEqual(df.toSeries('seriesA').data,
+                         [1.0, 2.0, 3.0, 2.5, None, 6.0])
+        self.assertEqual(df.columns[0], [1.0, 2.0, 3.0, 2.5, None, 6.0])
+        self.assertEqual(df.toSeries('seriesB').data,
+                         ['1', None, '3', '4', 'x', '6'])
+        f = open(filepath, 'w')
+        f.write(',seriesA\n')
+        for row in [('A', '007'), ('B', '1e3'), ('C', ''), ('D', 'x')]:
+            f.write(','.join(row) + '\n')
+        f.close()
+        for chunk_size in (1, 2, 10):
+            df = d.Dataframe('frame1')
+            df.addCSV(filepath, types='infer', chunk_size=chunk_size)
+            self.assertEqual(df.columns[0], ['007', '1e3', None, 'x'])
+        df = d.Dataframe('frame1')
+        self.assertRaises(d.FunctionParameterValueError, df.addCSV,
+                          filepath, types=['int', 'str'])
+        os.remove(filepath)
+
+
+    def testBinary(self):
+        (handle, filepath) = tempfile.mkstemp(suffix='.df')
+        os.close(handle)
+        df = d.Dataframe('frame1')
+        dataset = {'seriesA': [10, 11, 12],
+                   'seriesB': [2.0, 2.5, 3.0],
+                   'seriesC': ['x', None, 'z']}
+        df.addData(dataset, ['A', 'B', 'C'])
+        df.label.sort(reverse=True)
+        for compressed in (False, True):
+            df.writeBinary(filepath, compressed)
+            ndf = d.Dataframe('frame1')
+            ndf.readBinary(filepath)
+            self.assertEqual(ndf.series_names, df.series_names)
+            self.assertEqual(ndf.data, df.data)
+            self.assertEqual(ndf.label, ['C', 'B', 'A'])
+            self.assertEqual(ndf.columns[1].typecode, 'd')
+        ndf = d.Dataframe('frame2')
+        ndf.readBinary(filepath, ['seriesC', 'seriesA'], memory_map=False)
+        self.assertEqual(ndf.series_names, ['seriesA', 'seriesC'])
+        self.assertEqual(ndf.data, {'A': [10, 'x'], 'B': [11, None],
+                                    'C': [12, 'z']})
+        os.remove(filepath)
+
+
+    def testGroupBy(self):
+        df = d.Dataframe('frame1')
+        dataset = {'seriesA': ['x', 'y', 'x', 'y', 'x', 'z'],
+                   'seriesB': [1, 2, 3, 4, 5, None],
+                   'seriesC': [1, 1, 1, 2, 2, 2]}
+        df.addData(dataset, ['A', 'B', 'C', 'D', 'E', 'F'])
+        aggregations = {'seriesB': ['count', 'sum', 'mean', 'max', 'median']}
+        ndf = df.groupBy('seriesA', aggregations, 'newframe')
+        self.assertEqual(ndf.label, ['x', 'y', 'z'])
+        self.assertEqual(ndf.series_names, ['seriesB_count', 'seriesB_sum',
+                                            'seriesB_mean', 'seriesB_max',
+                                            'seriesB_median'])
+        self.assertEqual(ndf.data, {'x': [3, 9.0, 3.0, 5, 3],
+                                    'y': [2, 6.0, 3.0, 4, 3.0],
+                                    'z': [0, None, None, None, None]})
+        self.assertTrue(type(ndf.getDatum('seriesB_max', 'x')) is int)
+        ndf = df.groupBy('seriesC', {'seriesA': ['count', 'min', 'max'],
+                                     'seriesB': ['median', 'q25']})
+        self.assertEqual(ndf.data, {1: [3, 'x', 'y', 2, 1.5],
+                                    2: [3, 'x', 'z', 4.5, 4.25]})
+        ndf = df.groupBy(['seriesA', 'seriesC'], {'seriesB': ['sum']})
+        self.assertEqual(ndf.data, {('x', 1): [4.0], ('y', 1): [2.0],
+                                    ('y', 2): [4.0], ('x', 2): [5.0],
+                                    ('z', 2): [None]})
+        pdf = df.groupBy(['seriesA', 'seriesC'], {'seriesB': ['sum']}, 
+                         processes=2)
+        self.assertEqual(pdf.data, ndf.data)
+        (handle, filepath) = tempfile.mkstemp(suffix='.df')
+        os.close(handle)
+        for compressed in (False, True):
+            ndf.writeBinary(filepath, compressed)
+            rdf = d.Dataframe(ndf.name)
+            rdf.readBinary(filepath)
+            self.assertEqual(rdf.label, ndf.label)
+            self.assertEqual(rdf.label_index[('x', 2)], 
+                             ndf.label_index[('x', 2)])
+            self.assertEqual(rdf.data, ndf.data)
+        os.remove(filepath)
+        self.assertRaises(d.FunctionParameterValueError, df.groupBy, 
+                          'seriesA', {'seriesB': ['mode']})
+
 
 class testMultiDataframe(unittest.TestCase):
     def testAddDataFrame1(self):
@@ -1238,6 +1500,80 @@ class testMultiDataframe(unittest.TestCase):
                           'H':[37, 47], 
                           'I':[38, 48], 
                           'J':[39, 49]})
+    def testBinary(self):
+        (handle, filepath) = tempfile.mkstemp(suffix='.df')
+        os.close(handle)
+        mdf = d.MultiDataframe('multiframe')
+        for name in ('frame1', 'frame2'):
+            df = d.Dataframe(name)
+            df.addData({'seriesA': [10, 11], 'seriesB': [name, name]}, 
+                       ['A', 'B'])
+            mdf.addDataframe(df)
+        mdf.writeBinary(filepath, True)
+        nmdf = d.MultiDataframe('multiframe')
+        nmdf.readBinary(filepath, ['frame2'])
+        self.assertEqual(nmdf.frame_names, ['frame2'])
+        self.assertEqual(nmdf.frames['frame2'].data, 
+                         {'A': [10, 'frame2'], 'B': [11, 'frame2']})
+        nmdf.readBinary(filepath)
+        self.assertEqual(nmdf.frame_names, ['frame2', 'frame1'])
+        os.remove(filepath)
+    def testJoin(self):
+        mdf = d.MultiDataframe('multiframe')
+        df1 = d.Dataframe('frame1')
+        df1.addData({'seriesA': [1, 2, 3], 'seriesB': [10, 20, 30]}, 
+                    ['A', 'B', 'C'])
+        df2 = d.Dataframe('frame2')
+        df2.addData({'seriesB': [2.5, 4.5], 'seriesC': [3, 4]}, ['C', 'D'])
+        mdf.addDataframe(df1)
+        mdf.addDataframe(df2)
+        ndf = mdf.join('frame1', 'frame2')
+        self.assertEqual(ndf.series_names, ['seriesA', 'frame1.seriesB', 
+                                            'frame2.seriesB', 'seriesC'])
+        self.assertEqual(ndf.data, {'C': [3, 30, 2.5, 3]})
+        for method in ('hash', 'merge'):
+            ndf = mdf.join('frame1', 'frame2', 'outer', method=method)
+            self.assertEqual(ndf.data, {'A': [1, 10, None, None],
+                                        'B': [2, 20, None, None],
+                                        'C': [3, 30, 2.5, 3],
+                                        'D': [None, None, 4.5, 4]})
+        ndf = mdf.join('frame1', 'frame2', 'left', ('seriesA', 'seriesC'))
+        self.assertEqual(ndf.label, [('A', None), ('B', None), 
+                                     ('C', 'C')])
+        ndf = mdf.join('frame1', 'frame2', 'right', ('seriesA', 'seriesC'))
+        self.assertEqual(ndf.data, {('C', 'C'): [3, 30, 2.5, 3],
+                                    (None, 'D'): [None, None, 4.5, 4]})
+        self.assertRaises(d.FunctionParameterValueError, mdf.join, 
+                          'frame1', 'frame2', 'cross')
+    def testJoinSelf(self):
+        mdf = d.MultiDataframe('multiframe')
+        df = d.Dataframe('g')
+        df.addData({'a': [1, 2], 'w': [0.5, 1.5]}, ['A', 'B'])
+        mdf.addDataframe(df)
+        ndf = mdf.join('g', 'g')
+        self.assertEqual(ndf.series_names, ['left.a', 'left.w', 
+                                            'right.a', 'right.w'])
+        self.assertEqual(ndf.data['B'], [2, 1.5, 2, 1.5])
+    def testJoinNone(self):
+        mdf = d.MultiDataframe('multiframe')
+        df1 = d.Dataframe('frame1')
+        df1.addData({'seriesA': [None, 1, 2]}, ['A', 'B', 'C'])
+        df2 = d.Dataframe('frame2')
+        df2.addData({'seriesA': [None, 2]}, ['D', 'E'])
+        mdf.addDataframe(df1)
+        mdf.addDataframe(df2)
+        for how in ('inner', 'left', 'right', 'outer'):
+            hdf = mdf.join('frame1', 'frame2', how, 'seriesA', 
+                           method='hash')
+            ndf = mdf.join('frame1', 'frame2', how, 'seriesA', 
+                           method='merge')
+            self.assertEqual(sorted(ndf.label, key=str), 
+                             sorted(hdf.label, key=str))
+            self.assertEqual(ndf.data, hdf.data)
+        self.assertEqual(ndf.data, {('A', None): [None, None],
+                                    ('B', None): [1, None],
+                                    ('C', 'E'): [2, 2],
+                                    (None, 'D'): [None, None]})
                                    
                                    
 if __name__ == "__main__":
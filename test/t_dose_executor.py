@@ -0,0 +1,176 @@
+import unittest
+import sys
+import os
+import random
+import multiprocessing
+import types
+
+sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
+import dose_executor as D
+import ragaraja as N
+
+class Genome(object):
+    def __init__(self, sequence):
+        self.sequence = list(sequence)
+
+class Organism(object):
+    def __init__(self, sequence):
+        self.genome = [Genome(sequence)]
+        self.cytoplasm = [0] * 5
+        self.status = {'location': (0, 0, 0)}
+
+class Population(object):
+    def __init__(self, sequences):
+        self.agents = [Organism(sequence) for sequence in sequences]
+
+class World(object):
+    def __init__(self):
+        self.ecosystem = [[[{'local_input': [1, 2, 3]}]]]
+
+sequences = {'pop1': ['008000008021', '008016017045', '008000008021',
+                      '050050021', '064021'],
+             'pop2': ['008016021', '064021', '008000008021']}
+
+class SimulatedPopulation(Population):
+    history = []
+    def __init__(self):
+        Population.__init__(self, sequences['pop1'] + ['008201008301021'])
+    def generation_step(self):
+        SimulatedPopulation.history.append([organism.cytoplasm
+                                            for organism in self.agents])
+        return ''
+
+class SimulatedWorld(World):
+    world_x = 1
+    world_y = 1
+    world_z = 1
+    history = []
+    def ecoregulate(self):
+        pass
+    def update_ecology(self, x, y, z):
+        pass
+    def update_local(self, x, y, z):
+        self.ecosystem[x][y][z]['local_input'] = [1, 2, 3]
+    def organism_movement(self, x, y, z):
+        pass
+    def organism_location(self, x, y, z):
+        pass
+    def report(self):
+        cell = self.ecosystem[0][0][0]
+        SimulatedWorld.history.append((cell['temporary_output'],
+                                       cell['temporary_input']))
+
+entities = types.ModuleType('dose_simulated_entities')
+entities.Population = SimulatedPopulation
+entities.World = SimulatedWorld
+sys.modules[entities.__name__] = entities
+
+class testExecutionCache(unittest.TestCase):
+    def setUp(self):
+        D.max_cytoplasm_size = 5
+        D.max_codon = 100
+        D.execution_cache = None
+    def tearDown(self):
+        D.execution_cache = None
+    def testDeterministic(self):
+        cache = D.ExecutionCache(10)
+        for source in ('008035', '046064', '047200'):
+            self.assertNotEqual(cache.key(source, [1], [0]), None)
+        for source in ('008050', '060', '201', '399008', '599', '048'):
+            self.assertEqual(cache.key(source, [1], [0]), None)
+        self.assertEqual(cache.skips, 6)
+        cache = D.ExecutionCache(10, ['008'])
+        self.assertEqual(cache.key('000008', [1], [0]), None)
+        self.assertNotEqual(cache.key('050201', [1], [0]), None)
+    def testCounters(self):
+        cache = D.ExecutionCache(10)
+        self.assertEqual(cache.key('050008', [1], [0]), None)
+        self.assertEqual(cache.skips, 1)
+        key = cache.key('008021', [1], [0])
+        self.assertEqual(key, ('008021', (1,), (0,)))
+        self.assertEqual(cache.get(key), None)
+        cache.put(key, 'results')
+        self.assertEqual(cache.get(key), 'results')
+        self.assertEqual((cache.hits, cache.misses, cache.skips), (1, 1, 1))
+        self.assertEqual(cache.hit_rate(), 0.5)
+    def testEviction(self):
+        cache = D.ExecutionCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(list(cache.results.keys()), ['a', 'c'])
+        self.assertEqual(cache.get('b'), None)
+    def execute(self, processes, cache_size=0):
+        D.population_names = ['pop1', 'pop2']
+        D.clean_cytoplasm = True
+        D.cytoplasm_size = 5
+        D.execution_cache = None
+        if cache_size > 0:
+            D.execution_cache = D.ExecutionCache(cache_size)
+        random.seed(1)
+        populations = dict([(name, Population(sequences[name]))
+                            for name in D.population_names])
+        world = World()
+        instructions = sorted(set([sequence[i:i+3]
+                                   for name in sequences
+                                   for sequence in sequences[name]
+                                   for i in range(0, len(sequence), 3)]))
+        pool = None
+        if processes > 1:
+            pool = multiprocessing.Pool(processes, D._initialize_worker,
+                                        (instructions, 5, 100))
+        try:
+            D._execute_genomes(pool, populations, world, processes)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return ([organism.cytoplasm for name in D.population_names
+                 for organism in populations[name].agents],
+                world.ecosystem[0][0][0], random.random())
+    def testSerial(self):
+        N.register[:] = [5] * 99
+        expected = self.execute(1)
+        self.assertEqual(N.register, [5] * 99)
+        self.assertEqual(self.execute(1, 10), expected)
+        self.assertEqual(D.execution_cache.hits, 3)
+        self.assertEqual(D.execution_cache.misses, 4)
+        self.assertEqual(D.execution_cache.skips, 1)
+        self.assertEqual(expected[0][1], [1, 0, 0, 0, 0])
+        self.assertEqual(expected[1]['local_input'], [1, 2, 3])
+    def testParallel(self):
+        expected = self.execute(2)
+        self.assertEqual(self.execute(2, 10), expected)
+        self.assertEqual(D.execution_cache.hits, 3)
+        self.assertEqual(D.execution_cache.misses, 4)
+        self.assertEqual(D.execution_cache.skips, 1)
+        self.assertEqual(expected[0][1], [1, 0, 0, 0, 0])
+    def testProcesses(self):
+        expected = self.execute(1)
+        self.assertEqual(self.execute(2), expected)
+        self.assertEqual(self.execute(3), expected)
+        self.assertEqual(self.execute(3, 10), expected)
+    def testSimulate(self):
+        D.population_names = ['pop1', 'pop2']
+        D.population_locations = [(0, 0, 0), (0, 0, 0)]
+        D.clean_cytoplasm = False
+        D.maximum_generations = 2
+        D.fossilized_frequency = 100
+        D.print_frequency = 100
+        D.eco_buried_frequency = 100
+        results = []
+        for processes in (1, 2):
+            random.seed(1)
+            SimulatedPopulation.history = []
+            SimulatedWorld.history = []
+            D.simulate('dose_simulated_entities', processes)
+            results.append((SimulatedPopulation.history,
+                            SimulatedWorld.history, random.random()))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(len(results[0][0]), 4)
+        self.assertEqual(results[0][1][0][1], [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
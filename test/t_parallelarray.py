@@ -85,6 +85,45 @@ class testParallelArray(unittest.TestCase):
         arrayA.changeFieldname('F4', 'FOUR')
         self.assertEqual(arrayA.data, {'F1': [1], 'F2': [2], 
                                        'F3': [3], 'FOUR': [4]})
+    def testExtend(self):
+        arrayA = a.ParallelArray(['F1', 'F2'], {'F1': 'q'})
+        arrayA.addDataDictionary({'F2': 'x'})
+        arrayA.extend([{'F1': 1, 'F2': 'y'}, {'F1': 2, 'F3': 3.0}])
+        self.assertEqual(arrayA.fieldnames(), ['F1', 'F2', 'F3'])
+        self.assertEqual(list(arrayA.data['F1']), [0, 1, 2])
+        self.assertEqual(arrayA.data['F2'], ['x', 'y', None])
+        self.assertEqual(arrayA.data['F3'], [None, None, 3.0])
+        view = arrayA.field('F1')
+        view[0] = 5
+        self.assertEqual(arrayA.data['F1'][0], 5)
+    def testFromColumns(self):
+        arrayA = a.ParallelArray.fromColumns({'F1': [1.5, 2.5], 
+                                              'F2': ['a', 'b']}, 
+                                             {'F1': 'd'})
+        self.assertEqual(arrayA.data['F1'].typecode, 'd')
+        self.assertEqual(arrayA.data['F2'], ['a', 'b'])
+        arrayA.addDataList(['F2'], ['c'])
+        self.assertTrue(math.isnan(arrayA.data['F1'][2]))
+        self.assertRaises(a.ParallelArrayError, a.ParallelArray.fromColumns,
+                          {'F1': [1], 'F2': [1, 2]})
+    def testExtendAtomic(self):
+        arrayA = a.ParallelArray(['F1', 'F2'], {'F2': 'q'})
+        arrayA.addDataList(['F1', 'F2'], ['x', 1])
+        self.assertRaises(TypeError, arrayA.addDataDictionary,
+                          {'F1': 'y', 'F2': 'z', 'F3': 3})
+        self.assertRaises(TypeError, arrayA.extend,
+                          [{'F1': 'y', 'F2': 2}, {'F2': 2.5}])
+        self.assertEqual(arrayA.fieldnames(), ['F1', 'F2'])
+        self.assertEqual(arrayA.data['F1'], ['x'])
+        self.assertEqual(list(arrayA.data['F2']), [1])
+        view = arrayA.field('F2')
+        self.assertRaises(BufferError, arrayA.addDataDictionary,
+                          {'F1': 'y', 'F2': 2})
+        self.assertEqual(arrayA.data['F1'], ['x'])
+        view.release()
+        arrayA.addDataDictionary({'F1': 'y', 'F3': 3})
+        self.assertEqual(list(arrayA.data['F2']), [1, 0])
+        self.assertEqual(arrayA.data['F3'], [None, 3])
                                        
         
 if __name__ == '__main__':
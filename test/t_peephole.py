@@ -0,0 +1,49 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
+import register_machine as r
+import lc_bf as L
+import ragaraja as N
+import peephole as p
+
+class testPeephole(unittest.TestCase):
+    def testRun(self):
+        program = r.Program('+++>>-<', L.LCBF, 1, p.optimize)
+        self.assertEqual(list(program.macros.keys()), [0])
+        (array, apointer, inputdata, output,
+            source, spointer) = r.execute(program, [], None, 5)
+        self.assertEqual(array, [3, 0, -1, 0, 0])
+        self.assertEqual(apointer, 1)
+        self.assertEqual(spointer, 7)
+    def testLoop(self):
+        source = '+++++[->++>+++<<]>>.<.'
+        program = r.Program(source, L.LCBF, 1, p.optimize)
+        self.assertTrue(5 in program.macros)
+        result = r.interpret(source, L.LCBF, 1, [], None, 10, 1000,
+                             p.optimize)
+        self.assertEqual(result, r.interpret(source, L.LCBF, 1, [], None,
+                                             10, 1000))
+        self.assertEqual(result[0][:3], [0, 10, 15])
+        self.assertEqual(result[3], [10, 0])
+    def testMaxInstructions(self):
+        source = '++++++++++[->+<]>.'
+        for max_instructions in range(0, 40):
+            self.assertTrue(p.verify(source, L.LCBF, 1, [], None, 10,
+                                     max_instructions)[0])
+    def testFloat(self):
+        (equivalent, reference, optimized) = \
+            p.verify('[->+<]+++', L.LCBF, 1, [], [2.5, 0.1, 0], 3)
+        self.assertTrue(equivalent)
+        self.assertEqual(optimized[0], [2.5, 2.1, 0])
+    def testRagaraja(self):
+        source = '008008008014011000008008004015014020015000020'
+        (equivalent, reference, optimized) = \
+            p.verify(source, N.ragaraja, 3, [], [0]*10, 10)
+        self.assertTrue(equivalent)
+        self.assertEqual(optimized[0][:2], [0, 6])
+        self.assertEqual(optimized[3], [6])
+
+if __name__ == '__main__':
+    unittest.main()
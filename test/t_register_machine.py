@@ -0,0 +1,171 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
+import register_machine as r
+import lc_bf as L
+import ragaraja as N
+
+class testRegisterMachine(unittest.TestCase):
+    def testBracketTable(self):
+        table = r.bracket_table('+[>[-]<]]', '[', ']')
+        self.assertEqual(table, {1: 7, 7: 1, 3: 5, 5: 3})
+        table = r.bracket_table('000014008015015', '014', '015', 3)
+        self.assertEqual(table, {3: 9, 9: 3})
+    def testProgram(self):
+        program = r.Program('++[>+<-]x', L.LCBF)
+        self.assertEqual(len(program.opcodes), 9)
+        self.assertEqual(program.opcodes[0], program.opcodes[1])
+        self.assertEqual(program.handlers[program.opcodes[2]],
+                         L.cbf_start_loop)
+        self.assertEqual(program.opcodes[8], -1)
+        program = r.Program('000008', N.ragaraja, 3)
+        self.assertEqual(program.opcodes[1], -2)
+        self.assertEqual(program.decode(3), program.opcodes[3])
+        self.assertEqual(program.decode(5), -1)
+    def testInterpret(self):
+        (array, apointer, inputdata, output,
+            source, spointer) = r.interpret('+++++[>++++[>+++.<-].<-]',
+                                            L.LCBF)
+        self.assertEqual(array[:3], [0, 0, 60])
+        self.assertEqual(output[:4], [3, 6, 9, 12])
+        self.assertEqual(spointer, 25)
+        (array, apointer, inputdata, output,
+            source, spointer) = r.interpret('>>>>>>++', L.LCBF, 1, [],
+                                            None, 5)
+        self.assertEqual(array, [0, 2, 0, 0, 0])
+        self.assertEqual(apointer, 1)
+    def testUnmatchedLoops(self):
+        (array, apointer, inputdata, output,
+            source, spointer) = r.interpret('+]+.[', L.LCBF, 1, [], None, 3)
+        self.assertEqual(output, [2])
+        self.assertEqual(spointer, 5)
+        (array, apointer, inputdata, output,
+            source, spointer) = r.interpret('[+.', L.LCBF, 1, [], None, 3)
+        self.assertEqual(output, [])
+        self.assertEqual(spointer, 3)
+    def testExecute(self):
+        program = r.Program('008008008014000008004011015', N.ragaraja, 3)
+        for i in range(2):
+            (array, apointer, inputdata, output,
+                source, spointer) = r.execute(program, [], [0]*10, 10)
+            self.assertEqual(array[:2], [0, 3])
+            self.assertEqual(spointer, 27)
+    def testInterpretBatch(self):
+        sources = ['+++.', '++[>++<-]>.', '+++.', ',.']
+        results = r.interpret_batch(sources, L.LCBF, 1,
+                                    [[], [], [], [7]], None, 5)
+        self.assertEqual(len(results), 4)
+        for index in range(len(sources)):
+            result = r.interpret(sources[index], L.LCBF, 1,
+                                 [[], [], [], [7]][index], None, 5)
+            self.assertEqual(results[index][:6], result)
+        self.assertEqual([result[3] for result in results],
+                         [[3], [0], [3], [7]])
+        self.assertEqual([result[6] for result in results],
+                         [4, 16, 4, 2])
+        results = r.interpret_batch(['+.', '<<<+'], L.LCBF, 1,
+                                    None, [[0, 0], [0, 0]], 10,
+                                    exceptions=(IndexError,))
+        self.assertEqual(results[0][3], [1])
+        self.assertTrue(isinstance(results[1], IndexError))
+    def testProfile(self):
+        profile = r.Profile()
+        source = '008008008014000008004011015'
+        result = r.interpret(source, N.ragaraja, 3, [], [0]*10, 10, 1000,
+                             None, profile)
+        self.assertEqual(result, r.interpret(source, N.ragaraja, 3, [],
+                                             [0]*10, 10, 1000))
+        self.assertEqual(profile.counts['008'], 6)
+        self.assertEqual(profile.counts['015'], 3)
+        self.assertEqual(profile.calls['loop_end'], 3)
+        self.assertEqual(profile.hot_loops(),
+                         [(9, 24, 2, '014000008004011')])
+        report = profile.report().split('\n')
+        self.assertEqual(report[0], 'Instruction\tCount')
+        self.assertEqual(report[1], '008\t6')
+        self.assertTrue('9\t24\t2\t014000008004011' in report)
+    def testActivateVersion(self):
+        functions = dict(N.ragaraja)
+        try:
+            N.activate_version(0, ['008', '011', '014', '015', '032',
+                                   '201', '301'])
+            self.assertEqual(N.ragaraja['009'], N.not_used)
+            self.assertEqual(N.ragaraja['014'], N.loop_start)
+            self.assertNotEqual(N.ragaraja['032'], N.accumulations)
+            self.assertEqual(N.ragaraja['032'].__name__, 'accumulations')
+            self.assertNotEqual(N.ragaraja['201'], N.ragaraja['301'])
+            self.assertEqual(r.in_place(N.ragaraja['201']),
+                             N._register_IO_operations['201'])
+            self.assertNotEqual(r.in_place(N.mathematics), None)
+            source = '008008032014201011015301'
+            result = r.interpret(source, N.ragaraja, 3, [], [0]*10, 10)
+            self.assertEqual(result, r.interpret(source, functions, 3, [],
+                                                 [0]*10, 10))
+            self.assertEqual(result[0][0], 1)
+        finally:
+            N.ragaraja.update(functions)
+    def testInPlace(self):
+        state = r.State([0, 5, 0], 1, [], [], '+.', 1)
+        r.in_place(L.call_out)(state)
+        self.assertEqual(state.output, [5])
+        r.in_place(L.forward)(state)
+        self.assertEqual(state.results(), ([0, 5, 0], 2, [], [5], '+.', 1))
+        self.assertEqual(r.in_place(N.nBF_random_op), None)
+        self.assertEqual(r.in_place(lambda *results: results), None)
+        state = r.State([0, 0, 0], 0, [], [], '[-]+', 0)
+        r.in_place(L.cbf_start_loop)(state)
+        self.assertEqual(state.spointer, 2)
+        program = r.Program('+[>+<-]', L.LCBF)
+        self.assertEqual(len(program.in_place), len(program.handlers))
+        self.assertTrue(None not in program.in_place)
+    def testTape(self):
+        array = r.tape(5)
+        self.assertEqual(array.typecode, 'd')
+        (array, apointer, inputdata, output,
+            source, spointer) = r.interpret('+++[>++<-]>>.', L.LCBF, 1, [],
+                                            array, 5)
+        self.assertEqual(list(array), [0.0, 6.0, 0.0, 0.0, 0.0])
+        self.assertEqual(output, [6.0])
+        (array, apointer, inputdata, output,
+            source, spointer) = r.interpret('008016017018', N.ragaraja, 3,
+                                            [], r.tape(5), 5)
+        self.assertEqual(array.typecode, 'd')
+        self.assertEqual(len(array), 15)
+        cells = [0] * 5
+        self.assertRaises(IndexError, r.interpret, '016017045', N.ragaraja,
+                          3, [], cells, 30)
+        self.assertEqual(cells, [0] * 5)
+    def testSourceFilter(self):
+        self.assertEqual(N.source_filter('000001999008', N.nBF_instructions),
+                         '000008')
+        self.assertEqual(N.source_filter(['000999', '999', '000999'],
+                                         N.nBF_instructions),
+                         ['000', '', '000'])
+        self.assertEqual(N.nBF_to_Ragaraja('GCAT.RxN'),
+                         '000004008011020050...060')
+        self.assertEqual(N.nBF_to_Ragaraja(['GA', '', u'G\u00e9']),
+                         ['000008', '', '000...'])
+    def testTrace(self):
+        source = '008008008008008008008008008008014000008008004011015000020'
+        program = r.Program(source, N.ragaraja, 3)
+        result = r.execute(program, [], [0]*10, 10)
+        self.assertEqual(list(program.traces.keys()), [(33, 48)])
+        self.assertEqual(result[0][:2], [0, 20])
+        self.assertEqual(result[3], [20])
+        threshold = r.trace_threshold
+        try:
+            for max_instructions in range(0, 80):
+                r.trace_threshold = 1
+                traced = r.interpret(source, N.ragaraja, 3, [], [0]*10, 10,
+                                     max_instructions)
+                r.trace_threshold = 1000
+                self.assertEqual(traced, r.interpret(source, N.ragaraja, 3,
+                                                     [], [0]*10, 10,
+                                                     max_instructions))
+        finally:
+            r.trace_threshold = threshold
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
+import resampling as R
+
+data1 = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+data2 = [11, 12, 13, 14, 15, 16, 17, 18, 19, 20]
+
+def maximum(data): return max(data)
+
+class testBootstrap(unittest.TestCase):
+    def testMean(self):
+        result = R.bootstrap(data1, 'aMean', replicates=500, seed=1)
+        self.assertEqual(len(result['replicates']), 500)
+        self.assertAlmostEqual(result['statistic'], 5.5, places=4)
+        self.assertTrue(result['lower'] < 5.5 < result['upper'])
+        self.assertTrue(0.5 < result['stderr'] < 1.5)
+    def testFunction(self):
+        result = R.bootstrap(data1, maximum, replicates=200, seed=1)
+        self.assertEqual(result['statistic'], 10)
+        self.assertTrue(result['upper'] <= 10)
+    def testSeed(self):
+        result1 = R.bootstrap(data1, 'median', replicates=300, seed=7)
+        result2 = R.bootstrap(data1, 'median', replicates=300, seed=7, 
+                              processes=2)
+        self.assertEqual(result1['replicates'], result2['replicates'])
+    def testEarlyStop(self):
+        result = R.bootstrap(data1, 'aMean', replicates=10000, seed=1,
+                             tolerance=0.05)
+        self.assertTrue(len(result['replicates']) < 10000)
+    def testEarlyStopProcesses(self):
+        result1 = R.bootstrap(data1, 'aMean', replicates=10000, seed=3,
+                              batch_size=50, tolerance=0.05)
+        result2 = R.bootstrap(data1, 'aMean', replicates=10000, seed=3,
+                              batch_size=50, tolerance=0.05, processes=2)
+        self.assertTrue(len(result1['replicates']) < 10000)
+        self.assertEqual(result1['replicates'], result2['replicates'])
+        self.assertEqual(result1['lower'], result2['lower'])
+    def testReplicates(self):
+        self.assertRaises(R.FunctionParameterValueError, R.bootstrap,
+                          data1, replicates=0)
+        self.assertRaises(R.FunctionParameterValueError, R.bootstrap,
+                          data1, batch_size=0)
+
+class testPermutation(unittest.TestCase):
+    def testDifferent(self):
+        result = R.permutationTest(data1, data2, permutations=500, seed=1)
+        self.assertAlmostEqual(result['statistic'], -10.0, places=4)
+        self.assertTrue(result['pvalue'] < 0.01)
+        self.assertEqual(result['permutations'], 500)
+    def testSame(self):
+        result = R.permutationTest(data1, data1[::-1], permutations=500, 
+                                   seed=1)
+        self.assertTrue(result['pvalue'] > 0.9)
+    def testAlternative(self):
+        result = R.permutationTest(data1, data2, permutations=500, seed=1,
+                                   alternative='greater')
+        self.assertTrue(result['pvalue'] > 0.99)
+    def testEarlyStopProcesses(self):
+        result1 = R.permutationTest(data1, data2, permutations=5000, seed=1,
+                                    batch_size=50, tolerance=0.05)
+        result2 = R.permutationTest(data1, data2, permutations=5000, seed=1,
+                                    batch_size=50, tolerance=0.05,
+                                    processes=3)
+        self.assertTrue(result1['permutations'] < 5000)
+        self.assertEqual(result1, result2)
+    def testPermutations(self):
+        self.assertRaises(R.FunctionParameterValueError, R.permutationTest,
+                          data1, data2, permutations=0)
+        self.assertRaises(R.FunctionParameterValueError, R.permutationTest,
+                          data1, data2, batch_size=-1)
+    
+if __name__ == '__main__':
+    unittest.main()
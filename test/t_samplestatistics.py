@@ -38,6 +38,119 @@ class testSingleSample(unittest.TestCase):
         self.assertAlmostEqual(self.data.summary['variance'], 2.50000, places=4)
     def testRange(self):
         self.assertAlmostEqual(self.data.summary['range'], 4.00000, places=4)    
+    def testLazy(self):
+        sample = S.SingleSample([5, 3, 1, 4, 2], name1)
+        self.assertEqual(dict.__len__(sample.summary), 0)
+        self.assertAlmostEqual(sample.variance(), 2.50000, places=4)
+        self.assertTrue(dict.__contains__(sample.summary, 'skew'))
+        self.assertFalse(dict.__contains__(sample.summary, 'median'))
+        self.assertAlmostEqual(sample.range(), 4.00000, places=4)
+        self.assertEqual(sample.data, [5, 3, 1, 4, 2])
+    def testLazyLookup(self):
+        sample = S.SingleSample([5, 3, 1, 4, 2], name1)
+        self.assertTrue('median' in sample.summary)
+        self.assertAlmostEqual(sample.summary.get('variance'), 2.50000, 
+                               places=4)
+        self.assertEqual(sample.summary.get('mode'), None)
+        self.assertEqual(sorted(sample.summary.keys()), 
+                         sorted(S.LazySummary.statistics))
+        self.assertEqual(len(sample.summary), 10)
+        self.assertEqual(dict(sample.summary)['median'], 3)
+        sample.data.append(15)
+        self.assertEqual(sample.summary.get('median'), 3.5)
+    def testInvalidate(self):
+        sample = S.SingleSample(list(data1), name1)
+        self.assertAlmostEqual(sample.arithmeticMean(), 3.00000, places=4)
+        sample.data = list(data2)
+        self.assertEqual(sample.rowcount, len(data2))
+        self.assertAlmostEqual(sample.arithmeticMean(), 4.00000, places=4)
+        sample.data.append(9)
+        sample.invalidate()
+        self.assertAlmostEqual(sample.arithmeticMean(), 29 / 6.0, places=4)
+    def testInPlaceChange(self):
+        sample = S.SingleSample(data1, name1)
+        self.assertAlmostEqual(sample.variance(), 2.50000, places=4)
+        self.assertAlmostEqual(sample.arithmeticMean(), 3.00000, places=4)
+        sample.data.append(9)
+        self.assertEqual(sample.rowcount, 6)
+        self.assertAlmostEqual(sample.arithmeticMean(), 4.00000, places=4)
+        self.assertAlmostEqual(sample.range(), 8.00000, places=4)
+        sample.data[5] = 3
+        self.assertAlmostEqual(sample.arithmeticMean(), 3.00000, places=4)
+        sample.data += [3]
+        del sample.data[0]
+        self.assertEqual(sample.data, [2, 3, 4, 5, 3, 3])
+        self.assertAlmostEqual(sample.summary['median'], 3.00000, places=4)
+        self.assertEqual(data1, [1, 2, 3, 4, 5])
+    def testMeanOrder(self):
+        data = [0.1, 0.7, 1e8, 0.3, 2.9]
+        first = S.SingleSample(data).arithmeticMean()
+        sample = S.SingleSample(data)
+        sample.variance()
+        self.assertEqual(sample.arithmeticMean(), first)
+    
+class testSelection(unittest.TestCase):
+    def testSelect(self):
+        data = [7, 3, 9, 1, 5, 3, 8, 2, 6, 4] * 3
+        for k in range(len(data)):
+            self.assertEqual(S.select(data, k), sorted(data)[k])
+        self.assertEqual(data[:4], [7, 3, 9, 1])
+    def testMedian(self):
+        self.assertEqual(S.median([5, 1, 3]), 3)
+        self.assertEqual(S.median([4, 1, 3, 2]), 2.5)
+        self.assertEqual(S.median([2, 2, 1, 2]), 2)
+    def testQuantile(self):
+        sample = S.SingleSample([4, 1, 3, 2, 5], name1)
+        self.assertEqual(sample.quantile(0.5), 3)
+        self.assertEqual(sample.quantile(0.25), 2)
+        self.assertAlmostEqual(sample.quantile(0.9), 4.6, places=4)
+
+class testQuantileSketch(unittest.TestCase):
+    def testExact(self):
+        sketch = S.QuantileSketch(seed=1).update(range(101))
+        self.assertEqual(sketch.quantile(0.5), 50)
+        self.assertEqual(sketch.quantile(0), 0)
+        self.assertEqual(sketch.quantile(1), 100)
+        self.assertEqual(sketch.rank(9), 10)
+    def testApproximate(self):
+        data = [(i * 7919) % 10000 for i in range(10000)]
+        sketch = S.QuantileSketch(k=100, seed=1).update(data)
+        self.assertTrue(sketch.size < 1000)
+        self.assertTrue(abs(sketch.quantile(0.5) - 5000) < 300)
+        self.assertTrue(abs(sketch.quantile(0.9) - 9000) < 300)
+    def testMerge(self):
+        sketch = S.QuantileSketch(k=100, seed=1).update(range(0, 5000))
+        sketch.merge(S.QuantileSketch(k=100, seed=2).update(range(5000, 10000)))
+        self.assertEqual(sketch.count, 10000)
+        self.assertTrue(abs(sketch.quantile(0.5) - 5000) < 300)
+        self.assertTrue(abs(sketch.cdf(2500) - 0.25) < 0.03)
+    def testStreamingSummary(self):
+        summary = S.StreamingSummary(data1, S.QuantileSketch())
+        self.assertEqual(summary.summary()['median'], 3)
+
+class testStreamingSummary(unittest.TestCase):
+    def testSummary(self):
+        summary = S.StreamingSummary(data1).summary()
+        expected = S.SingleSample(data1, name1).summary
+        for key in ['gMean', 'hMean', 'aMean', 'skew', 'kurtosis', 
+                    'variance', 'stdev', 'variation', 'range']:
+            self.assertAlmostEqual(summary[key], expected[key], places=6)
+        self.assertEqual(summary['median'], None)
+    def testMerge(self):
+        data = data1 + [10, 0.5, 7, 3.3]
+        whole = S.StreamingSummary(data)
+        part = S.StreamingSummary(data[:3])
+        part.merge(S.StreamingSummary(data[3:7]))
+        part.merge(S.StreamingSummary(data[7:]))
+        self.assertEqual(part.count, len(data))
+        for key, value in whole.summary().items():
+            if value is not None:
+                self.assertAlmostEqual(part.summary()[key], value, places=6)
+    def testStream(self):
+        summary = S.StreamingSummary(x for x in data2)
+        self.assertAlmostEqual(summary.arithmeticMean(), 4.00000, places=4)
+        self.assertAlmostEqual(summary.variance(), 2.50000, places=4)
+        self.assertAlmostEqual(summary.range(), 4.00000, places=4)
     
 class testTwoSample(unittest.TestCase):
     def setUp(self):
@@ -1,6 +1,7 @@
 import sys
 import os
 import unittest
+import math
 
 sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
 import statisticsdistribution as N
@@ -558,6 +559,54 @@ class testWeibull(unittest.TestCase):
                     scale=2.0).mode()
         self.assertAlmostEqual(p, 1.414213, places=5)
 
+
+class testFit(unittest.TestCase):
+    def setUp(self):
+        self.data = [2.2, 3.1, 1.7, 4.5, 2.9, 3.3, 2.4, 3.8, 2.6, 3.5]
+    def testNormal(self):
+        d = N.NormalDistribution.fit(self.data)
+        self.assertAlmostEqual(d.mean, 3.0, places=5)
+        self.assertAlmostEqual(d.stdev, 0.7810250, places=5)
+    def testExponential(self):
+        d = N.ExponentialDistribution.fit(self.data)
+        self.assertAlmostEqual(d.location, 1.7, places=5)
+        self.assertAlmostEqual(d.scale, 1.3, places=5)
+    def testUniform(self):
+        d = N.UniformDistribution.fit(self.data)
+        self.assertAlmostEqual(d.location, 1.7, places=5)
+        self.assertAlmostEqual(d.scale, 4.5, places=5)
+    def testPoisson(self):
+        d = N.PoissonDistribution.fit([1, 2, 3, 0, 4])
+        self.assertAlmostEqual(d.mean(), 2.0, places=5)
+    def testGamma(self):
+        d = N.GammaDistribution.fit(self.data)
+        self.assertAlmostEqual(d.shape * d.scale, 3.0, places=4)
+        better = d.logLikelihood(self.data)
+        self.assertTrue(better > N.GammaDistribution(0, d.scale * 1.1, 
+                        d.shape / 1.1).logLikelihood(self.data))
+        self.assertTrue(better > N.GammaDistribution(0, d.scale / 1.1, 
+                        d.shape * 1.1).logLikelihood(self.data))
+    def testWeibull(self):
+        d = N.WeiBullDistribution.fit(self.data)
+        better = d.logLikelihood(self.data)
+        for (l, k) in [(1.05, 1.0), (0.95, 1.0), (1.0, 1.05), (1.0, 0.95)]:
+            self.assertTrue(better > N.WeiBullDistribution(d.location * l,
+                            d.scale * k).logLikelihood(self.data))
+    def testLogLikelihood(self):
+        d = N.NormalDistribution(3.0, 0.8)
+        self.assertAlmostEqual(d.logLikelihood(self.data),
+            N.Distribution.logLikelihood(d, self.data), places=6)
+    def testGoodnessOfFit(self):
+        d = N.UniformDistribution(0.0, 10.0)
+        g = d.goodnessOfFit([1.0, 3.0, 5.0, 7.0, 9.0])
+        self.assertAlmostEqual(g['KS'], 0.1, places=6)
+        self.assertAlmostEqual(g['logLikelihood'], -5 * math.log(10), 
+                               places=6)
+    def testFitDistributions(self):
+        result = N.fitDistributions(self.data, criterion='KS')
+        self.assertTrue(len(result) > 3)
+        self.assertTrue(result[0][1]['KS'] <= result[-1][1]['KS'])
+
         
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
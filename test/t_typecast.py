@@ -1,6 +1,7 @@
 import unittest
 import os
 import sys
+import warnings
 
 sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
 from typecast import *
@@ -38,6 +39,58 @@ class testTypecast(unittest.TestCase):
         dict = tc_Series_Dictionary(series)
         self.assertEqual(dict, {'A': 20, 'B': 21, 'C': 22, 
                                 'D': 23, 'E': 24})
+    def testShare(self):
+        df = Dataframe('frame2')
+        df.data = {'A': ['x', 1.5], 'B': ['y', 2.5], 'C': ['z', 3.5]}
+        df.series_names = ['seriesA', 'seriesB']
+        df.label = ['A', 'B', 'C']
+        series = tc_Dataframe_Series(df, 'seriesA', True)
+        self.assertTrue(series.shared)
+        self.assertEqual(series.data, ['x', 'y', 'z'])
+        series.changeDatum('w', 'A')
+        self.assertEqual(df.getDatum('seriesA', 'A'), 'x')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            vector = tc_Dataframe_Vector(df, 'seriesB', True)
+        self.assertEqual(len(caught), 0)
+        self.assertTrue(vector.shared)
+        self.assertTrue(vector.values is df.columns[1])
+        self.assertEqual(tc_Vector_List(vector), [1.5, 2.5, 3.5])
+        self.assertTrue(type(tc_Vector_List(vector)) is list)
+        df.changeDatum(4.5, 'seriesB', 'A')
+        self.assertEqual(df.getDatum('seriesB', 'A'), 4.5)
+        self.assertEqual(vector[0], 1.5)
+        vector[1] = 0.5
+        self.assertEqual(df.getDatum('seriesB', 'B'), 2.5)
+        self.assertEqual(vector.values, [1.5, 0.5, 3.5])
+        vector = tc_Dataframe_Vector(df, 'seriesB', True)
+        vector[2] = 0.5
+        self.assertEqual(df.getDatum('seriesB', 'C'), 3.5)
+        df.data = {'A': [1], 'B': [2]}
+        df.series_names = ['seriesD']
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            copied = tc_Dataframe_Vector(df, 'seriesD', True)
+        self.assertTrue(issubclass(caught[0].category, CopyWarning))
+        self.assertFalse(copied.shared)
+        self.assertEqual(copied.values, [1.0, 2.0])
+        series = tc_Vector_Series(vector, True)
+        self.assertTrue(series.data is vector.values)
+        self.assertEqual(series.label, [0, 1, 2])
+    def testShareCopy(self):
+        series = self.testDataframe_Series()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            vector = tc_Series_Vector(series, 'data', True)
+        self.assertEqual(len(caught), 1)
+        self.assertTrue(issubclass(caught[0].category, CopyWarning))
+        self.assertFalse(vector.shared)
+        self.assertEqual(vector.values, [20.0, 21.0, 22.0, 23.0, 24.0])
+        series = Series('seriesF')
+        series.addData([1.5, 2.5], ['A', 'B'])
+        vector = tc_Series_Vector(series, 'data', True)
+        self.assertTrue(vector.shared)
+        self.assertTrue(vector.values is series.data)
     
     
 if __name__ == '__main__':